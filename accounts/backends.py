@@ -1,7 +1,8 @@
 # accounts/backends.py
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.db.models import Case, Q, Value, When
+from django.db.models.functions import Upper
 
 User = get_user_model()
 
@@ -9,23 +10,44 @@ User = get_user_model()
 class EmailBackend(ModelBackend):
     """
     Custom authentication backend that allows login with email or username.
+
+    The user is looked up in one query: emails case-insensitively through
+    the UPPER(email) index (accounts.User.Meta.indexes), usernames exactly
+    through their unique index. Identifiers without an "@" cannot be an
+    email, so only the username is checked for them.
     """
     def authenticate(self, request, username=None, password=None, **kwargs):
         # Allow authentication with either username or email
         if username is None:
             username = kwargs.get('email')
-            
+
         if username is None:
             return None
-            
-        try:
-            # Check if username is an email or username
-            user = User.objects.get(Q(username=username) | Q(email=username))
-        except User.DoesNotExist:
+
+        user = self.get_user_by_identifier(username)
+        if user is None:
+            # Run the password hasher anyway so unknown accounts take as long
+            # to reject as wrong passwords and can't be told apart by timing
+            User().set_password(password)
             return None
-        except User.MultipleObjectsReturned:
-            user = User.objects.filter(email=username).order_by('id').first()
-            
+
         if user.check_password(password) and self.user_can_authenticate(user):
             return user
-        return None
\ No newline at end of file
+        return None
+
+    def get_user_by_identifier(self, identifier):
+        """The user whose email or username is ``identifier``, or None."""
+        if '@' not in identifier:
+            return User.objects.filter(username=identifier).first()
+
+        # Usernames may contain "@" too; an email match wins, the exact one first
+        email = Upper(Value(identifier))
+        return (
+            User.objects.alias(email_upper=Upper('email'))
+            .filter(Q(email_upper=email) | Q(username=identifier))
+            .order_by(
+                Case(When(email=identifier, then=0), When(email_upper=email, then=1), default=2),
+                'pk',
+            )
+            .first()
+        )
@@ -0,0 +1,113 @@
+# accounts/management/commands/benchmark_login.py
+import statistics
+import time
+import uuid
+
+from django.contrib.auth import authenticate, get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from accounts.backends import EmailBackend
+
+User = get_user_model()
+
+PASSWORD = 'Bench-Password-123'
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed N users inside a transaction, then report queries and latency per '
+        'login attempt (email, username, wrong password, unknown account). '
+        'Everything is rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=10000, help='Number of users to seed')
+        parser.add_argument('--repeat', type=int, default=20, help='Timed attempts per scenario')
+        parser.add_argument('--plans', action='store_true', help='Print EXPLAIN output for the user lookups')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user = self._seed(options['users'])
+            self._analyze()
+            results = self._run(self._scenarios(user), options['repeat'])
+            if options['plans']:
+                self._plans(user)
+            self._report(results)
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete; seeded users were rolled back.'))
+
+    def _seed(self, users):
+        self.stdout.write(f'Seeding {users} users...')
+        tag = uuid.uuid4().hex[:8]
+        # One real password hash shared by every row; hashing N passwords would dominate the run
+        template = User()
+        template.set_password(PASSWORD)
+        User.objects.bulk_create(
+            [
+                User(username=f'bench-{tag}-{i}', email=f'bench-{tag}-{i}@example.com', password=template.password)
+                for i in range(users)
+            ],
+            batch_size=1000,
+        )
+        return User.objects.get(username=f'bench-{tag}-{users // 2}')
+
+    def _scenarios(self, user):
+        return {
+            'email': (user.email, PASSWORD),
+            'email (other case)': (user.email.upper(), PASSWORD),
+            'username': (user.username, PASSWORD),
+            'wrong password': (user.email, 'not-the-password'),
+            'unknown email': (f'missing-{uuid.uuid4().hex[:8]}@example.com', PASSWORD),
+            'unknown username': (f'missing-{uuid.uuid4().hex[:8]}', PASSWORD),
+        }
+
+    def _run(self, scenarios, repeat):
+        self.stdout.write(self.style.MIGRATE_HEADING('Per login attempt'))
+        self.stdout.write(f'  {"scenario":<20} {"result":>8} {"queries":>8} {"median ms":>10} {"p95 ms":>10}')
+        results = {}
+        for label, (identifier, password) in scenarios.items():
+            samples = []
+            for _ in range(repeat):
+                with CaptureQueriesContext(connection) as queries:
+                    start = time.perf_counter()
+                    user = authenticate(None, username=identifier, password=password)
+                    samples.append((time.perf_counter() - start) * 1000)
+            samples.sort()
+            results[label] = statistics.median(samples)
+            p95 = samples[min(int(len(samples) * 0.95), len(samples) - 1)]
+            result = 'ok' if user is not None else 'denied'
+            self.stdout.write(
+                f'  {label:<20} {result:>8} {len(queries.captured_queries):8d} {results[label]:10.3f} {p95:10.3f}'
+            )
+        return results
+
+    def _plans(self, user):
+        backend = EmailBackend()
+        self.stdout.write(self.style.MIGRATE_HEADING('Query plans'))
+        for identifier in (user.email, user.username):
+            # Capture the lookup's SQL, then EXPLAIN it as sent
+            with CaptureQueriesContext(connection) as queries:
+                backend.get_user_by_identifier(identifier)
+            sql = queries.captured_queries[-1]['sql']
+            self.stdout.write(f'  {identifier}')
+            with connection.cursor() as cursor:
+                prefix = 'EXPLAIN QUERY PLAN' if connection.vendor == 'sqlite' else 'EXPLAIN'
+                cursor.execute(f'{prefix} {sql}')
+                for row in cursor.fetchall():
+                    self.stdout.write(f'      {row[-1]}')
+
+    def _analyze(self):
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(f'ANALYZE {connection.ops.quote_name(User._meta.db_table)}')
+            elif connection.vendor == 'sqlite':
+                cursor.execute('ANALYZE')
+
+    def _report(self, results):
+        # Unknown accounts should cost about as much as wrong passwords (dummy hash)
+        gap = results['unknown email'] - results['wrong password']
+        self.stdout.write(self.style.MIGRATE_HEADING('Timing gap'))
+        self.stdout.write(f'  unknown email vs wrong password: {gap:+.3f} ms')
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
@@ -21,6 +22,12 @@ class User(AbstractUser):
     department = models.CharField(max_length=255, blank=True)
     email_verified_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Login matches emails case-insensitively (accounts/backends.py)
+            models.Index(Upper('email'), name='user_email_upper_idx'),
+        ]
+
     def is_email_verified(self) -> bool:
         return self.email_verified_at is not None
 
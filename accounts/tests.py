@@ -1,3 +1,52 @@
+# accounts/tests.py
+from unittest import mock
+
+from django.contrib.auth import authenticate, get_user_model
 from django.test import TestCase
+from django.urls import reverse
+
+User = get_user_model()
+
+PASSWORD = 'Correct-Horse-123'
+
+
+class EmailBackendTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='ada', email='Ada@Example.com', password=PASSWORD)
+
+    def login(self, identifier, password=PASSWORD):
+        # One user lookup per attempt, whatever the outcome
+        with self.assertNumQueries(1):
+            return authenticate(None, username=identifier, password=password)
+
+    def test_email(self):
+        self.assertEqual(self.login('Ada@Example.com'), self.user)
+
+    def test_email_in_another_case(self):
+        self.assertEqual(self.login('ada@example.COM'), self.user)
+
+    def test_username(self):
+        self.assertEqual(self.login('ada'), self.user)
+
+    def test_wrong_password(self):
+        self.assertIsNone(self.login('ada@example.com', 'not-the-password'))
+
+    def test_unknown_account_still_hashes(self):
+        with mock.patch.object(User, 'set_password') as set_password:
+            self.assertIsNone(self.login('nobody@example.com'))
+            self.assertIsNone(self.login('nobody'))
+        self.assertEqual(set_password.call_count, 2)
+
+    def test_email_wins_over_username_with_at_sign(self):
+        # Created first, so it would win on primary key alone
+        User.objects.create_user(username='grace@example.com', email='someone@example.com', password=PASSWORD)
+        grace = User.objects.create_user(username='grace', email='Grace@Example.com', password=PASSWORD)
+        self.assertEqual(self.login('grace@example.com'), grace)
 
-# Create your tests here.
+    def test_login_page_does_not_reveal_registered_emails(self):
+        url = reverse('login-page')
+        unknown = self.client.post(url, {'email': 'nobody@example.com', 'password': PASSWORD})
+        wrong = self.client.post(url, {'email': 'ada@example.com', 'password': 'not-the-password'})
+        self.assertContains(unknown, 'Invalid email or password')
+        self.assertContains(wrong, 'Invalid email or password')
@@ -17,3 +17,8 @@ dotenv.load_dotenv()
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
 application = get_asgi_application()
+
+# Periodic background jobs of serving processes (projects/scheduler.py)
+from projects import scheduler  # noqa: E402
+
+scheduler.start()
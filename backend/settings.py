@@ -115,6 +115,87 @@ else:
         }
     }
 
+# -------------------------------------------------------------------
+# CACHE CONFIGURATION
+# -------------------------------------------------------------------
+# Redis in production (set REDIS_URL); per-process local memory for dev/tests
+REDIS_URL = os.environ.get('REDIS_URL') or config('REDIS_URL', default='')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'projecthub',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'projecthub',
+        }
+    }
+
+# Seconds a cached catalog read (listing/detail) may be served. Writes to
+# projects, departments or categories invalidate immediately regardless.
+CATALOG_CACHE_TIMEOUT = config('CATALOG_CACHE_TIMEOUT', default=300, cast=int)
+
+# Seconds a user's cached set of purchased projects is kept (projects/entitlements.py).
+# Purchase changes invalidate it immediately, but only across processes through
+# Redis; with the per-process local cache, keep entries short-lived.
+ENTITLEMENT_CACHE_TIMEOUT = config(
+    'ENTITLEMENT_CACHE_TIMEOUT', default=24 * 60 * 60 if REDIS_URL else 60, cast=int
+)
+
+# Packed, memory-mapped snapshot of the topic generator corpus (built from
+# the Topic table on first use) and how often workers check it for edits.
+TOPIC_SNAPSHOT_PATH = config('TOPIC_SNAPSHOT_PATH', default=str(BASE_DIR / 'var' / 'topics.snapshot'))
+TOPIC_SNAPSHOT_CHECK_INTERVAL = config('TOPIC_SNAPSHOT_CHECK_INTERVAL', default=5, cast=int)
+
+# Seconds between runs of the background jobs that flush counters, page views,
+# download audit records and queued payments, roll up stats and purge expired
+# uploads (projects/scheduler.py). 0 disables the thread; run
+# `manage.py run_background_jobs` from cron instead.
+BACKGROUND_JOBS_INTERVAL = config('BACKGROUND_JOBS_INTERVAL', default=10, cast=int)
+
+# A visitor's repeat views of the same project within this many seconds count once
+VIEW_DEDUP_WINDOW = config('VIEW_DEDUP_WINDOW', default=30 * 60, cast=int)
+
+# Seconds between incremental admin stats rollups (projects/stats.py), run by
+# one worker at a time as a background job; 0 leaves it to `manage.py rollup_stats`.
+STATS_ROLLUP_INTERVAL = config('STATS_ROLLUP_INTERVAL', default=60, cast=int)
+
+# Threads per process extracting metadata from uploaded documents and
+# assembling chunked uploads (projects/documents.py); 0 leaves metadata to
+# `manage.py process_documents` and assembles uploads in the request.
+DOCUMENT_WORKERS = config('DOCUMENT_WORKERS', default=2, cast=int)
+
+# Pages of each document shown as preview thumbnails (projects/previews.py)
+PREVIEW_PAGES = config('PREVIEW_PAGES', default=2, cast=int)
+
+# Chunked, resumable uploads of project files (projects/uploads.py): parts
+# are kept under CHUNKED_UPLOAD_ROOT until the upload completes or expires.
+CHUNKED_UPLOAD_ROOT = config('CHUNKED_UPLOAD_ROOT', default=str(BASE_DIR / 'var' / 'uploads'))
+UPLOAD_CHUNK_SIZE = config('UPLOAD_CHUNK_SIZE', default=8 * 1024 * 1024, cast=int)
+UPLOAD_MAX_SIZE = config('UPLOAD_MAX_SIZE', default=2 * 1024 * 1024 * 1024, cast=int)
+# Seconds an unfinished upload can be resumed
+UPLOAD_SESSION_TTL = config('UPLOAD_SESSION_TTL', default=24 * 60 * 60, cast=int)
+
+# Download delivery (projects/delivery.py):
+# DOWNLOAD_OFFLOAD = 'x-accel' lets nginx stream local files from an internal
+# location mapped to MEDIA_ROOT at DOWNLOAD_ACCEL_PREFIX; 'x-sendfile' does the
+# same for Apache/lighttpd. Empty streams from Python (sendfile where possible).
+DOWNLOAD_OFFLOAD = config('DOWNLOAD_OFFLOAD', default='')
+DOWNLOAD_ACCEL_PREFIX = config('DOWNLOAD_ACCEL_PREFIX', default='/protected-media/')
+# Redirect to the storage URL (e.g. a signed S3 URL) for files without a local path
+DOWNLOAD_REMOTE_REDIRECT = config('DOWNLOAD_REMOTE_REDIRECT', default=False, cast=bool)
+# Lifetime in seconds of signed download links
+DOWNLOAD_LINK_TTL = config('DOWNLOAD_LINK_TTL', default=30 * 60, cast=int)
+# False makes download links bearer links: no login (and no database query)
+# is needed to use one, which also lets download managers resume them.
+DOWNLOAD_LINKS_REQUIRE_LOGIN = config('DOWNLOAD_LINKS_REQUIRE_LOGIN', default=True, cast=bool)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -167,9 +248,11 @@ CSRF_TRUSTED_ORIGINS = [
 # Custom user model
 AUTH_USER_MODEL = 'accounts.User'
 
+# EmailBackend extends ModelBackend and already accepts usernames; listing
+# ModelBackend too would repeat the lookup and the password hash on every
+# failed login
 AUTHENTICATION_BACKENDS = [
     'accounts.backends.EmailBackend',
-    'django.contrib.auth.backends.ModelBackend',
 ]
 
 # -------------------------------------------------------------------
@@ -212,7 +295,13 @@ CORS_ALLOW_ALL_ORIGINS = True  # TEMPORARY - CHANGE LATER
 # -------------------------------------------------------------------
 PAYSTACK_SECRET_KEY = config('PAYSTACK_SECRET_KEY', default='')
 PAYSTACK_PUBLIC_KEY = config('PAYSTACK_PUBLIC_KEY', default='')
-PAYSTACK_BASE_URL = 'https://api.paystack.co'
+PAYSTACK_BASE_URL = config('PAYSTACK_BASE_URL', default='https://api.paystack.co')
+# Client timeouts in seconds, retries for failed calls (with backoff) and the
+# size of the per-process keep-alive connection pool (projects/paystack.py)
+PAYSTACK_CONNECT_TIMEOUT = config('PAYSTACK_CONNECT_TIMEOUT', default=3.05, cast=float)
+PAYSTACK_READ_TIMEOUT = config('PAYSTACK_READ_TIMEOUT', default=10, cast=float)
+PAYSTACK_MAX_RETRIES = config('PAYSTACK_MAX_RETRIES', default=2, cast=int)
+PAYSTACK_POOL_SIZE = config('PAYSTACK_POOL_SIZE', default=10, cast=int)
 
 # -------------------------------------------------------------------
 # LOGGING CONFIGURATION - SIMPLIFIED
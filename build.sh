@@ -21,5 +21,9 @@ echo "📂 Populating departments..."
 python manage.py populate_departments
 echo "🌱 Seeding sample projects..."
 python manage.py seed_projects
+echo "💡 Building topic snapshot..."
+python manage.py load_topics --snapshot-only
+echo "📊 Rebuilding admin statistics..."
+python manage.py rollup_stats --rebuild
 
 echo "✅ Build completed!"
@@ -2,6 +2,7 @@
 from django.core.management.base import BaseCommand
 from projects.models import Department
 from projects.constants import FACULTY_DEPARTMENTS
+from projects.departments import invalidate_department_tree
 
 class Command(BaseCommand):
     help = 'Syncs departments from constants to the database'
@@ -23,4 +24,5 @@ class Command(BaseCommand):
                         department.save()
                         self.stdout.write(self.style.WARNING(f'Updated faculty for department: {dept_name} to {faculty}'))
 
+        invalidate_department_tree()
         self.stdout.write(self.style.SUCCESS('Department sync complete.'))
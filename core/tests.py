@@ -1,3 +1,60 @@
-from django.test import TestCase
+# core/tests.py
+import html
+import re
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from projects.models import Department, ProjectMaterial
+
+
+def pagination_link(response, label):
+    """The query string of the Previous/Next link on a catalog page, or None."""
+    match = re.search(rf'<a href="(\?[^"]*)"[^>]*>\s*{label}\s*</a>', response.content.decode())
+    return html.unescape(match.group(1)) if match else None
+
+
+@override_settings(DOCUMENT_WORKERS=0)
+class ProjectListPaginationTests(TestCase):
+    DEPARTMENT = 'Computer Science & Engineering'
+
+    @classmethod
+    def setUpTestData(cls):
+        departments = [Department.objects.create(name=cls.DEPARTMENT), Department.objects.create(name='Physics')]
+        for i in range(40):
+            ProjectMaterial.objects.create(
+                title=f'Project {i}', abstract='Abstract', department=departments[i % 2], year=2024,
+                status=ProjectMaterial.Status.APPROVED, document_file=f'projects/documents/project-{i}.pdf',
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def titles(self, response):
+        return [project.title for project in response.context['projects']]
+
+    def test_cursor_links_keep_encoded_filters(self):
+        url = reverse('project-list-page')
+        response = self.client.get(url, {'department': self.DEPARTMENT})
+        self.assertIsNone(pagination_link(response, 'Previous'))
+        pages = [self.titles(response)]
+
+        while (link := pagination_link(response, 'Next')) is not None:
+            self.assertIn('department=Computer+Science+%26+Engineering', link)
+            response = self.client.get(url + link)
+            pages.append(self.titles(response))
+
+        expected = [f'Project {i}' for i in range(38, -1, -2)]
+        self.assertEqual([len(page) for page in pages], [12, 8])
+        self.assertEqual(sum(pages, []), expected)
+
+        # And back again
+        response = self.client.get(url + pagination_link(response, 'Previous'))
+        self.assertEqual(self.titles(response), pages[0])
+        self.assertIsNone(pagination_link(response, 'Previous'))
+
+    def test_invalid_cursor_shows_the_first_page(self):
+        response = self.client.get(reverse('project-list-page'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.titles(response)[0], 'Project 39')
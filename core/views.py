@@ -2,35 +2,45 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.http import HttpResponseForbidden
-from django.core.paginator import Paginator
+from django.core.paginator import Paginator, Page
 from django.contrib.auth import login, authenticate
 from django.contrib import messages
-from django.db.models import Q
 
 from accounts.forms import UserRegistrationForm
 
 from projects.models import ProjectMaterial, Department
 from projects.constants import NSUK_DEPARTMENTS
 from projects.forms import ProjectMaterialAdminForm
+from projects.search import search_projects
+from projects.pagination import KeysetPaginator, InvalidCursor
+from projects.cache import cached_catalog
+from projects.departments import get_department_tree
+from projects.pageviews import record_view
+from projects.stats import get_summary
+from projects import entitlements, previews
 
 
 def landing_page(request):
-    # Fetch all active departments and group them by faculty
-    departments = Department.objects.filter(is_active=True).order_by('name')
-    faculty_departments = {}
-    for dept in departments:
-        faculty = dept.faculty or 'Other'
-        if faculty not in faculty_departments:
-            faculty_departments[faculty] = []
-        faculty_departments[faculty].append(dept)
+    # Active departments grouped by faculty (cached tree, no per-request queries)
+    faculty_departments = get_department_tree().group(active_only=True, missing_label='Other')
     
     return render(request, 'core/landing.html', {
         'faculty_departments': faculty_departments,
     })
 
 
+def _filter_query(request):
+    """The request's query string without its page or cursor, URL-encoded for pagination links."""
+    query = request.GET.copy()
+    for key in ('page', 'cursor'):
+        query.pop(key, None)
+    return query.urlencode()
+
+
 def project_list(request):
-    qs = ProjectMaterial.objects.filter(status=ProjectMaterial.Status.APPROVED)
+    qs = ProjectMaterial.objects.filter(
+        status=ProjectMaterial.Status.APPROVED
+    ).select_related('department')
 
     q = request.GET.get('q')
     department = request.GET.get('department')
@@ -41,10 +51,7 @@ def project_list(request):
     project_type = request.GET.get('project_type')
 
     if q:
-        qs = qs.filter(
-            Q(title__icontains=q) |
-            Q(department__name__icontains=q)
-        )
+        qs = search_projects(qs, q)
     if department:
         qs = qs.filter(department__name__iexact=department)
     if faculty:
@@ -58,23 +65,59 @@ def project_list(request):
     if project_type:
         qs = qs.filter(project_type=project_type)
 
-    from django.core.paginator import Paginator
-    paginator = Paginator(qs.order_by('-created_at'), 12)
-    page_obj = paginator.get_page(request.GET.get('page'))
+    params = sorted(request.GET.lists())
+
+    if q:
+        # Relevance-ranked search results are bounded, so page numbers are fine here
+        paginator = Paginator(qs.order_by('-search_rank', '-created_at', '-id'), 12)
+
+        def build_search_page():
+            page = paginator.get_page(request.GET.get('page'))
+            return {'objects': list(page.object_list), 'number': page.number, 'count': paginator.count}
+
+        cached = cached_catalog('project_list:search', params, build_search_page)
+        paginator.count = cached['count']
+        page_obj = Page(cached['objects'], cached['number'], paginator)
+        return render(request, 'core/project_list.html', {
+            'projects': page_obj.object_list,
+            'page_obj': page_obj,
+            'filter_query': _filter_query(request),
+        })
+
+    # Plain browsing uses keyset pagination: no COUNT(*) and no OFFSET on deep pages
+    paginator = KeysetPaginator(qs, '-created_at', 12)
+
+    def build_cursor_page():
+        try:
+            return paginator.get_page(request.GET.get('cursor'))
+        except InvalidCursor:
+            return paginator.get_page()
+
+    cursor_page = cached_catalog('project_list', params, build_cursor_page)
     return render(request, 'core/project_list.html', {
-        'projects': page_obj.object_list,
-        'page_obj': page_obj,
+        'projects': cursor_page.object_list,
+        'cursor_page': cursor_page,
+        'filter_query': _filter_query(request),
     })
 
 
 def project_detail(request, slug):
-    project = get_object_or_404(
-        ProjectMaterial,
-        slug=slug,
-        status=ProjectMaterial.Status.APPROVED,
-    )
+    def build_project():
+        return get_object_or_404(
+            ProjectMaterial.objects.select_related('department', 'category'),
+            slug=slug,
+            status=ProjectMaterial.Status.APPROVED,
+        )
+
+    project = cached_catalog('project_detail', {'slug': slug}, build_project)
+    
+    # Buffered and deduplicated per visitor; no database write here
+    record_view(request, project.pk)
+    
     return render(request, 'core/project_detail.html', {
         'project': project,
+        'owned': entitlements.owns(request.user, project.pk),
+        'preview': previews.asset_urls(project),
     })
 
 
@@ -90,38 +133,24 @@ def admin_dashboard(request):
     if not _require_admin(request):
         return HttpResponseForbidden("Not allowed")
     
-    from projects.models import ProjectMaterial, Purchase, Download, Department
-    from django.db.models import Sum
-    from django.utils import timezone
-    from datetime import timedelta
-    
-    # Get stats
-    total_projects = ProjectMaterial.objects.count()
-    pending_projects = ProjectMaterial.objects.filter(status=ProjectMaterial.Status.PENDING).count()
-    pending_projects_list = ProjectMaterial.objects.filter(status=ProjectMaterial.Status.PENDING).order_by('-created_at')[:5]
-    
-    # Revenue from paid purchases
-    total_revenue = Purchase.objects.filter(status=Purchase.Status.PAID).aggregate(Sum('amount'))['amount__sum'] or 0
-    
-    # Downloads today
-    today = timezone.now().date()
-    downloads_today = Download.objects.filter(downloaded_at__date=today).count()
-    
-    # Active users (users who logged in within last 30 days)
-    from accounts.models import User
-    thirty_days_ago = timezone.now() - timedelta(days=30)
-    active_users = User.objects.filter(last_login__gte=thirty_days_ago).count()
+    # Totals are precomputed by the stats rollup (projects/stats.py)
+    summary = get_summary()
+    pending_projects_list = (
+        ProjectMaterial.objects.filter(status=ProjectMaterial.Status.PENDING)
+        .select_related('department')
+        .order_by('-created_at')[:5]
+    )
     
     # Storage (placeholder)
     storage_used = 0.5  # GB placeholder
     
     return render(request, 'core/admin_dashboard.html', {
-        'total_projects': total_projects,
-        'pending_projects': pending_projects,
+        'total_projects': summary.total_projects,
+        'pending_projects': summary.pending_projects,
         'pending_projects_list': pending_projects_list,
-        'total_revenue': total_revenue,
-        'downloads_today': downloads_today,
-        'active_users': active_users,
+        'total_revenue': summary.total_revenue,
+        'downloads_today': summary.downloads_today,
+        'active_users': summary.active_users,
         'storage_used': storage_used,
         'recent_activity': [],  # Placeholder for activity feed
     })
@@ -137,7 +166,7 @@ def _require_admin(request):
 def admin_project_list_page(request):
     if not _require_admin(request):
         return HttpResponseForbidden("Not allowed")
-    qs = ProjectMaterial.objects.all().order_by('-created_at')
+    qs = ProjectMaterial.objects.select_related('department').order_by('-created_at')
     paginator = Paginator(qs, 20)
     page_obj = paginator.get_page(request.GET.get('page'))
     return render(request, 'core/admin_project_list.html', {
@@ -150,7 +179,7 @@ def admin_project_create_page(request):
     if not _require_admin(request):
         return HttpResponseForbidden("Not allowed")
     if request.method == 'POST':
-        form = ProjectMaterialAdminForm(request.POST, request.FILES)
+        form = ProjectMaterialAdminForm(request.POST, request.FILES, user=request.user)
         if form.is_valid():
             form.save()
             return render(request, 'core/admin_project_form.html', {
@@ -170,7 +199,7 @@ def admin_project_edit_page(request, pk):
         return HttpResponseForbidden("Not allowed")
     project = get_object_or_404(ProjectMaterial, pk=pk)
     if request.method == 'POST':
-        form = ProjectMaterialAdminForm(request.POST, request.FILES, instance=project)
+        form = ProjectMaterialAdminForm(request.POST, request.FILES, instance=project, user=request.user)
         if form.is_valid():
             form.save()
             return render(request, 'core/admin_project_form.html', {
@@ -227,20 +256,6 @@ def login_page(request):
         email = request.POST.get('email')
         password = request.POST.get('password')
         
-        # Debug: Check if user exists
-        from accounts.models import User
-        try:
-            # Try to find user by email
-            user_by_email = User.objects.get(email=email)
-            print(f"DEBUG: User found by email: {user_by_email.username}, is_active: {user_by_email.is_active}")
-        except User.DoesNotExist:
-            try:
-                # Try to find user by username (in case they entered username)
-                user_by_username = User.objects.get(username=email)
-                print(f"DEBUG: User found by username: {user_by_username.email}, is_active: {user_by_username.is_active}")
-            except User.DoesNotExist:
-                print(f"DEBUG: No user found with email/username: {email}")
-        
         # Authenticate using the custom backend (email or username)
         user = authenticate(request, username=email, password=password)
         
@@ -249,18 +264,9 @@ def login_page(request):
             next_url = request.GET.get('next', 'landing')
             return redirect(next_url)
         else:
-            # Provide more detailed error message
-            error_msg = 'Invalid email or password'
-            try:
-                # Check if user exists but password is wrong
-                from accounts.models import User
-                if User.objects.filter(Q(email=email) | Q(username=email)).exists():
-                    error_msg = 'Invalid password. Please check your password and try again.'
-                else:
-                    error_msg = 'No account found with this email/username. Please check your email or register for a new account.'
-            except:
-                pass
-            messages.error(request, error_msg)
+            # Same message whether or not the account exists, so the form
+            # can't be used to find out which emails are registered
+            messages.error(request, 'Invalid email or password')
     
     return render(request, 'core/login.html')
 
@@ -282,20 +288,11 @@ def register_page(request):
     return render(request, 'core/register.html', {'form': form})
 
 
-from projects.models import Department
-
 def department_list_page(request):
     faculty_query = request.GET.get('faculty')
     
-    # Fetch all departments and group them by faculty
-    departments_by_faculty = {}
-    all_departments = Department.objects.all().order_by('faculty', 'name')
-    
-    for dept in all_departments:
-        faculty = dept.faculty or 'Uncategorized'
-        if faculty not in departments_by_faculty:
-            departments_by_faculty[faculty] = []
-        departments_by_faculty[faculty].append(dept)
+    # All departments grouped by faculty (cached tree)
+    departments_by_faculty = get_department_tree().group(missing_label='Uncategorized')
         
     # If a specific faculty is requested, filter the dictionary
     if faculty_query:
@@ -309,19 +306,15 @@ def department_list_page(request):
 
 def debug_departments(request):
     """Debug view to show department-faculty mappings from database"""
-    from projects.models import Department
     from projects.constants import FACULTY_DEPARTMENTS
     
-    # Get all departments from database
-    departments = Department.objects.all()
-    
-    # Group departments by faculty
-    faculty_departments = {}
-    for dept in departments:
-        faculty = dept.faculty or 'No Faculty'
-        if faculty not in faculty_departments:
-            faculty_departments[faculty] = []
-        faculty_departments[faculty].append(dept.name)
+    # Get all departments (cached tree) grouped by faculty
+    tree = get_department_tree()
+    departments = tree.departments
+    faculty_departments = {
+        faculty: [dept.name for dept in depts]
+        for faculty, depts in tree.group(missing_label='No Faculty').items()
+    }
     
     # Get faculty names from constants for comparison
     constants_faculties = list(FACULTY_DEPARTMENTS.keys())
@@ -334,7 +327,7 @@ def debug_departments(request):
         'db_faculties': db_faculties,
         'faculty_names': faculty_names,
         'departments': departments,
-        'total_departments': departments.count(),
+        'total_departments': len(departments),
     }
     
     return render(request, 'core/debug_departments.html', context)
@@ -1,7 +1,7 @@
 # projects/admin.py
 from django.contrib import admin
 from django.utils import timezone
-from .models import Department, Category, ProjectMaterial, Purchase, Download
+from .models import Department, Category, ProjectMaterial, Purchase, Download, Topic
 from .forms import ProjectMaterialAdminForm
 
 
@@ -24,9 +24,14 @@ class ProjectMaterialAdmin(admin.ModelAdmin):
     form = ProjectMaterialAdminForm
     autocomplete_fields = ['department']
     list_display = ['title', 'department', 'status', 'price', 'download_count', 'created_at']
+    list_select_related = ['department']
     list_filter = ['status', 'department', 'category', 'project_type', 'year']
     search_fields = ['title', 'abstract', 'description', 'keywords']
-    readonly_fields = ['download_count', 'view_count', 'slug', 'created_at', 'updated_at']
+    readonly_fields = [
+        'download_count', 'view_count', 'slug', 'created_at', 'updated_at',
+        'processing_status', 'file_format', 'page_count', 'word_count', 'chapter_headings',
+        'document_hash', 'preview_pages',
+    ]
     fieldsets = (
         ('Basic Information', {
             'fields': ('title', 'slug', 'abstract', 'description')
@@ -40,6 +45,12 @@ class ProjectMaterialAdmin(admin.ModelAdmin):
         ('Files', {
             'fields': ('document_file', 'software_file', 'preview_images')
         }),
+        ('Document Metadata', {
+            'fields': (
+                'processing_status', 'file_format', 'page_count', 'word_count', 'chapter_headings',
+                'document_hash', 'preview_pages',
+            )
+        }),
         ('Pricing and Status', {
             'fields': ('price', 'status', 'is_featured')
         }),
@@ -52,30 +63,7 @@ class ProjectMaterialAdmin(admin.ModelAdmin):
     )
     
     def save_model(self, request, obj, form, change):
-        if 'document_file' in form.changed_data and obj.document_file:
-            try:
-                from PyPDF4 import PdfFileReader
-                from io import BytesIO
-
-                # Reset the file pointer to the beginning
-                obj.document_file.seek(0)
-                
-                # Read the file content into a BytesIO object
-                file_content = BytesIO(obj.document_file.read())
-                
-                # Create a PDF reader object
-                pdf_reader = PdfFileReader(file_content, strict=False)
-                
-                # Get the number of pages
-                obj.page_count = pdf_reader.getNumPages()
-                
-                # Reset the file pointer again before saving
-                obj.document_file.seek(0)
-            except Exception as e:
-                # Handle cases where the file is not a valid PDF or other errors
-                print(f"Error processing PDF file: {e}")
-                obj.page_count = None
-
+        # Document metadata is extracted in the background (projects/documents.py)
         if not change:  # If creating a new project (not editing)
             obj.status = ProjectMaterial.Status.APPROVED
             obj.approved_by = request.user
@@ -88,6 +76,7 @@ class ProjectMaterialAdmin(admin.ModelAdmin):
 @admin.register(Purchase)
 class PurchaseAdmin(admin.ModelAdmin):
     list_display = ['id', 'user', 'project', 'amount', 'status', 'paid_at', 'created_at']
+    list_select_related = ['user', 'project']
     list_filter = ['status', 'currency']
     search_fields = ['user__email', 'project__title', 'paystack_reference']
     readonly_fields = ['created_at', 'updated_at']
@@ -96,6 +85,16 @@ class PurchaseAdmin(admin.ModelAdmin):
 @admin.register(Download)
 class DownloadAdmin(admin.ModelAdmin):
     list_display = ['user', 'project', 'download_type', 'downloaded_at']
+    list_select_related = ['user', 'project']
     list_filter = ['download_type']
     search_fields = ['user__email', 'project__title', 'token']
-    readonly_fields = ['downloaded_at']
\ No newline at end of file
+    readonly_fields = ['downloaded_at']
+
+
+@admin.register(Topic)
+class TopicAdmin(admin.ModelAdmin):
+    list_display = ['text', 'department', 'is_active', 'updated_at']
+    list_editable = ['is_active']
+    list_filter = ['is_active', 'department']
+    search_fields = ['text', 'department']
+    readonly_fields = ['created_at', 'updated_at']
@@ -0,0 +1,86 @@
+# projects/buffers.py
+"""
+Append-only event logs for work that is recorded on the request path and
+written to the database later in batches (page views, download audit
+records).
+
+With REDIS_URL set, events go to a Redis list (RPUSH) shared by every
+worker and host; otherwise they stay in an in-process list. Either way
+``drain()`` atomically takes everything logged so far, and ``restore()``
+puts events back when writing them out failed. Events must be JSON
+serializable.
+"""
+import json
+import threading
+import uuid
+
+import redis
+from django.conf import settings
+
+
+class LocalEventLog:
+    """Per-process log; only this process's background jobs see its events."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events = []
+
+    def append(self, event):
+        with self._lock:
+            self._events.append(event)
+
+    def drain(self):
+        with self._lock:
+            events, self._events = self._events, []
+        return events
+
+    def restore(self, events):
+        with self._lock:
+            self._events[:0] = events
+
+
+class RedisEventLog:
+    """Redis list shared by all workers and hosts."""
+
+    key_prefix = 'projecthub:events:'
+
+    def __init__(self, url, name):
+        self._client = redis.Redis.from_url(url)
+        self.key = f'{self.key_prefix}{name}'
+
+    def append(self, event):
+        self._client.rpush(self.key, json.dumps(event))
+
+    def drain(self):
+        # RENAME is atomic: events logged after it go to a fresh list
+        draining = f'{self.key}:draining:{uuid.uuid4().hex}'
+        try:
+            self._client.rename(self.key, draining)
+        except redis.ResponseError:
+            # Nothing logged
+            return []
+        pipe = self._client.pipeline()
+        pipe.lrange(draining, 0, -1)
+        pipe.delete(draining)
+        raw, _ = pipe.execute()
+        return [json.loads(item) for item in raw]
+
+    def restore(self, events):
+        if events:
+            self._client.lpush(self.key, *[json.dumps(event) for event in reversed(events)])
+
+
+_logs = {}
+_lock = threading.Lock()
+
+
+def get_event_log(name):
+    """The shared event log called ``name`` (Redis or in-process, per settings)."""
+    log = _logs.get(name)
+    if log is None:
+        with _lock:
+            log = _logs.get(name)
+            if log is None:
+                log = RedisEventLog(settings.REDIS_URL, name) if settings.REDIS_URL else LocalEventLog()
+                _logs[name] = log
+    return log
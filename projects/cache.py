@@ -0,0 +1,57 @@
+# projects/cache.py
+"""
+Versioned caching for catalog reads.
+
+Every cache key embeds the current catalog *generation* number. Saving or
+deleting a ProjectMaterial, Department or Category bumps the generation
+once the change commits (see projects/signals.py), so all previously
+cached reads become unreachable at once without flushing the cache; they
+simply expire. Bumping any earlier would let a read racing the commit
+cache the old rows under the new generation.
+"""
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+
+GENERATION_KEY = 'catalog:generation'
+
+
+def get_generation():
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, 1, timeout=None)
+        generation = cache.get(GENERATION_KEY, 1)
+    return generation
+
+
+def bump_generation():
+    """Invalidate every cached catalog read."""
+    try:
+        return cache.incr(GENERATION_KEY)
+    except ValueError:
+        # Key missing (first write or evicted): start a fresh generation
+        cache.add(GENERATION_KEY, 1, timeout=None)
+        return cache.incr(GENERATION_KEY)
+
+
+def catalog_key(namespace, params=None):
+    """Cache key for ``namespace`` + request parameters in the current generation."""
+    digest = hashlib.md5(
+        json.dumps(params or {}, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f'catalog:{get_generation()}:{namespace}:{digest}'
+
+
+def cached_catalog(namespace, params, builder, timeout=None):
+    """
+    Return the cached value for ``namespace``/``params``, calling ``builder()``
+    and caching its (picklable) result on a miss.
+    """
+    key = catalog_key(namespace, params)
+    value = cache.get(key)
+    if value is None:
+        value = builder()
+        cache.set(key, value, timeout or settings.CATALOG_CACHE_TIMEOUT)
+    return value
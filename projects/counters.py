@@ -0,0 +1,169 @@
+# projects/counters.py
+"""
+Buffered download/view counters for ProjectMaterial.
+
+Incrementing a counter never touches the database. Increments go to Redis
+(``HINCRBY`` on one hash per field, shared by every worker) when REDIS_URL
+is set, or to an in-process buffer otherwise. ``flush`` writes the buffer
+out with one batched ``UPDATE ... SET field = field + CASE id WHEN ... END``
+per chunk of projects; it runs as a background job (projects/scheduler.py)
+and from ``manage.py flush_counters``.
+
+Buffered increments can be lost if Redis is wiped or a process is killed
+before flushing. ``download_count`` can always be recomputed exactly from
+the Download table with ``manage.py flush_counters --recount``.
+"""
+import logging
+import threading
+import uuid
+from collections import Counter
+
+import redis
+from django.conf import settings
+from django.db import models
+from django.db.models import Case, Count, F, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
+
+from .download_tokens import flush_download_audit
+from .models import ProjectMaterial, Download
+
+logger = logging.getLogger(__name__)
+
+COUNTER_FIELDS = ('download_count', 'view_count')
+
+# Projects per batched UPDATE
+FLUSH_CHUNK_SIZE = 500
+
+
+class LocalCounterBuffer:
+    """Per-process buffer; only this process's background jobs see its increments."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {field: Counter() for field in COUNTER_FIELDS}
+
+    def incr(self, field, pk, amount=1):
+        with self._lock:
+            self._counts[field][pk] += amount
+
+    def drain(self, field):
+        """Take (and reset) the pending ``{pk: increment}`` for ``field``."""
+        with self._lock:
+            counts, self._counts[field] = self._counts[field], Counter()
+        return dict(counts)
+
+    def restore(self, field, counts):
+        """Put drained increments back after a failed flush."""
+        with self._lock:
+            self._counts[field].update(counts)
+
+
+class RedisCounterBuffer:
+    """Buffer shared by all workers and hosts through Redis hashes."""
+
+    key_prefix = 'projecthub:counters:'
+
+    def __init__(self, url):
+        self._client = redis.Redis.from_url(url)
+
+    def _key(self, field):
+        return f'{self.key_prefix}{field}'
+
+    def incr(self, field, pk, amount=1):
+        self._client.hincrby(self._key(field), pk, amount)
+
+    def drain(self, field):
+        # RENAME is atomic: increments after it land in a fresh hash
+        flushing = f'{self._key(field)}:flushing:{uuid.uuid4().hex}'
+        try:
+            self._client.rename(self._key(field), flushing)
+        except redis.ResponseError:
+            # No pending increments
+            return {}
+        pipe = self._client.pipeline()
+        pipe.hgetall(flushing)
+        pipe.delete(flushing)
+        counts, _ = pipe.execute()
+        return {int(pk): int(amount) for pk, amount in counts.items()}
+
+    def restore(self, field, counts):
+        pipe = self._client.pipeline()
+        for pk, amount in counts.items():
+            pipe.hincrby(self._key(field), pk, amount)
+        pipe.execute()
+
+
+_buffer = None
+_lock = threading.Lock()
+
+
+def get_buffer():
+    global _buffer
+    if _buffer is None:
+        with _lock:
+            if _buffer is None:
+                _buffer = RedisCounterBuffer(settings.REDIS_URL) if settings.REDIS_URL else LocalCounterBuffer()
+    return _buffer
+
+
+def increment(project_id, field, amount=1):
+    """Count ``amount`` more downloads/views for a project without a database write."""
+    if field not in COUNTER_FIELDS:
+        raise ValueError(f'Unknown counter field: {field}')
+    try:
+        get_buffer().incr(field, project_id, amount)
+    except redis.RedisError as e:
+        # Counters must never break a download or page view
+        logger.warning(f"Could not buffer {field} increment for project {project_id}: {e}")
+
+
+def apply_counts(field, counts, queryset=None, key='pk'):
+    """
+    Add ``{key value: increment}`` to ``field`` of the matching rows of
+    ``queryset`` (projects by default) with one UPDATE per chunk.
+    """
+    if queryset is None:
+        queryset = ProjectMaterial.objects.all()
+    items = sorted(counts.items())
+    for start in range(0, len(items), FLUSH_CHUNK_SIZE):
+        chunk = items[start:start + FLUSH_CHUNK_SIZE]
+        queryset.filter(**{f'{key}__in': [value for value, _ in chunk]}).update(**{
+            field: F(field) + Case(
+                *[When(**{key: value}, then=Value(amount)) for value, amount in chunk],
+                default=Value(0),
+                output_field=models.PositiveIntegerField(),
+            )
+        })
+
+
+def flush():
+    """Write buffered increments to the database; returns ``{field: projects updated}``."""
+    buffer = get_buffer()
+    flushed = {}
+    for field in COUNTER_FIELDS:
+        counts = buffer.drain(field)
+        if not counts:
+            continue
+        try:
+            apply_counts(field, counts)
+        except Exception:
+            buffer.restore(field, counts)
+            raise
+        flushed[field] = len(counts)
+    return flushed
+
+
+def recount_downloads():
+    """Recompute every ``download_count`` exactly from the Download table."""
+    # Downloads whose audit rows are still queued would be missed by the recount
+    flush_download_audit()
+    # Pending increments are now part of the Download rows
+    get_buffer().drain('download_count')
+    downloads = (
+        Download.objects.filter(project=OuterRef('pk'))
+        .order_by()
+        .values('project')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    return ProjectMaterial.objects.update(download_count=Coalesce(Subquery(downloads), 0))
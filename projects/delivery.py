@@ -0,0 +1,252 @@
+# projects/delivery.py
+"""
+File delivery for paid downloads.
+
+``serve_file`` turns a FileField into a response that:
+
+* answers conditional requests (ETag / Last-Modified, If-None-Match,
+  If-Modified-Since, If-Match, If-Unmodified-Since),
+* serves a single ``Range: bytes=...`` request as ``206 Partial Content``
+  (``If-Range`` is honoured) so interrupted downloads can resume,
+* streams local files through ``FileResponse`` with an exact
+  Content-Length, which lets WSGI servers that support it (gunicorn) use
+  ``sendfile()`` instead of copying the bytes through Python,
+* optionally hands local files to the reverse proxy instead
+  (``DOWNLOAD_OFFLOAD = 'x-accel'`` for nginx, ``'x-sendfile'`` for
+  Apache/lighttpd), which then handles ranges itself,
+* streams files from remote storage via ``storage.open()``, or redirects
+  to the storage URL when ``DOWNLOAD_REMOTE_REDIRECT`` is set.
+
+``serve_bundle`` streams several files as one ZIP archive (see
+projects/zipstream.py) with an exact Content-Length.
+"""
+import datetime
+import functools
+import hashlib
+import io
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseRedirect, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe, quote_etag
+
+from . import zipstream
+from .storage import blob_digest
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+class FileRange:
+    """File-like view of ``length`` bytes of ``file`` starting at ``start``."""
+
+    def __init__(self, file, start, length):
+        self.file = file
+        self.start = start
+        self.length = length
+        self.name = getattr(file, 'name', '')
+        self.file.seek(start)
+
+    def fileno(self):
+        # Lets the WSGI server sendfile() the range (it stops at Content-Length)
+        return self.file.fileno()
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.file.tell() - self.start
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.tell(), io.SEEK_END: self.length}[whence]
+        position = min(max(base + offset, 0), self.length)
+        self.file.seek(self.start + position)
+        return position
+
+    def read(self, size=-1):
+        remaining = self.length - self.tell()
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        return self.file.read(size) if size > 0 else b''
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range(header, size):
+    """
+    ``(start, end)`` (inclusive) for a single byte range, or None when the
+    whole file should be sent (no header, multiple ranges or malformed).
+    """
+    match = _RANGE_RE.match((header or '').strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise RangeNotSatisfiable()
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise RangeNotSatisfiable()
+    return start, end
+
+
+def _local_path(file_field):
+    try:
+        return file_field.path
+    except (NotImplementedError, ValueError):
+        # Remote storage (S3 and similar) has no local path
+        return None
+
+
+def file_validators(file_field, path=None):
+    """``(etag, last_modified timestamp or None, size)`` for a stored file."""
+    if path:
+        stat = os.stat(path)
+        size, modified = stat.st_size, int(stat.st_mtime)
+        version = f'{stat.st_size}-{stat.st_mtime_ns}'
+    else:
+        storage = file_field.storage
+        size = storage.size(file_field.name)
+        try:
+            modified = int(storage.get_modified_time(file_field.name).timestamp())
+        except (NotImplementedError, AttributeError):
+            modified = None
+        version = f'{size}-{modified}'
+    # Content-addressed names carry the content's hash already
+    digest = blob_digest(file_field.name) or hashlib.sha1(f'{file_field.name}:{version}'.encode()).hexdigest()
+    return quote_etag(digest), modified, size
+
+
+def _if_range_matches(request, etag, last_modified):
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if not if_range:
+        return True
+    if if_range.startswith(('"', 'W/')):
+        # Only a strong, exact ETag match allows a partial response
+        return if_range == etag
+    return last_modified is not None and parse_http_date_safe(if_range) == last_modified
+
+
+def _offload_response(path, content_type):
+    response = HttpResponse(content_type=content_type)
+    if settings.DOWNLOAD_OFFLOAD == 'x-accel':
+        relative = os.path.relpath(path, settings.MEDIA_ROOT)
+        response['X-Accel-Redirect'] = settings.DOWNLOAD_ACCEL_PREFIX.rstrip('/') + '/' + quote(relative)
+    else:
+        response['X-Sendfile'] = path
+    return response
+
+
+def serve_file(request, file_field, filename=None):
+    """Response delivering ``file_field`` as an attachment (see module docstring)."""
+    path = _local_path(file_field)
+    if path is None and settings.DOWNLOAD_REMOTE_REDIRECT:
+        return HttpResponseRedirect(file_field.url)
+
+    filename = filename or os.path.basename(file_field.name)
+    content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    etag, last_modified, size = file_validators(file_field, path)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        if path and settings.DOWNLOAD_OFFLOAD in ('x-accel', 'x-sendfile'):
+            response = _offload_response(path, content_type)
+        else:
+            response = _stream_response(request, file_field, path, size, content_type, etag, last_modified)
+
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    response['Accept-Ranges'] = 'bytes'
+    response['Cache-Control'] = 'private'
+    if response.status_code in (200, 206):
+        response['Content-Disposition'] = content_disposition_header(True, filename)
+    return response
+
+
+def _stream_response(request, file_field, path, size, content_type, etag, last_modified):
+    byte_range = None
+    if _if_range_matches(request, etag, last_modified):
+        try:
+            byte_range = parse_range(request.META.get('HTTP_RANGE'), size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+    file = _open_stored(file_field, path)
+    if byte_range is None:
+        return FileResponse(file, content_type=content_type)
+
+    start, end = byte_range
+    response = FileResponse(FileRange(file, start, end - start + 1), content_type=content_type, status=206)
+    response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    return response
+
+
+def _open_stored(file_field, path):
+    if path:
+        return open(path, 'rb')
+    return file_field.storage.open(file_field.name, 'rb')
+
+
+def serve_bundle(request, file_fields, filename, names=None):
+    """
+    Response streaming ``file_fields`` as a single ZIP attachment named
+    ``filename``, with member ``names`` (default: the stored basenames).
+    Byte ranges are not supported for bundles.
+    """
+    members = []
+    validators = []
+    used_names = set()
+    names = names or [os.path.basename(file_field.name) for file_field in file_fields]
+    for file_field, name in zip(file_fields, names):
+        path = _local_path(file_field)
+        etag, last_modified, size = file_validators(file_field, path)
+        if name in used_names:
+            root, ext = os.path.splitext(name)
+            name = f'{root}-{len(used_names)}{ext}'
+        used_names.add(name)
+        modified = (
+            datetime.datetime.fromtimestamp(last_modified) if last_modified is not None else None
+        )
+        members.append(zipstream.ZipMember(
+            name, size, functools.partial(_open_stored, file_field, path), modified,
+        ))
+        validators.append((etag, last_modified))
+
+    etag = quote_etag(hashlib.sha1(
+        ''.join(etag for etag, _ in validators).encode()
+    ).hexdigest())
+    timestamps = [modified for _, modified in validators]
+    last_modified = max(timestamps) if timestamps and None not in timestamps else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        size = zipstream.archive_size(members)
+        if size > zipstream.ZIP32_LIMIT:
+            raise zipstream.ZipTooLarge('Archive would need ZIP64.')
+        response = StreamingHttpResponse(zipstream.stream(members), content_type='application/zip')
+        response['Content-Length'] = size
+        response['Content-Disposition'] = content_disposition_header(True, filename)
+
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    response['Accept-Ranges'] = 'none'
+    response['Cache-Control'] = 'private'
+    return response
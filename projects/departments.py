@@ -0,0 +1,62 @@
+# projects/departments.py
+"""
+Faculty -> department tree shared by the landing, department list and
+debug pages.
+
+The tree is built with a single query (including each department's count
+of approved projects) and cached under the catalog generation, so any
+Department/ProjectMaterial change or sync_departments run rebuilds it on
+the next read.
+"""
+from django.db import transaction
+from django.db.models import Count, Q
+
+from .cache import bump_generation, cached_catalog
+from .models import Department, ProjectMaterial
+
+# Department tree rarely changes; keep it for a day unless invalidated
+DEPARTMENT_TREE_TIMEOUT = 60 * 60 * 24
+
+
+class DepartmentTree:
+    """Departments grouped by faculty, faculties sorted by name (missing faculty last)."""
+
+    def __init__(self, departments):
+        self.departments = departments
+        self.faculties = {}
+        for dept in departments:
+            self.faculties.setdefault(dept.faculty or None, []).append(dept)
+
+    def group(self, active_only=False, missing_label='Other'):
+        """``{faculty label: [Department, ...]}`` for templates."""
+        grouped = {}
+        for faculty, depts in self.faculties.items():
+            if active_only:
+                depts = [dept for dept in depts if dept.is_active]
+            if depts:
+                grouped[faculty or missing_label] = depts
+        return grouped
+
+    def faculty_names(self):
+        return [faculty for faculty in self.faculties if faculty]
+
+
+def build_department_tree():
+    departments = list(
+        Department.objects.annotate(
+            approved_project_count=Count(
+                'projects', filter=Q(projects__status=ProjectMaterial.Status.APPROVED)
+            )
+        ).order_by('name')
+    )
+    departments.sort(key=lambda dept: (not dept.faculty, dept.faculty or '', dept.name))
+    return DepartmentTree(departments)
+
+
+def get_department_tree():
+    return cached_catalog('department_tree', None, build_department_tree, DEPARTMENT_TREE_TIMEOUT)
+
+
+def invalidate_department_tree():
+    """Call after bulk department changes that bypass model signals."""
+    transaction.on_commit(bump_generation)
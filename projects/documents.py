@@ -0,0 +1,250 @@
+# projects/documents.py
+"""
+Background metadata extraction for uploaded project documents.
+
+Saving a project with a new ``document_file`` marks it
+``processing_status = pending`` (projects/signals.py) and, once the save
+commits, queues it on a per-process thread pool (DOCUMENT_WORKERS
+threads), so the upload request returns without reading the file.
+
+A worker opens the stored file through its storage and extracts:
+
+* PDF (pypdf): page count, word count from the page text, and chapter
+  headings from the outline or, without one, from the page text. pypdf
+  reads the file by seeking, not into memory, and pages are handled one
+  at a time.
+* DOCX (zipfile + ElementTree): word count and chapter headings from
+  ``word/document.xml``, parsed incrementally with ``iterparse``; the page
+  count from ``docProps/app.xml`` (as of Word's last save).
+
+Chapter headings are "CHAPTER ..." lines, joined with the title line that
+follows a bare "CHAPTER ONE"; DOCX files without any fall back to their
+"heading 1" paragraphs.
+
+The same worker then generates the preview thumbnails and excerpt
+(projects/previews.py); a preview failure does not fail the metadata.
+
+Results are written back with a conditional UPDATE that only applies if
+the document was not replaced in the meantime. Projects still pending
+after a restart are picked up by ``manage.py process_documents``.
+
+The pool also runs other long file jobs off the request thread through
+``submit``, e.g. assembling chunked uploads (projects/uploads.py).
+"""
+import logging
+import os
+import re
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree import ElementTree
+
+from django.conf import settings
+from django.db import connection
+from pypdf import PdfReader
+
+from . import previews
+from .cache import bump_generation
+from .models import ProjectMaterial
+
+logger = logging.getLogger(__name__)
+
+# Chapter headings kept per document
+MAX_CHAPTERS = 50
+MAX_HEADING_LENGTH = 200
+
+CHAPTER_RE = re.compile(
+    r'^\s*chapter\s+(\d+|[ivxl]+|one|two|three|four|five|six|seven|eight|nine|ten)\b',
+    re.IGNORECASE,
+)
+# Table of contents lines: dot leaders or a trailing page number
+_TOC_LINE_RE = re.compile(r'\.{4,}|\s\d+\s*$')
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_EXTENDED_PROPERTIES = '{http://schemas.openxmlformats.org/officeDocument/2006/extended-properties}'
+
+
+class UnsupportedDocument(Exception):
+    pass
+
+
+def chapter_headings(lines, fallback=True):
+    """
+    Chapter headings among candidate heading ``lines`` (in document order).
+
+    "CHAPTER ..." lines are the chapters; a bare "CHAPTER ONE" takes the
+    following line as its title. Without any, all ``lines`` are returned
+    when ``fallback`` is set.
+    """
+    lines = [' '.join(line.split())[:MAX_HEADING_LENGTH] for line in lines]
+    lines = [line for line in lines if line and not _TOC_LINE_RE.search(line)]
+    headings = []
+    for i, line in enumerate(lines):
+        match = CHAPTER_RE.match(line)
+        if not match:
+            continue
+        title = lines[i + 1] if i + 1 < len(lines) and not CHAPTER_RE.match(lines[i + 1]) else ''
+        headings.append(f'{line}: {title}' if title and match.end() == len(line) else line)
+    if not headings and fallback:
+        headings = lines
+    return list(dict.fromkeys(headings))[:MAX_CHAPTERS]
+
+
+def extract_pdf(file):
+    """``{'page_count', 'word_count', 'chapter_headings'}`` for a PDF file object."""
+    reader = PdfReader(file, strict=False)
+    # Top-level outline entries; nested lists are sub-sections
+    headings = chapter_headings([item.title for item in reader.outline if not isinstance(item, list)])
+
+    words = 0
+    for page in reader.pages:
+        text = page.extract_text() or ''
+        words += len(text.split())
+        if not reader.outline:
+            headings.extend(chapter_headings(text.splitlines(), fallback=False))
+    headings = list(dict.fromkeys(headings))[:MAX_CHAPTERS]
+    return {'page_count': len(reader.pages), 'word_count': words, 'chapter_headings': headings}
+
+
+def _docx_heading_styles(archive):
+    """Style ids of "heading 1" and "title" paragraphs (ids are localized, names are not)."""
+    styles = {'Heading1', 'Title'}
+    try:
+        with archive.open('word/styles.xml') as f:
+            for _, elem in ElementTree.iterparse(f):
+                if elem.tag == f'{_W}style':
+                    name = elem.find(f'{_W}name')
+                    if name is not None and name.get(f'{_W}val', '').lower() in ('heading 1', 'title'):
+                        styles.add(elem.get(f'{_W}styleId'))
+                    elem.clear()
+    except KeyError:
+        pass
+    return styles
+
+
+def _docx_page_count(archive):
+    try:
+        with archive.open('docProps/app.xml') as f:
+            pages = ElementTree.parse(f).find(f'{_EXTENDED_PROPERTIES}Pages')
+    except (KeyError, ElementTree.ParseError):
+        return None
+    try:
+        return int(pages.text)
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def extract_docx(file):
+    """``{'page_count', 'word_count', 'chapter_headings'}`` for a DOCX file object."""
+    try:
+        archive = zipfile.ZipFile(file)
+    except zipfile.BadZipFile as e:
+        raise UnsupportedDocument('Not a valid DOCX file.') from e
+
+    with archive:
+        heading_styles = _docx_heading_styles(archive)
+        candidates = []
+        words = 0
+        with archive.open('word/document.xml') as f:
+            for _, elem in ElementTree.iterparse(f):
+                if elem.tag != f'{_W}p':
+                    continue
+                text = ''.join(t.text or '' for t in elem.iter(f'{_W}t'))
+                words += len(text.split())
+                style = elem.find(f'{_W}pPr/{_W}pStyle')
+                style = style.get(f'{_W}val', '') if style is not None else ''
+                if style in heading_styles or (not style.upper().startswith('TOC') and CHAPTER_RE.match(text)):
+                    candidates.append(text)
+                # Paragraphs are done with; keep memory flat on long documents
+                elem.clear()
+        page_count = _docx_page_count(archive)
+    return {
+        'page_count': page_count,
+        'word_count': words,
+        'chapter_headings': chapter_headings(candidates),
+    }
+
+
+EXTRACTORS = {
+    '.pdf': ('PDF', extract_pdf),
+    '.docx': ('DOCX', extract_docx),
+}
+
+
+def extract(file, name):
+    """Metadata dict for ``file`` (an open binary file) by the extension of ``name``."""
+    ext = os.path.splitext(name)[1].lower()
+    if ext not in EXTRACTORS:
+        raise UnsupportedDocument(f'No extractor for {ext or "files without an extension"}.')
+    file_format, extractor = EXTRACTORS[ext]
+    return {'file_format': file_format, **extractor(file)}
+
+
+def process_document(project_id):
+    """Extract and store metadata for a project's current document; returns the new status."""
+    project = ProjectMaterial.objects.filter(pk=project_id).only('pk', 'document_file').first()
+    if project is None or not project.document_file:
+        return None
+    name = project.document_file.name
+    ext = os.path.splitext(name)[1].lower()
+    try:
+        with project.document_file.open('rb') as f:
+            metadata = extract(f, name)
+        metadata['processing_status'] = ProjectMaterial.ProcessingStatus.DONE
+    except Exception as e:
+        if isinstance(e, UnsupportedDocument):
+            logger.info(f"Project {project_id} document {name}: {e}")
+        else:
+            logger.exception(f"Could not process document {name} of project {project_id}")
+        metadata = {
+            'file_format': EXTRACTORS[ext][0] if ext in EXTRACTORS else (ext.lstrip('.').upper() or None),
+            'page_count': None,
+            'word_count': None,
+            'chapter_headings': [],
+            'processing_status': ProjectMaterial.ProcessingStatus.FAILED,
+        }
+    try:
+        with project.document_file.open('rb') as f:
+            metadata.update(previews.generate(f, name))
+    except Exception:
+        logger.exception(f"Could not generate previews of {name} for project {project_id}")
+
+    # Skip the write if another upload replaced the document meanwhile
+    if ProjectMaterial.objects.filter(pk=project_id, document_file=name).update(**metadata):
+        bump_generation()
+    return metadata['processing_status']
+
+
+_pool = None
+_lock = threading.Lock()
+
+
+def _run_quietly(job, *args):
+    try:
+        job(*args)
+    except Exception:
+        logger.exception(f'{job.__name__}{args} failed')
+    finally:
+        # Pool threads keep their own connection; don't leave it open while idle
+        connection.close()
+
+
+def submit(job, *args):
+    """Run ``job(*args)`` on this process's worker pool; returns False without workers."""
+    global _pool
+    if settings.DOCUMENT_WORKERS <= 0:
+        return False
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(
+                    max_workers=settings.DOCUMENT_WORKERS, thread_name_prefix='documents',
+                )
+    _pool.submit(_run_quietly, job, *args)
+    return True
+
+
+def enqueue(project_id):
+    """Process the project's document on this process's worker pool."""
+    # Without workers it is left pending for `manage.py process_documents`
+    submit(process_document, project_id)
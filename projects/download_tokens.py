@@ -0,0 +1,160 @@
+# projects/download_tokens.py
+"""
+Signed, stateless download links.
+
+A download grant (user, project, purchase, download type, expiry and the
+storage names of the project's files) is signed with HMAC (Django's
+``signing`` module, keyed by SECRET_KEY) into the link token. The file
+endpoint verifies the signature and expiry and serves the files named in
+the token without any database lookup.
+
+Issuing a link appends an audit record to the ``download_audit`` event
+log (projects/buffers.py); ``flush_download_audit`` writes the records to
+the Download table in batches as a background job (projects/scheduler.py).
+"""
+import os
+import time
+import uuid
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.utils import timezone
+
+from .buffers import get_event_log
+from .models import Download, ProjectMaterial, Purchase
+
+SALT = 'projects.download'
+
+# Project file fields a grant carries, in token order
+FILE_FIELDS = ('document_file', 'software_file', 'preview_images')
+
+# Stored names are content hashes (projects/storage.py); downloads are
+# named after the project slug with these suffixes instead
+DOWNLOAD_NAME_SUFFIXES = {'document_file': '', 'software_file': '-software', 'preview_images': '-preview'}
+
+
+class InvalidDownloadToken(Exception):
+    pass
+
+
+class ExpiredDownloadToken(InvalidDownloadToken):
+    pass
+
+
+class DownloadGrant:
+    def __init__(self, token_id, user_id, project_id, purchase_id, download_type, expires, slug, file_names):
+        self.token_id = token_id
+        self.user_id = user_id
+        self.project_id = project_id
+        self.purchase_id = purchase_id
+        self.download_type = download_type
+        self.expires = expires
+        self.slug = slug
+        self.file_names = file_names
+
+    @classmethod
+    def issue(cls, user, project, purchase_id, download_type):
+        return cls(
+            token_id=uuid.uuid4().hex,
+            user_id=user.pk,
+            project_id=project.pk,
+            purchase_id=purchase_id,
+            download_type=download_type,
+            expires=int(time.time()) + settings.DOWNLOAD_LINK_TTL,
+            slug=project.slug,
+            file_names=[getattr(project, field).name or None for field in FILE_FIELDS],
+        )
+
+    @property
+    def expires_at(self):
+        return datetime.fromtimestamp(self.expires, tz=dt_timezone.utc)
+
+    def sign(self):
+        return signing.dumps(
+            [self.token_id, self.user_id, self.project_id, self.purchase_id,
+             self.download_type, self.expires, self.slug, self.file_names],
+            salt=SALT,
+            compress=True,
+        )
+
+    @classmethod
+    def from_token(cls, token):
+        try:
+            grant = cls(*signing.loads(token, salt=SALT))
+        except (signing.BadSignature, TypeError, ValueError) as e:
+            raise InvalidDownloadToken('Invalid download link.') from e
+        if grant.expires < time.time():
+            raise ExpiredDownloadToken('Download link has expired.')
+        return grant
+
+    def files(self):
+        """``{field name: FieldFile}`` for the files this grant covers that exist."""
+        return {
+            field: ProjectMaterial._meta.get_field(field).attr_class(
+                None, ProjectMaterial._meta.get_field(field), name,
+            )
+            for field, name in zip(FILE_FIELDS, self.file_names)
+            if name
+        }
+
+    def download_name(self, field, file):
+        """Attachment filename for ``file``, the grant's ``field``."""
+        ext = os.path.splitext(file.name)[1].lower()
+        return f'{self.slug}{DOWNLOAD_NAME_SUFFIXES[field]}{ext}'
+
+
+def record_download(grant, request):
+    """Queue the audit record for an issued download link."""
+    get_event_log('download_audit').append({
+        'token': grant.token_id,
+        'user': grant.user_id,
+        'project': grant.project_id,
+        'purchase': grant.purchase_id,
+        'download_type': grant.download_type,
+        'expires': grant.expires,
+        'ip_address': request.META.get('REMOTE_ADDR'),
+        'user_agent': request.META.get('HTTP_USER_AGENT', ''),
+        'at': timezone.now().isoformat(),
+    })
+
+
+def flush_download_audit():
+    """Write queued audit records to Download; returns the number written."""
+    log = get_event_log('download_audit')
+    records = log.drain()
+    if not records:
+        return 0
+    try:
+        # Skip records whose user or project was deleted meanwhile
+        users = set(
+            get_user_model().objects.filter(pk__in={r['user'] for r in records}).values_list('pk', flat=True)
+        )
+        projects = set(
+            ProjectMaterial.objects.filter(pk__in={r['project'] for r in records}).values_list('pk', flat=True)
+        )
+        purchases = set(
+            Purchase.objects.filter(pk__in={r['purchase'] for r in records if r['purchase']})
+            .values_list('pk', flat=True)
+        )
+        downloads = [
+            Download(
+                token=r['token'],
+                user_id=r['user'],
+                project_id=r['project'],
+                purchase_id=r['purchase'] if r['purchase'] in purchases else None,
+                download_type=r['download_type'],
+                expires_at=datetime.fromtimestamp(r['expires'], tz=dt_timezone.utc),
+                ip_address=r['ip_address'],
+                user_agent=r['user_agent'],
+                downloaded_at=datetime.fromisoformat(r['at']),
+            )
+            for r in records
+            if r['user'] in users and r['project'] in projects
+        ]
+        Download.objects.bulk_create(downloads, batch_size=500, ignore_conflicts=True)
+    except Exception:
+        log.restore(records)
+        raise
+    return len(downloads)
@@ -0,0 +1,96 @@
+# projects/entitlements.py
+"""
+Purchase entitlements: which projects a user owns.
+
+A user's paid purchases are cached as one ``{project id: purchase id}``
+mapping (the latest paid purchase per project), so "can U download P",
+"has U already bought P" and "which of these N listed projects does U
+own" are each a cache read instead of a Purchase query.
+
+Each user's entry is keyed by a per-user version token, following the
+catalog generation scheme in projects/cache.py. ``invalidate`` replaces
+the token, which makes the cached mapping unreachable. A lookup that
+raced an invalidation therefore cannot store a stale mapping under the
+new token. Invalidation happens on every Purchase save/delete
+(projects/signals.py) and when settlement changes purchase statuses with
+bulk updates (projects/settlement.py).
+
+Invalidation only reaches other processes through a shared cache. Without
+REDIS_URL every process has its own copy, so ENTITLEMENT_CACHE_TIMEOUT
+defaults to a minute there. Regardless, ``purchase_id_for`` (which gates
+downloads and repeat payments) checks the database before trusting a
+cached "not owned".
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Purchase
+
+
+def _version_key(user_id):
+    return f'entitlements:version:{user_id}'
+
+
+def _version(user_id):
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def owned_purchases(user):
+    """``{project id: purchase id}`` for the projects ``user`` has paid for."""
+    if user is None or not user.is_authenticated:
+        return {}
+    key = f'entitlements:{user.pk}:{_version(user.pk)}'
+    owned = cache.get(key)
+    if owned is None:
+        # Ordered so the latest paid purchase per project wins
+        owned = dict(
+            Purchase.objects.filter(user_id=user.pk, status=Purchase.Status.PAID)
+            .order_by('created_at', 'pk')
+            .values_list('project_id', 'pk')
+        )
+        cache.set(key, owned, settings.ENTITLEMENT_CACHE_TIMEOUT)
+    return owned
+
+
+def owned_project_ids(user, project_ids=None):
+    """The set of projects ``user`` owns, optionally limited to ``project_ids``."""
+    owned = owned_purchases(user)
+    if project_ids is None:
+        return set(owned)
+    return {pk for pk in project_ids if pk in owned}
+
+
+def owns(user, project_id):
+    return project_id in owned_purchases(user)
+
+
+def purchase_id_for(user, project_id):
+    """
+    Id of the purchase entitling ``user`` to ``project_id``, or None.
+    A cached miss is confirmed against the database.
+    """
+    purchase_id = owned_purchases(user).get(project_id)
+    if purchase_id is None and user is not None and user.is_authenticated:
+        purchase_id = (
+            Purchase.objects.filter(user_id=user.pk, project_id=project_id, status=Purchase.Status.PAID)
+            .order_by('-created_at', '-pk')
+            .values_list('pk', flat=True)
+            .first()
+        )
+        if purchase_id is not None:
+            # The cached mapping missed an invalidation (e.g. another process's cache)
+            invalidate(user.pk)
+    return purchase_id
+
+
+def invalidate(*user_ids):
+    """Forget the cached entitlements of ``user_ids``."""
+    for user_id in set(user_ids):
+        cache.set(_version_key(user_id), uuid.uuid4().hex, timeout=None)
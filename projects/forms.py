@@ -1,11 +1,16 @@
 from django import forms
 from django.utils.text import slugify
 from .models import ProjectMaterial
+from .uploads import completed_upload
 
 
 class ProjectMaterialAdminForm(forms.ModelForm):
     description = forms.CharField(widget=forms.Textarea(attrs={'rows': 4}), required=True)
     abstract = forms.CharField(widget=forms.Textarea(attrs={'rows': 3}), required=False)
+    # Ids of finished chunked uploads (projects/uploads.py), used instead of
+    # the file inputs so large files don't travel in this POST
+    document_upload = forms.UUIDField(required=False, widget=forms.HiddenInput)
+    software_upload = forms.UUIDField(required=False, widget=forms.HiddenInput)
 
     class Meta:
         model = ProjectMaterial
@@ -17,6 +22,28 @@ class ProjectMaterialAdminForm(forms.ModelForm):
             'software_file', 'preview_images', 'is_featured'
         ]
 
+    def __init__(self, *args, user=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Only uploads made by this user can be attached
+        self.user = user
+        # Checked in clean(): a chunked upload can stand in for the file
+        self.fields['document_file'].required = False
+
+    def clean(self):
+        cleaned_data = super().clean()
+        for field in ('document_file', 'software_file'):
+            upload_id = cleaned_data.get(field.replace('_file', '_upload'))
+            if not upload_id:
+                continue
+            stored_name = completed_upload(upload_id, field, self.user) if self.user else None
+            if stored_name is None:
+                self.add_error(field, 'The upload is unfinished or has expired; please upload the file again.')
+            else:
+                cleaned_data[field] = stored_name
+        if not cleaned_data.get('document_file') and not self.instance.document_file:
+            self.add_error('document_file', 'This field is required.')
+        return cleaned_data
+
     def clean_slug(self):
         slug = self.cleaned_data.get('slug') or ''
         title = self.cleaned_data.get('title') or ''
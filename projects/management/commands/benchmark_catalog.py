@@ -0,0 +1,184 @@
+# projects/management/commands/benchmark_catalog.py
+import random
+import statistics
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from projects.models import ProjectMaterial, Purchase, Download, Department, Category
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed N catalog rows inside a transaction, then report query plans and '
+        'timings for the hot listing queries with and without the catalog indexes. '
+        'Everything is rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000, help='Number of projects to seed')
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per query')
+        parser.add_argument('--plans', action='store_true', help='Print EXPLAIN output for every query')
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        repeat = options['repeat']
+
+        # SQLite refuses to drop indexes inside atomic() while FK checks are enabled
+        connection.disable_constraint_checking()
+        try:
+            with transaction.atomic():
+                fixtures = self._seed(rows)
+                self._analyze()
+                queries = self._queries(fixtures)
+
+                self.stdout.write(self.style.MIGRATE_HEADING('With catalog indexes'))
+                indexed = self._run(queries, repeat, options['plans'])
+
+                self._drop_indexes()
+                self._analyze()
+
+                self.stdout.write(self.style.MIGRATE_HEADING('Without catalog indexes'))
+                unindexed = self._run(queries, repeat, options['plans'])
+
+                self._report(indexed, unindexed)
+                transaction.set_rollback(True)
+        finally:
+            connection.enable_constraint_checking()
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete; seeded rows and dropped indexes were rolled back.'))
+
+    def _seed(self, rows):
+        self.stdout.write(f'Seeding {rows} projects...')
+        tag = uuid.uuid4().hex[:8]
+
+        departments = [
+            Department.objects.create(name=f'Bench Department {tag}-{i}', faculty='Bench Faculty')
+            for i in range(20)
+        ]
+        categories = [
+            Category.objects.create(name=f'Bench Category {tag}-{i}')
+            for i in range(10)
+        ]
+        user = User.objects.create_user(
+            username=f'bench-{tag}', email=f'bench-{tag}@example.com', password=None,
+        )
+
+        statuses = [ProjectMaterial.Status.APPROVED] * 8 + [ProjectMaterial.Status.PENDING, ProjectMaterial.Status.REJECTED]
+        project_types = [choice for choice, _ in ProjectMaterial.ProjectType.choices]
+        institutions = [f'Institution {i}' for i in range(50)]
+        courses = [f'CSC {i}' for i in range(100, 500, 4)]
+
+        projects = [
+            ProjectMaterial(
+                title=f'Bench project {tag} {i}',
+                slug=f'bench-project-{tag}-{i}',
+                abstract='Benchmark abstract',
+                department=random.choice(departments),
+                category=random.choice(categories),
+                institution=random.choice(institutions),
+                course=random.choice(courses),
+                year=random.randint(2000, 2025),
+                project_type=random.choice(project_types),
+                status=random.choice(statuses),
+                download_count=random.randint(0, 5000),
+                document_file='projects/documents/bench.pdf',
+            )
+            for i in range(rows)
+        ]
+        ProjectMaterial.objects.bulk_create(projects, batch_size=1000)
+
+        sample = list(
+            ProjectMaterial.objects.filter(slug__startswith=f'bench-project-{tag}-')
+            .values_list('id', flat=True)[:max(rows // 10, 1)]
+        )
+        Purchase.objects.bulk_create(
+            [
+                Purchase(
+                    user=user, project_id=project_id, amount=0,
+                    paystack_reference=f'BENCH-{tag}-{project_id}',
+                    status=Purchase.Status.PAID, paid_at=timezone.now(),
+                )
+                for project_id in sample
+            ],
+            batch_size=1000,
+        )
+        Download.objects.bulk_create(
+            [Download(user=user, project_id=project_id, download_type='document') for project_id in sample],
+            batch_size=1000,
+        )
+
+        return {
+            'user': user,
+            'department': departments[0],
+            'category': categories[0],
+            'project_id': sample[-1],
+            'course': courses[0],
+            'institution': institutions[0],
+        }
+
+    def _queries(self, fixtures):
+        approved = ProjectMaterial.objects.filter(status=ProjectMaterial.Status.APPROVED)
+        user = fixtures['user']
+        return {
+            'latest': approved.order_by('-created_at')[:12],
+            'most downloaded': approved.order_by('-download_count')[:12],
+            'by department': approved.filter(department=fixtures['department']).order_by('-created_at')[:12],
+            'by category': approved.filter(category=fixtures['category']).order_by('-created_at')[:12],
+            'by year': approved.filter(year=2020).order_by('-created_at')[:12],
+            'by project type': approved.filter(project_type='software').order_by('-created_at')[:12],
+            'by course (iexact)': approved.filter(course__iexact=fixtures['course']).order_by('-created_at')[:12],
+            'by institution (iexact)': approved.filter(
+                institution__iexact=fixtures['institution']
+            ).order_by('-created_at')[:12],
+            'moderation queue': ProjectMaterial.objects.filter(
+                status=ProjectMaterial.Status.PENDING
+            ).order_by('-created_at')[:12],
+            'purchase lookup': Purchase.objects.filter(
+                user=user, project_id=fixtures['project_id'], status=Purchase.Status.PAID,
+            )[:1],
+            'my downloads': Download.objects.filter(user=user).order_by('-downloaded_at')[:12],
+        }
+
+    def _run(self, queries, repeat, show_plans):
+        timings = {}
+        for label, queryset in queries.items():
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                list(queryset.all())
+                samples.append((time.perf_counter() - start) * 1000)
+            timings[label] = statistics.median(samples)
+            self.stdout.write(f'  {label:<26} {timings[label]:9.3f} ms')
+            if show_plans:
+                for line in queryset.explain().splitlines():
+                    self.stdout.write(f'      {line}')
+        return timings
+
+    def _drop_indexes(self):
+        with connection.cursor() as cursor:
+            for model in (ProjectMaterial, Purchase, Download):
+                for index in model._meta.indexes:
+                    cursor.execute(f'DROP INDEX {connection.ops.quote_name(index.name)}')
+
+    def _analyze(self):
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                for model in (ProjectMaterial, Purchase, Download):
+                    cursor.execute(f'ANALYZE {connection.ops.quote_name(model._meta.db_table)}')
+            elif connection.vendor == 'sqlite':
+                cursor.execute('ANALYZE')
+
+    def _report(self, indexed, unindexed):
+        self.stdout.write(self.style.MIGRATE_HEADING('Summary (median ms)'))
+        self.stdout.write(f'  {"query":<26} {"no index":>10} {"indexed":>10} {"speedup":>8}')
+        for label, after in indexed.items():
+            before = unindexed[label]
+            speedup = before / after if after else 0
+            self.stdout.write(f'  {label:<26} {before:10.3f} {after:10.3f} {speedup:7.1f}x')
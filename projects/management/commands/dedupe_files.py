@@ -0,0 +1,67 @@
+# projects/management/commands/dedupe_files.py
+import os
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from projects.models import ProjectMaterial
+from projects.storage import adopt, blob_digest, content_storage, prune, retain
+
+
+class Command(BaseCommand):
+    help = 'Move project files into content-addressed storage, collapsing duplicates'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Only report the files that would be moved'
+        )
+
+    def handle(self, *args, **options):
+        # Legacy storage name -> file fields referring to it
+        legacy = defaultdict(set)
+        for field in ProjectMaterial.FILE_FIELDS:
+            names = (
+                ProjectMaterial.objects.exclude(**{f'{field}__isnull': True}).exclude(**{field: ''})
+                .values_list(field, flat=True).distinct()
+            )
+            for name in names:
+                if not blob_digest(name):
+                    legacy[name].add(field)
+
+        moved = duplicates = missing = saved = 0
+        for name, fields in sorted(legacy.items()):
+            if not content_storage.exists(name):
+                self.stderr.write(f'Missing file: {name}')
+                missing += 1
+                continue
+            if options['dry_run']:
+                self.stdout.write(f'Would move {name}')
+                continue
+
+            size = content_storage.size(name)
+            new_name, duplicate = adopt(name)
+            with transaction.atomic():
+                # Plain UPDATEs: the files' contents are unchanged, so no reprocessing
+                references = sum(
+                    ProjectMaterial.objects.filter(**{field: name}).update(**{field: new_name})
+                    for field in fields
+                )
+                retain([new_name] * references)
+            content_storage.delete(name)
+            moved += 1
+            if duplicate:
+                duplicates += 1
+                saved += size
+            self.stdout.write(f"{name} -> {os.path.basename(new_name)}{' (duplicate)' if duplicate else ''}")
+
+        if options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f'{len(legacy) - missing} files would be moved.'))
+            return
+        pruned = prune()
+        self.stdout.write(
+            f'Moved {moved} files ({duplicates} duplicates, {saved / 1024 / 1024:.1f} MB freed), '
+            f'{missing} missing, {pruned} unreferenced blobs pruned'
+        )
+        self.stdout.write(self.style.SUCCESS('Files deduplicated.'))
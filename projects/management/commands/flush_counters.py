@@ -0,0 +1,35 @@
+# projects/management/commands/flush_counters.py
+from django.core.management.base import BaseCommand
+
+from projects.counters import flush, recount_downloads
+from projects.download_tokens import flush_download_audit
+from projects.pageviews import aggregate_views
+
+
+class Command(BaseCommand):
+    help = 'Write buffered download counters, page views and download audit records to the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--recount', action='store_true',
+            help='Also recompute every download_count exactly from the Download table'
+        )
+
+    def handle(self, *args, **options):
+        flushed = flush()
+        for field, projects in flushed.items():
+            self.stdout.write(f'{field}: updated {projects} projects')
+        if not flushed:
+            self.stdout.write('No buffered increments.')
+
+        views = aggregate_views()
+        self.stdout.write(f'Aggregated {views} page views.')
+
+        downloads = flush_download_audit()
+        self.stdout.write(f'Wrote {downloads} download audit records.')
+
+        if options['recount']:
+            updated = recount_downloads()
+            self.stdout.write(f'download_count recomputed for {updated} projects.')
+
+        self.stdout.write(self.style.SUCCESS('Counters flushed.'))
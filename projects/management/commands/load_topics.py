@@ -0,0 +1,45 @@
+# projects/management/commands/load_topics.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from projects.models import Topic
+from projects.topic_store import TOPIC_DATA_FILE, publish_topics, read_topic_file
+
+
+class Command(BaseCommand):
+    help = 'Load topic generator topics from a JSON file and rebuild the topic snapshot'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--file', default=str(TOPIC_DATA_FILE), help='Topics JSON file to load')
+        parser.add_argument(
+            '--replace', action='store_true',
+            help='Delete topics that are not in the file (default only adds missing ones)'
+        )
+        parser.add_argument(
+            '--snapshot-only', action='store_true',
+            help='Skip loading; just rebuild the snapshot from the database'
+        )
+
+    def handle(self, *args, **options):
+        if not options['snapshot_only']:
+            department_topics, default_topics = read_topic_file(options['file'])
+            wanted = {('', text) for text in default_topics}
+            for department, topics in department_topics.items():
+                wanted.update((department, text) for text in topics)
+
+            with transaction.atomic():
+                existing = set(Topic.objects.values_list('department', 'text'))
+                Topic.objects.bulk_create(
+                    [Topic(department=department, text=text) for department, text in sorted(wanted - existing)],
+                    batch_size=500,
+                )
+                self.stdout.write(f'Added {len(wanted - existing)} topics.')
+
+                if options['replace']:
+                    stale = existing - wanted
+                    for department, text in stale:
+                        Topic.objects.filter(department=department, text=text).delete()
+                    self.stdout.write(f'Removed {len(stale)} topics.')
+
+        publish_topics()
+        self.stdout.write(self.style.SUCCESS('Topic snapshot rebuilt.'))
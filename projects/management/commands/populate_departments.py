@@ -2,6 +2,7 @@
 from django.core.management.base import BaseCommand
 from projects.models import Department
 from projects.constants import FACULTY_DEPARTMENTS
+from projects.departments import invalidate_department_tree
 
 class Command(BaseCommand):
     help = 'Populate departments from constants'
@@ -25,5 +26,6 @@ class Command(BaseCommand):
                         self.stdout.write(self.style.SUCCESS(f'Updated: {dept_name} to faculty {faculty}'))
                         count += 1
 
+        invalidate_department_tree()
         self.stdout.write(self.style.SUCCESS(f'Done! Populated/Updated {count} departments.'))
         self.stdout.write(self.style.SUCCESS(f'Total departments: {Department.objects.count()}'))
@@ -0,0 +1,46 @@
+# projects/management/commands/process_documents.py
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from projects.documents import process_document
+from projects.models import ProjectMaterial
+
+
+def _process(project_id):
+    try:
+        return process_document(project_id)
+    finally:
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = 'Extract metadata and generate previews for project documents'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all', action='store_true',
+            help='Reprocess every project with a document, not just pending and unprocessed ones'
+        )
+        parser.add_argument(
+            '--workers', type=int, default=max(settings.DOCUMENT_WORKERS, 1),
+            help='Documents processed in parallel'
+        )
+
+    def handle(self, *args, **options):
+        projects = ProjectMaterial.objects.exclude(document_file='')
+        if not options['all']:
+            projects = projects.filter(processing_status__in=['', ProjectMaterial.ProcessingStatus.PENDING])
+        project_ids = list(projects.values_list('pk', flat=True))
+        # Worker threads use their own connections
+        connection.close()
+
+        with ThreadPoolExecutor(max_workers=options['workers']) as pool:
+            results = Counter(pool.map(_process, project_ids))
+        self.stdout.write(
+            f"Processed {len(project_ids)} documents: {results['done']} done, {results['failed']} failed"
+        )
+        self.stdout.write(self.style.SUCCESS('Documents processed.'))
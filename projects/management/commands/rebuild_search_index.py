@@ -0,0 +1,15 @@
+# projects/management/commands/rebuild_search_index.py
+from django.core.management.base import BaseCommand
+
+from projects.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index for all project materials'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default', help='Database alias to rebuild')
+
+    def handle(self, *args, **options):
+        count = rebuild_search_index(using=options['database'])
+        self.stdout.write(self.style.SUCCESS(f'Search index rebuilt for {count} projects.'))
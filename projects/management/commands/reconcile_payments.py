@@ -0,0 +1,49 @@
+# projects/management/commands/reconcile_payments.py
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from projects.reconciliation import CHUNK_SIZE, RATE, WORKERS, reconcile_pending
+
+
+class Command(BaseCommand):
+    help = 'Verify pending purchases against Paystack and settle the ones that completed or failed'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--min-age', type=int, default=10,
+            help='Skip purchases created less than this many minutes ago (default: 10)'
+        )
+        parser.add_argument(
+            '--max-age', type=int, default=7,
+            help='Skip purchases created more than this many days ago (default: 7)'
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=CHUNK_SIZE,
+            help=f'Purchases fetched and settled per batch (default: {CHUNK_SIZE})'
+        )
+        parser.add_argument(
+            '--workers', type=int, default=WORKERS,
+            help=f'Concurrent Paystack calls (default: {WORKERS})'
+        )
+        parser.add_argument(
+            '--rate', type=float, default=RATE,
+            help=f'Maximum Paystack calls per second, 0 for no limit (default: {RATE})'
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        summary = reconcile_pending(
+            min_age=timedelta(minutes=options['min_age']),
+            max_age=timedelta(days=options['max_age']),
+            chunk_size=options['chunk_size'],
+            workers=options['workers'],
+            rate=options['rate'],
+        )
+        self.stdout.write(
+            f"Checked {summary['checked']} pending purchases in {time.monotonic() - started:.1f}s: "
+            f"{summary['paid']} paid, {summary['failed']} failed, {summary['unchanged']} still pending, "
+            f"{summary['unknown']} unknown, {summary['errors']} errors"
+        )
+        self.stdout.write(self.style.SUCCESS('Reconciliation complete.'))
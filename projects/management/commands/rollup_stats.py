@@ -0,0 +1,22 @@
+# projects/management/commands/rollup_stats.py
+from django.core.management.base import BaseCommand
+
+from projects.stats import rollup, rollup_recent
+
+
+class Command(BaseCommand):
+    help = 'Update the precomputed admin statistics (recent and changed days, or everything)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rebuild', action='store_true',
+            help='Recompute every day and the totals from scratch'
+        )
+
+    def handle(self, *args, **options):
+        summary = rollup() if options['rebuild'] else rollup_recent()
+        self.stdout.write(
+            f'{summary.total_purchases} purchases, {summary.total_revenue} revenue, '
+            f'{summary.total_downloads} downloads ({summary.downloads_today} today)'
+        )
+        self.stdout.write(self.style.SUCCESS('Statistics rolled up.'))
@@ -0,0 +1,16 @@
+# projects/management/commands/run_background_jobs.py
+from django.core.management.base import BaseCommand
+
+from projects.scheduler import jobs, run_jobs
+
+
+class Command(BaseCommand):
+    help = (
+        'Run every periodic background job once (counters, page views, download audit, '
+        'payment settlement, stats rollup, upload purge); for cron when BACKGROUND_JOBS_INTERVAL is 0'
+    )
+
+    def handle(self, *args, **options):
+        run_jobs()
+        self.stdout.write(', '.join(job.__name__ for job in jobs()))
+        self.stdout.write(self.style.SUCCESS('Background jobs run.'))
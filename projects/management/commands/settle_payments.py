@@ -0,0 +1,16 @@
+# projects/management/commands/settle_payments.py
+from django.core.management.base import BaseCommand
+
+from projects.settlement import settle_payments
+
+
+class Command(BaseCommand):
+    help = 'Apply Paystack webhook outcomes queued in Redis to purchases (without REDIS_URL they are applied on receipt)'
+
+    def handle(self, *args, **options):
+        summary = settle_payments()
+        self.stdout.write(
+            f"Paid: {summary['paid']}, failed: {summary['failed']}, "
+            f"unchanged: {summary['unchanged']}, unknown reference: {summary['unknown']}"
+        )
+        self.stdout.write(self.style.SUCCESS('Payments settled.'))
@@ -2,6 +2,7 @@
 from django.core.management.base import BaseCommand
 from projects.models import Department
 from projects.constants import FACULTY_DEPARTMENTS
+from projects.departments import invalidate_department_tree
 
 
 class Command(BaseCommand):
@@ -52,6 +53,8 @@ class Command(BaseCommand):
             for dept in departments_without_faculty:
                 self.stdout.write(f'  - {dept.name}')
         
+        invalidate_department_tree()
+        
         self.stdout.write(
             self.style.SUCCESS(
                 f'Sync complete! Created: {total_created}, Updated: {total_updated}'
@@ -0,0 +1,113 @@
+# Generated by Django 5.0.1 on 2026-10-18 06:10
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+from projects.migrations._fts_triggers import SQLITE_CREATE_FTS_TRIGGERS, SQLITE_DROP_FTS_TRIGGERS
+
+
+POSTGRES_FORWARD = [
+    """
+    CREATE OR REPLACE FUNCTION projects_projectmaterial_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.keywords, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(
+                (SELECT name FROM projects_department WHERE id = NEW.department_id), ''
+            )), 'B') ||
+            setweight(to_tsvector('english', coalesce(NEW.abstract, '')), 'C') ||
+            setweight(to_tsvector('english', coalesce(NEW.description, '')), 'D');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE TRIGGER projects_projectmaterial_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, keywords, abstract, description, department_id
+    ON projects_projectmaterial
+    FOR EACH ROW EXECUTE FUNCTION projects_projectmaterial_search_vector_update();
+    """,
+    """
+    CREATE OR REPLACE FUNCTION projects_department_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        UPDATE projects_projectmaterial SET department_id = department_id WHERE department_id = NEW.id;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE TRIGGER projects_department_search_vector_trigger
+    AFTER UPDATE OF name ON projects_department
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION projects_department_search_vector_update();
+    """,
+    "CREATE INDEX projects_pm_search_vector_gin ON projects_projectmaterial USING gin (search_vector);",
+    "UPDATE projects_projectmaterial SET title = title;",
+]
+
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS projects_pm_search_vector_gin;",
+    "DROP TRIGGER IF EXISTS projects_department_search_vector_trigger ON projects_department;",
+    "DROP FUNCTION IF EXISTS projects_department_search_vector_update();",
+    "DROP TRIGGER IF EXISTS projects_projectmaterial_search_vector_trigger ON projects_projectmaterial;",
+    "DROP FUNCTION IF EXISTS projects_projectmaterial_search_vector_update();",
+]
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE projects_projectmaterial_fts USING fts5(
+        title, keywords, abstract, description, department,
+        tokenize = 'porter unicode61'
+    );
+    """,
+    *SQLITE_CREATE_FTS_TRIGGERS,
+    """
+    INSERT INTO projects_projectmaterial_fts (rowid, title, keywords, abstract, description, department)
+    SELECT p.id, p.title, p.keywords, p.abstract, p.description, d.name
+    FROM projects_projectmaterial p
+    LEFT JOIN projects_department d ON d.id = p.department_id;
+    """,
+]
+
+SQLITE_BACKWARD = [
+    *SQLITE_DROP_FTS_TRIGGERS,
+    "DROP TABLE IF EXISTS projects_projectmaterial_fts;",
+]
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_FORWARD)
+    elif vendor == 'sqlite':
+        _run(schema_editor, SQLITE_FORWARD)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_BACKWARD)
+    elif vendor == 'sqlite':
+        _run(schema_editor, SQLITE_BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_delete_rating'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectmaterial',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.0.1 on 2026-10-18 06:11
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_projectmaterial_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='download',
+            index=models.Index(fields=['user', '-downloaded_at'], name='download_user_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectmaterial',
+            index=models.Index(fields=['status', '-created_at'], name='pm_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectmaterial',
+            index=models.Index(condition=models.Q(('status', 'approved')), fields=['-created_at'], name='pm_approved_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectmaterial',
+            index=models.Index(condition=models.Q(('status', 'approved')), fields=['-download_count'], name='pm_approved_downloads_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectmaterial',
+            index=models.Index(condition=models.Q(('status', 'approved')), fields=['department', '-created_at'], name='pm_approved_dept_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectmaterial',
+            index=models.Index(condition=models.Q(('status', 'approved')), fields=['category', '-created_at'], name='pm_approved_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectmaterial',
+            index=models.Index(condition=models.Q(('status', 'approved')), fields=['year', '-created_at'], name='pm_approved_year_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectmaterial',
+            index=models.Index(condition=models.Q(('status', 'approved')), fields=['project_type', '-created_at'], name='pm_approved_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectmaterial',
+            index=models.Index(django.db.models.functions.text.Upper('course'), models.OrderBy(models.F('created_at'), descending=True), condition=models.Q(('status', 'approved')), name='pm_approved_course_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectmaterial',
+            index=models.Index(django.db.models.functions.text.Upper('institution'), models.OrderBy(models.F('created_at'), descending=True), condition=models.Q(('status', 'approved')), name='pm_approved_institution_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='purchase',
+            index=models.Index(fields=['user', 'project', 'status'], name='purchase_user_project_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='purchase',
+            index=models.Index(fields=['user', '-created_at'], name='purchase_user_created_idx'),
+        ),
+    ]
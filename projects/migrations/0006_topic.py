@@ -0,0 +1,48 @@
+# Generated by Django 5.0.1 on 2026-10-18 06:20
+
+import json
+from pathlib import Path
+
+from django.db import migrations, models
+
+# Seed corpus formerly hard-coded in projects/topic_data.py
+TOPIC_DATA_FILE = Path(__file__).resolve().parent.parent / 'data' / 'topics.json'
+
+
+def load_topics(apps, schema_editor):
+    Topic = apps.get_model('projects', 'Topic')
+    with open(TOPIC_DATA_FILE, encoding='utf-8') as f:
+        data = json.load(f)
+    rows = [Topic(department='', text=text) for text in data['default']]
+    for department, topics in data['departments'].items():
+        rows.extend(Topic(department=department, text=text) for text in topics)
+    Topic.objects.using(schema_editor.connection.alias).bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_catalog_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Topic',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('department', models.CharField(blank=True, db_index=True, help_text='Leave blank for generic topics offered when no department matches.', max_length=200)),
+                ('text', models.CharField(max_length=500)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['department', 'id'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='topic',
+            constraint=models.UniqueConstraint(fields=('department', 'text'), name='topic_department_text_uniq'),
+        ),
+        migrations.RunPython(load_topics, migrations.RunPython.noop),
+    ]
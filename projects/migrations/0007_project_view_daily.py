@@ -0,0 +1,32 @@
+# Generated by Django 5.0.1 on 2026-10-18 06:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_topic'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectViewDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_views', to='projects.projectmaterial')),
+            ],
+            options={
+                'verbose_name_plural': 'Project daily views',
+                'ordering': ['-date'],
+                'indexes': [models.Index(fields=['date', 'project'], name='view_daily_date_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='projectviewdaily',
+            constraint=models.UniqueConstraint(fields=('project', 'date'), name='project_view_daily_uniq'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.1 on 2026-10-18 06:28
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0007_project_view_daily'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='download',
+            name='downloaded_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
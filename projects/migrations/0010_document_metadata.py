@@ -0,0 +1,36 @@
+# Generated by Django 5.0.1 on 2026-10-18 06:37
+
+from django.db import migrations, models
+
+from projects.migrations._fts_triggers import create_sqlite_fts_triggers, drop_sqlite_fts_triggers
+
+# Adding these fields makes SQLite rebuild projects_projectmaterial, which
+# drops the FTS5 sync triggers from 0004_projectmaterial_search_vector
+# (and the department trigger would reference a missing table mid-rebuild),
+# so they are dropped first and recreated afterwards.
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0009_stats_rollup'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_sqlite_fts_triggers, create_sqlite_fts_triggers),
+        migrations.AddField(
+            model_name='projectmaterial',
+            name='chapter_headings',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='projectmaterial',
+            name='processing_status',
+            field=models.CharField(blank=True, choices=[('pending', 'Pending'), ('done', 'Done'), ('failed', 'Failed')], max_length=20),
+        ),
+        migrations.AddField(
+            model_name='projectmaterial',
+            name='word_count',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(create_sqlite_fts_triggers, drop_sqlite_fts_triggers),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.1 on 2026-10-18 06:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0010_document_metadata'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectmaterial',
+            name='document_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='projectmaterial',
+            name='preview_pages',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+    ]
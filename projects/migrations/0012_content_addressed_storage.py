@@ -0,0 +1,46 @@
+# Generated by Django 5.0.1 on 2026-10-18 06:46
+
+import projects.models
+import projects.storage
+from django.db import migrations, models
+
+from projects.migrations._fts_triggers import create_sqlite_fts_triggers, drop_sqlite_fts_triggers
+
+# Altering the file fields rebuilds projects_projectmaterial on SQLite; the
+# FTS triggers are dropped and recreated around it as in 0010.
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0011_document_previews'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('size', models.BigIntegerField(default=0)),
+                ('ref_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.RunPython(drop_sqlite_fts_triggers, create_sqlite_fts_triggers),
+        migrations.AlterField(
+            model_name='projectmaterial',
+            name='document_file',
+            field=models.FileField(storage=projects.storage.ContentAddressedStorage(), upload_to=projects.models.ProjectMaterial.project_file_path, verbose_name='Project Document (PDF/DOC)'),
+        ),
+        migrations.AlterField(
+            model_name='projectmaterial',
+            name='preview_images',
+            field=models.ImageField(blank=True, help_text='Preview/screenshot of the project', null=True, storage=projects.storage.ContentAddressedStorage(), upload_to='projects/previews/'),
+        ),
+        migrations.AlterField(
+            model_name='projectmaterial',
+            name='software_file',
+            field=models.FileField(blank=True, null=True, storage=projects.storage.ContentAddressedStorage(), upload_to=projects.models.ProjectMaterial.software_file_path, verbose_name='Software/Source Code (ZIP)'),
+        ),
+        migrations.RunPython(create_sqlite_fts_triggers, drop_sqlite_fts_triggers),
+    ]
@@ -0,0 +1,70 @@
+# projects/migrations/_fts_triggers.py
+"""
+SQLite FTS5 sync triggers of ``projects_projectmaterial_fts``, shared by
+the migrations that create them (0004) or rebuild the table under them
+(0010, 0012). The loader skips modules starting with "_", so this is
+not a migration itself.
+
+Applied migrations run this code again on a fresh database or when
+migrating backwards, so it is frozen: never edit it. A later change to
+the triggers gets its own migration with its own copy of the SQL.
+"""
+
+FTS_TABLE = 'projects_projectmaterial_fts'
+
+SQLITE_DROP_FTS_TRIGGERS = [
+    "DROP TRIGGER IF EXISTS projects_department_fts_rename;",
+    "DROP TRIGGER IF EXISTS projects_projectmaterial_fts_delete;",
+    "DROP TRIGGER IF EXISTS projects_projectmaterial_fts_update;",
+    "DROP TRIGGER IF EXISTS projects_projectmaterial_fts_insert;",
+]
+
+SQLITE_CREATE_FTS_TRIGGERS = [
+    """
+    CREATE TRIGGER projects_projectmaterial_fts_insert AFTER INSERT ON projects_projectmaterial BEGIN
+        INSERT INTO projects_projectmaterial_fts (rowid, title, keywords, abstract, description, department)
+        VALUES (new.id, new.title, new.keywords, new.abstract, new.description,
+                (SELECT name FROM projects_department WHERE id = new.department_id));
+    END;
+    """,
+    """
+    CREATE TRIGGER projects_projectmaterial_fts_update
+    AFTER UPDATE OF title, keywords, abstract, description, department_id ON projects_projectmaterial BEGIN
+        DELETE FROM projects_projectmaterial_fts WHERE rowid = old.id;
+        INSERT INTO projects_projectmaterial_fts (rowid, title, keywords, abstract, description, department)
+        VALUES (new.id, new.title, new.keywords, new.abstract, new.description,
+                (SELECT name FROM projects_department WHERE id = new.department_id));
+    END;
+    """,
+    """
+    CREATE TRIGGER projects_projectmaterial_fts_delete AFTER DELETE ON projects_projectmaterial BEGIN
+        DELETE FROM projects_projectmaterial_fts WHERE rowid = old.id;
+    END;
+    """,
+    """
+    CREATE TRIGGER projects_department_fts_rename AFTER UPDATE OF name ON projects_department BEGIN
+        UPDATE projects_projectmaterial_fts SET department = new.name
+        WHERE rowid IN (SELECT id FROM projects_projectmaterial WHERE department_id = new.id);
+    END;
+    """,
+]
+
+
+def _fts_table_exists(connection):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+        return cursor.fetchone() is not None
+
+
+def drop_sqlite_fts_triggers(apps, schema_editor):
+    """RunPython callable: drop the SQLite FTS sync triggers before a table rebuild."""
+    if schema_editor.connection.vendor == 'sqlite':
+        for statement in SQLITE_DROP_FTS_TRIGGERS:
+            schema_editor.execute(statement)
+
+
+def create_sqlite_fts_triggers(apps, schema_editor):
+    """RunPython callable: recreate the SQLite FTS sync triggers after a table rebuild."""
+    if schema_editor.connection.vendor == 'sqlite' and _fts_table_exists(schema_editor.connection):
+        for statement in SQLITE_CREATE_FTS_TRIGGERS:
+            schema_editor.execute(statement)
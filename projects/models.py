@@ -2,10 +2,16 @@
 import os
 import uuid
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.functions import Upper
+from django.contrib.postgres.search import SearchVectorField
+from django.utils import timezone
 from django.utils.text import slugify
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from .storage import content_storage
+
 User = get_user_model()
 
 
@@ -56,6 +62,11 @@ class ProjectMaterial(models.Model):
         SOFTWARE = 'software', 'Software Project'
         BOTH = 'both', 'Documentation + Software'
     
+    class ProcessingStatus(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        DONE = 'done', 'Done'
+        FAILED = 'failed', 'Failed'
+    
     # Basic Information
     title = models.CharField(max_length=500)
     slug = models.SlugField(max_length=500, unique=True, blank=True)
@@ -95,18 +106,23 @@ class ProjectMaterial(models.Model):
         filename = f"{slugify(instance.title)}-software-{uuid.uuid4().hex[:8]}.{ext}"
         return f'projects/software/{filename}'
     
+    # Stored content-addressed and deduplicated (projects/storage.py); upload_to
+    # only contributes the extension
     document_file = models.FileField(
         upload_to=project_file_path,
+        storage=content_storage,
         verbose_name="Project Document (PDF/DOC)"
     )
     software_file = models.FileField(
         upload_to=software_file_path,
+        storage=content_storage,
         blank=True,
         null=True,
         verbose_name="Software/Source Code (ZIP)"
     )
     preview_images = models.ImageField(
         upload_to='projects/previews/',
+        storage=content_storage,
         blank=True,
         null=True,
         help_text="Preview/screenshot of the project"
@@ -133,6 +149,20 @@ class ProjectMaterial(models.Model):
     # Document Metadata
     page_count = models.IntegerField(null=True, blank=True, help_text="Number of pages in the document")
     file_format = models.CharField(max_length=50, null=True, blank=True, help_text="File format (e.g. PDF, DOCX)")
+    word_count = models.PositiveIntegerField(null=True, blank=True)
+    chapter_headings = models.JSONField(default=list, blank=True)
+    # SHA-256 of the document; locates its preview derivatives (projects/previews.py)
+    document_hash = models.CharField(max_length=64, null=True, blank=True, editable=False)
+    preview_pages = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+    # Set to pending when a new document is uploaded; see projects/documents.py
+    processing_status = models.CharField(
+        max_length=20,
+        choices=ProcessingStatus.choices,
+        blank=True
+    )
+    
+    # Full-text search (PostgreSQL only; maintained by a database trigger, see projects/search.py)
+    search_vector = SearchVectorField(null=True, editable=False)
     
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
@@ -157,15 +187,82 @@ class ProjectMaterial(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Admin listings and moderation queues filter on status first
+            models.Index(fields=['status', '-created_at'], name='pm_status_created_idx'),
+            # Catalog listings only ever show approved projects, so keep these partial
+            models.Index(
+                fields=['-created_at'], name='pm_approved_created_idx',
+                condition=Q(status='approved'),
+            ),
+            models.Index(
+                fields=['-download_count'], name='pm_approved_downloads_idx',
+                condition=Q(status='approved'),
+            ),
+            models.Index(
+                fields=['department', '-created_at'], name='pm_approved_dept_idx',
+                condition=Q(status='approved'),
+            ),
+            models.Index(
+                fields=['category', '-created_at'], name='pm_approved_category_idx',
+                condition=Q(status='approved'),
+            ),
+            models.Index(
+                fields=['year', '-created_at'], name='pm_approved_year_idx',
+                condition=Q(status='approved'),
+            ),
+            models.Index(
+                fields=['project_type', '-created_at'], name='pm_approved_type_idx',
+                condition=Q(status='approved'),
+            ),
+            # course/institution are matched with iexact (UPPER() on PostgreSQL)
+            models.Index(
+                Upper('course'), F('created_at').desc(), name='pm_approved_course_idx',
+                condition=Q(status='approved'),
+            ),
+            models.Index(
+                Upper('institution'), F('created_at').desc(), name='pm_approved_institution_idx',
+                condition=Q(status='approved'),
+            ),
+        ]
+    
+    # File fields whose stored files are reference-counted (projects/storage.py)
+    FILE_FIELDS = ('document_file', 'software_file', 'preview_images')
     
     def __str__(self):
         return self.title
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored files so replacement uploads can be detected
+        instance._loaded_files = {
+            field: values[field_names.index(field)] or ''
+            for field in cls.FILE_FIELDS if field in field_names
+        }
+        return instance
+    
+    def file_names(self):
+        """``{field: stored name}`` of the file fields (empty string for no file)."""
+        return {field: getattr(self, field).name or '' for field in self.FILE_FIELDS}
+    
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
         super().save(*args, **kwargs)
     
+    @property
+    def document_changed(self):
+        """Whether a document was uploaded since this instance was loaded (or created)."""
+        if self._state.adding:
+            return bool(self.document_file)
+        loaded = getattr(self, '_loaded_files', {}).get('document_file')
+        return loaded is not None and (self.document_file.name or '') != loaded
+    
+    @property
+    def chapters(self):
+        return len(self.chapter_headings or [])
+    
     @property
     def has_software(self):
         return bool(self.software_file)
@@ -176,8 +273,9 @@ class ProjectMaterial(models.Model):
         return []
     
     def increment_download_count(self):
-        self.download_count += 1
-        self.save(update_fields=['download_count'])
+        # Buffered and flushed in batches (see projects/counters.py)
+        from .counters import increment
+        increment(self.pk, 'download_count')
 
 
 class Purchase(models.Model):
@@ -205,6 +303,11 @@ class Purchase(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'project', 'status'], name='purchase_user_project_idx'),
+            models.Index(fields=['user', '-created_at'], name='purchase_user_created_idx'),
+            models.Index(fields=['status', 'paid_at'], name='purchase_status_paid_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user} - {self.project} - {self.amount}"
@@ -226,10 +329,163 @@ class Download(models.Model):
         max_length=20,
         choices=[('document', 'Document Only'), ('software', 'Software Only'), ('both', 'Both')]
     )
-    downloaded_at = models.DateTimeField(auto_now_add=True)
+    # Set from the audit record when written in batches (projects/download_tokens.py)
+    downloaded_at = models.DateTimeField(default=timezone.now)
     
     class Meta:
         ordering = ['-downloaded_at']
+        indexes = [
+            models.Index(fields=['user', '-downloaded_at'], name='download_user_date_idx'),
+            models.Index(fields=['downloaded_at'], name='download_date_idx'),
+        ]
     
     def __str__(self):
-        return f"{self.user} downloaded {self.project}"
\ No newline at end of file
+        return f"{self.user} downloaded {self.project}"
+
+class Topic(models.Model):
+    """Project topic suggestion used by the topic generator"""
+    department = models.CharField(
+        max_length=200, blank=True, db_index=True,
+        help_text='Leave blank for generic topics offered when no department matches.'
+    )
+    text = models.CharField(max_length=500)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['department', 'id']
+        constraints = [
+            models.UniqueConstraint(fields=['department', 'text'], name='topic_department_text_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.department or 'Generic'}: {self.text}"
+
+
+class ProjectViewDaily(models.Model):
+    """Project detail page views per day (rolled up by projects/pageviews.py)"""
+    project = models.ForeignKey(ProjectMaterial, on_delete=models.CASCADE, related_name='daily_views')
+    date = models.DateField()
+    views = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['-date']
+        verbose_name_plural = "Project daily views"
+        constraints = [
+            models.UniqueConstraint(fields=['project', 'date'], name='project_view_daily_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['date', 'project'], name='view_daily_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.project} - {self.date}: {self.views}"
+
+
+class DailyStats(models.Model):
+    """Sales and downloads per day and department (rolled up by projects/stats.py)"""
+    date = models.DateField()
+    # Null once the department is deleted; its history stays in the totals
+    department = models.ForeignKey(
+        Department, on_delete=models.SET_NULL, null=True, blank=True, related_name='daily_stats'
+    )
+    purchases = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    downloads = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['-date']
+        verbose_name_plural = "Daily stats"
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'department'], name='daily_stats_date_dept_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.department or '-'}: {self.purchases} sales, {self.downloads} downloads"
+
+
+class UploadSession(models.Model):
+    """A chunked, resumable upload of a project file (see projects/uploads.py)"""
+    
+    class Status(models.TextChoices):
+        UPLOADING = 'uploading', 'Uploading'
+        ASSEMBLING = 'assembling', 'Assembling'
+        COMPLETE = 'complete', 'Complete'
+        FAILED = 'failed', 'Failed'
+    
+    class Field(models.TextChoices):
+        DOCUMENT = 'document_file', 'Document'
+        SOFTWARE = 'software_file', 'Software'
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='upload_sessions')
+    # Attached to this project on completion; without one, the upload is
+    # referenced from the project form instead
+    project = models.ForeignKey(
+        ProjectMaterial, on_delete=models.CASCADE, null=True, blank=True, related_name='upload_sessions'
+    )
+    field = models.CharField(max_length=20, choices=Field.choices)
+    filename = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    chunk_size = models.PositiveIntegerField()
+    # Optional checksum of the whole file, checked on completion
+    sha256 = models.CharField(max_length=64, blank=True)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.UPLOADING)
+    stored_name = models.CharField(max_length=255, blank=True)
+    # Why assembling failed (status failed)
+    error = models.CharField(max_length=255, blank=True)
+    # When completion was requested; see uploads.ASSEMBLY_TIMEOUT
+    assembly_started_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField()
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['expires_at'], name='upload_expires_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.filename} ({self.status})"
+    
+    @property
+    def total_parts(self):
+        return max(-(-self.size // self.chunk_size), 1)
+    
+    def part_size(self, index):
+        """Expected size in bytes of part ``index``."""
+        if index == self.total_parts - 1:
+            return self.size - index * self.chunk_size
+        return self.chunk_size
+
+
+class ContentBlob(models.Model):
+    """A content-addressed stored file and how many file fields reference it"""
+    name = models.CharField(max_length=255, unique=True)
+    size = models.BigIntegerField(default=0)
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} references)"
+
+
+class StatsSummary(models.Model):
+    """Admin dashboard figures maintained by the stats rollup (a single row)"""
+    total_projects = models.PositiveIntegerField(default=0)
+    pending_projects = models.PositiveIntegerField(default=0)
+    total_users = models.PositiveIntegerField(default=0)
+    active_users = models.PositiveIntegerField(default=0)
+    total_purchases = models.PositiveIntegerField(default=0)
+    total_revenue = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    total_downloads = models.PositiveIntegerField(default=0)
+    # downloads_today counts downloads on this date
+    date = models.DateField(null=True, blank=True)
+    downloads_today = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "Stats summary"
+
+    def __str__(self):
+        return f"Stats as of {self.updated_at}"
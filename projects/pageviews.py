@@ -0,0 +1,106 @@
+# projects/pageviews.py
+"""
+Project detail page view tracking.
+
+Recording a view never writes to the database:
+
+1. A visitor (user, session or IP + user agent) counts once per project per
+   VIEW_DEDUP_WINDOW seconds; the window is a ``cache.add`` key.
+2. Counted views are appended to the ``pageviews`` event log (a Redis list
+   shared by every worker, or an in-process list; see projects/buffers.py).
+3. ``aggregate_views`` drains the log and rolls the events up into
+   ``ProjectMaterial.view_count`` and the ``ProjectViewDaily`` time series.
+   It runs as a background job (projects/scheduler.py) and from
+   ``manage.py flush_counters``.
+"""
+import datetime
+import hashlib
+import logging
+import re
+from collections import Counter
+
+import redis
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from .buffers import get_event_log
+from .counters import apply_counts
+from .models import ProjectMaterial, ProjectViewDaily
+
+logger = logging.getLogger(__name__)
+
+_BOT_RE = re.compile(r'bot|crawl|spider|slurp|preview', re.IGNORECASE)
+
+
+def _visitor_id(request):
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return f'user:{user.pk}'
+    session_key = getattr(getattr(request, 'session', None), 'session_key', None)
+    if session_key:
+        return f'session:{session_key}'
+    raw = f"{request.META.get('REMOTE_ADDR', '')}|{request.META.get('HTTP_USER_AGENT', '')}"
+    return 'anon:' + hashlib.sha1(raw.encode()).hexdigest()
+
+
+def record_view(request, project_id):
+    """Count a detail page view unless this visitor was already counted recently."""
+    if _BOT_RE.search(request.META.get('HTTP_USER_AGENT', '')):
+        return False
+    try:
+        key = f'pageview:{project_id}:{_visitor_id(request)}'
+        if not cache.add(key, 1, timeout=settings.VIEW_DEDUP_WINDOW):
+            return False
+        get_event_log('pageviews').append([project_id, timezone.localdate().isoformat()])
+    except redis.RedisError as e:
+        # Tracking must never break the page
+        logger.warning(f"Could not record view of project {project_id}: {e}")
+        return False
+    return True
+
+
+def aggregate_views():
+    """Roll buffered views into view_count and ProjectViewDaily; returns the number of views."""
+    log = get_event_log('pageviews')
+    events = log.drain()
+    if not events:
+        return 0
+
+    daily = Counter((pk, datetime.date.fromisoformat(date)) for pk, date in events)
+    try:
+        # Projects deleted since the view was recorded are skipped
+        existing = set(
+            ProjectMaterial.objects.filter(pk__in={pk for pk, _ in daily}).values_list('pk', flat=True)
+        )
+        daily = {(pk, date): views for (pk, date), views in daily.items() if pk in existing}
+        totals = Counter()
+        by_date = {}
+        for (pk, date), views in daily.items():
+            totals[pk] += views
+            by_date.setdefault(date, {})[pk] = views
+
+        with transaction.atomic():
+            apply_counts('view_count', totals)
+            ProjectViewDaily.objects.bulk_create(
+                [ProjectViewDaily(project_id=pk, date=date) for pk, date in daily],
+                ignore_conflicts=True,
+            )
+            for date, counts in by_date.items():
+                apply_counts('views', counts, ProjectViewDaily.objects.filter(date=date), key='project_id')
+    except Exception:
+        log.restore(events)
+        raise
+    return sum(daily.values())
+
+
+def trending_projects(days=7):
+    """Approved projects ordered by detail views over the last ``days`` days."""
+    since = timezone.localdate() - datetime.timedelta(days=days - 1)
+    return (
+        ProjectMaterial.objects.filter(status=ProjectMaterial.Status.APPROVED, daily_views__date__gte=since)
+        .annotate(recent_views=Sum('daily_views__views'))
+        .order_by('-recent_views', '-id')
+    )
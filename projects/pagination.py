@@ -0,0 +1,218 @@
+# projects/pagination.py
+"""
+Keyset (cursor) pagination for the project catalog.
+
+Offset pagination runs ``COUNT(*)`` plus ``OFFSET n`` on every page, which
+gets slower the deeper a client goes. Keyset pagination instead remembers
+the sort key of the last row it returned and asks for rows after it, so
+page 500 costs the same as page 1 when the ordering is backed by an index.
+
+Cursors are opaque URL-safe strings; clients must not build them by hand.
+"""
+import base64
+import binascii
+import datetime
+import decimal
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+# Upper bound for the exact-but-capped count used where no planner estimate exists
+APPROXIMATE_COUNT_CAP = 10000
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    return value
+
+
+def approximate_count(queryset):
+    """
+    Cheap row-count estimate for a queryset.
+
+    On PostgreSQL this reads the planner's row estimate from ``EXPLAIN``
+    (no table scan). Elsewhere it counts at most ``APPROXIMATE_COUNT_CAP``
+    rows.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor == 'postgresql':
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+    return queryset.order_by()[:APPROXIMATE_COUNT_CAP].count()
+
+
+class KeysetPage:
+    """One page of keyset results; mirrors the parts of Django's Page the templates use."""
+
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Paginate ``queryset`` by ``ordering`` (a single field name, optionally
+    prefixed with ``-``) with ``id`` as the tie-breaker.
+    """
+
+    def __init__(self, queryset, ordering, per_page):
+        self.queryset = queryset
+        self.per_page = per_page
+        descending = ordering.startswith('-')
+        field = ordering.lstrip('-')
+        self.keys = [(field, descending)]
+        if field != 'id':
+            self.keys.append(('id', descending))
+
+    def _order_by(self, reverse):
+        return [
+            f'-{field}' if descending != reverse else field
+            for field, descending in self.keys
+        ]
+
+    def _after(self, values, reverse):
+        """Q() selecting rows strictly after ``values`` in the (possibly reversed) ordering."""
+        condition = Q()
+        for i, (field, descending) in enumerate(self.keys):
+            lookup = 'lt' if descending != reverse else 'gt'
+            step = Q(**{f'{field}__{lookup}': values[i]})
+            for j, (previous_field, _) in enumerate(self.keys[:i]):
+                step &= Q(**{previous_field: values[j]})
+            condition |= step
+        return condition
+
+    def encode_cursor(self, obj, reverse):
+        values = [_encode_value(getattr(obj, field)) for field, _ in self.keys]
+        payload = json.dumps({'v': values, 'r': int(reverse)}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+            raw_values = payload['v']
+            reverse = bool(payload['r'])
+            if len(raw_values) != len(self.keys):
+                raise InvalidCursor('Cursor does not match the requested ordering.')
+            opts = self.queryset.model._meta
+            values = [
+                opts.get_field(field).to_python(value)
+                for (field, _), value in zip(self.keys, raw_values)
+            ]
+        except InvalidCursor:
+            raise
+        except (TypeError, ValueError, KeyError, ValidationError, binascii.Error) as e:
+            raise InvalidCursor('Invalid cursor.') from e
+        return values, reverse
+
+    def get_page(self, cursor=None):
+        reverse = False
+        queryset = self.queryset
+        if cursor:
+            values, reverse = self.decode_cursor(cursor)
+            queryset = queryset.filter(self._after(values, reverse))
+
+        rows = list(queryset.order_by(*self._order_by(reverse))[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if reverse:
+            rows.reverse()
+
+        if not rows:
+            return KeysetPage([], None, None)
+
+        if reverse:
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, bool(cursor)
+
+        return KeysetPage(
+            rows,
+            self.encode_cursor(rows[-1], reverse=False) if has_next else None,
+            self.encode_cursor(rows[0], reverse=True) if has_previous else None,
+        )
+
+
+class CatalogPagination(PageNumberPagination):
+    """
+    Page-number pagination by default; switches to keyset pagination when the
+    request carries ``?cursor=`` (use an empty value for the first page).
+
+    In cursor mode no ``COUNT(*)`` is run. Pass ``?count=approximate`` to get
+    a cheap estimate in the response instead.
+    """
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = False
+        ordering = view.get_ordering() if view is not None and hasattr(view, 'get_ordering') else None
+        if self.cursor_query_param not in request.query_params or not ordering:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.cursor_mode = True
+        self.request = request
+        paginator = KeysetPaginator(queryset, ordering, self.get_page_size(request))
+        try:
+            self.keyset_page = paginator.get_page(request.query_params.get(self.cursor_query_param))
+        except InvalidCursor as e:
+            raise NotFound(str(e))
+
+        self.approximate_count = None
+        if request.query_params.get(self.count_query_param) == 'approximate':
+            self.approximate_count = approximate_count(queryset)
+        return list(self.keyset_page.object_list)
+
+    def _cursor_link(self, cursor):
+        if cursor is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+        payload = OrderedDict([
+            ('next', self._cursor_link(self.keyset_page.next_cursor)),
+            ('previous', self._cursor_link(self.keyset_page.previous_cursor)),
+        ])
+        if self.approximate_count is not None:
+            payload['count'] = self.approximate_count
+            payload['count_is_approximate'] = True
+        payload['results'] = data
+        return Response(payload)
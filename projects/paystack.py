@@ -0,0 +1,178 @@
+# projects/paystack.py
+"""
+Paystack API client.
+
+All calls go through one ``requests.Session`` per process, so connections
+to Paystack are kept alive and reused instead of paying a TCP + TLS
+handshake per payment. The connection pool is bounded
+(PAYSTACK_POOL_SIZE); when it is exhausted, callers wait for a free
+connection rather than opening extra ones.
+
+Timeouts are split into connect and read (PAYSTACK_CONNECT_TIMEOUT,
+PAYSTACK_READ_TIMEOUT) and kept short so a slow Paystack cannot tie up a
+worker for long. Failed calls are retried with exponential backoff
+(PAYSTACK_MAX_RETRIES):
+
+* GET (verify) is retried on connection errors, read errors and
+  429/5xx responses, honouring ``Retry-After`` but never waiting longer
+  than MAX_RETRY_AFTER seconds, so a large header can't hold the worker;
+* POST (initialize) is only retried when the connection could not be
+  established, i.e. when Paystack cannot have seen the request.
+
+``AsyncPaystackClient`` exposes the same calls as coroutines for async
+views; they run the pooled client on a worker thread.
+
+``valid_signature`` checks the ``X-Paystack-Signature`` of webhook calls.
+"""
+import hashlib
+import hmac
+import logging
+import threading
+from urllib.parse import quote
+
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+BACKOFF_FACTOR = 0.3
+# Longest ``Retry-After`` wait before a retry, in seconds
+MAX_RETRY_AFTER = 2
+
+
+class PaystackError(Exception):
+    """Paystack could not be reached or did not accept the request."""
+
+    def __init__(self, message, response=None):
+        super().__init__(message)
+        # Decoded Paystack response body, when there was one
+        self.response = response
+
+
+class CappedRetry(Retry):
+    """Retry that waits at most MAX_RETRY_AFTER seconds for a ``Retry-After`` header."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+class PaystackClient:
+    def __init__(self, secret_key, base_url, connect_timeout=3.05, read_timeout=10,
+                 max_retries=2, pool_size=10):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = (connect_timeout, read_timeout)
+        retry = CappedRetry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            other=0,
+            allowed_methods=frozenset({'GET'}),
+            status_forcelist=RETRY_STATUSES,
+            backoff_factor=BACKOFF_FACTOR,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size, pool_block=True, max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Authorization': f'Bearer {secret_key}',
+            'Accept': 'application/json',
+        })
+
+    def _request(self, method, path, **kwargs):
+        try:
+            resp = self.session.request(method, f'{self.base_url}{path}', timeout=self.timeout, **kwargs)
+        except requests.RequestException as e:
+            logger.warning(f"Paystack {method} {path} failed: {e}")
+            raise PaystackError(f'Could not reach Paystack: {e}') from e
+        try:
+            payload = resp.json()
+        except ValueError:
+            raise PaystackError(f'Invalid response from Paystack (HTTP {resp.status_code}).')
+        if resp.status_code != 200 or not payload.get('status'):
+            raise PaystackError(payload.get('message') or 'Paystack rejected the request.', payload)
+        return payload['data']
+
+    def initialize_transaction(self, email, amount, reference, callback_url=None, metadata=None):
+        """Start a transaction; returns Paystack's ``data`` (``authorization_url``, ``reference``, ...)."""
+        data = {'email': email, 'amount': amount, 'reference': reference}
+        if callback_url:
+            data['callback_url'] = callback_url
+        if metadata:
+            data['metadata'] = metadata
+        return self._request('POST', '/transaction/initialize', json=data)
+
+    def verify_transaction(self, reference):
+        """Transaction details for ``reference``; ``data['status']`` is ``'success'`` once paid."""
+        return self._request('GET', f"/transaction/verify/{quote(reference, safe='')}")
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncPaystackClient:
+    """Coroutine wrapper sharing a ``PaystackClient``'s connection pool."""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def initialize_transaction(self, *args, **kwargs):
+        return await sync_to_async(self.client.initialize_transaction, thread_sensitive=False)(*args, **kwargs)
+
+    async def verify_transaction(self, reference):
+        return await sync_to_async(self.client.verify_transaction, thread_sensitive=False)(reference)
+
+
+def valid_signature(body, signature, secret_key=None):
+    """Whether ``signature`` is the HMAC-SHA512 of the raw webhook ``body`` under the secret key."""
+    secret_key = secret_key or settings.PAYSTACK_SECRET_KEY
+    if not secret_key or not signature:
+        return False
+    expected = hmac.new(secret_key.encode(), body, hashlib.sha512).hexdigest()
+    return hmac.compare_digest(expected.encode(), signature.encode())
+
+
+_client = None
+_client_config = None
+_lock = threading.Lock()
+
+
+def _settings_config():
+    return (
+        settings.PAYSTACK_SECRET_KEY,
+        settings.PAYSTACK_BASE_URL,
+        settings.PAYSTACK_CONNECT_TIMEOUT,
+        settings.PAYSTACK_READ_TIMEOUT,
+        settings.PAYSTACK_MAX_RETRIES,
+        settings.PAYSTACK_POOL_SIZE,
+    )
+
+
+def get_client():
+    """The process-wide client, rebuilt if the PAYSTACK_* settings change."""
+    global _client, _client_config
+    config = _settings_config()
+    if _client is None or _client_config != config:
+        with _lock:
+            if _client is None or _client_config != config:
+                if _client is not None:
+                    _client.close()
+                _client = PaystackClient(*config)
+                _client_config = config
+    return _client
+
+
+def get_async_client():
+    return AsyncPaystackClient(get_client())
@@ -0,0 +1,225 @@
+# projects/previews.py
+"""
+Preview derivatives of project documents: page thumbnails and a short
+HTML excerpt of the first PREVIEW_PAGES pages.
+
+Derivatives are generated by the document worker (projects/documents.py)
+right after metadata extraction and stored under the SHA-256 of the
+document's content::
+
+    previews/<first 2 hex digits>/<sha256>/page-1.png
+                                          /page-2.png
+                                          /excerpt.html
+                                          /manifest.json
+
+so identical uploads (the same thesis submitted twice, a re-upload of an
+unchanged file) share one set of derivatives; ``manifest.json`` is
+written last and marks a set as complete, so existing sets are reused
+without rendering anything. A derivative's content never changes for a
+given path, so ``asset_response`` serves them as immutable, publicly
+cacheable assets and browsing never opens the original document.
+
+Thumbnails are drawn with Pillow from the text of each page (PDF: pypdf's
+page text; DOCX: the paragraphs up to each page break Word recorded), not
+rasterized, so figures and layout are not reproduced.
+"""
+import html
+import io
+import json
+import os
+import re
+import textwrap
+import zipfile
+from xml.etree import ElementTree
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from PIL import Image, ImageDraw, ImageFont
+from pypdf import PdfReader
+
+from .storage import blob_digest, hash_file
+
+PREVIEW_ROOT = 'previews'
+
+# Pages are laid out at A4 size in points, then scaled down
+PAGE_SIZE = (595, 842)
+PAGE_MARGIN = 56
+FONT_SIZE = 11
+LINE_HEIGHT = 15
+THUMBNAIL_SIZE = (300, 424)
+
+# DOCX text without page breaks is split into pages of this many words
+PAGE_WORDS = 450
+EXCERPT_WORDS = 200
+
+ASSET_NAME_RE = re.compile(r'^(page-\d{1,2}\.png|excerpt\.html)$')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+def asset_path(digest, name):
+    return f'{PREVIEW_ROOT}/{digest[:2]}/{digest}/{name}'
+
+
+def _paragraphs(text):
+    """Paragraphs of extracted page text (blank-line separated, line breaks kept)."""
+    return [p.strip('\n') for p in re.split(r'\n\s*\n', text) if p.strip()]
+
+
+def pdf_pages(file, pages):
+    """Text of the first ``pages`` pages of a PDF, as lists of paragraphs."""
+    reader = PdfReader(file, strict=False)
+    return [_paragraphs(page.extract_text() or '') for page in reader.pages[:pages]]
+
+
+def docx_pages(file, pages):
+    """
+    Text of the first ``pages`` pages of a DOCX, as lists of paragraphs.
+
+    Pages end at explicit page breaks and at the breaks Word rendered on
+    its last save, or after PAGE_WORDS words. Parsing stops once enough
+    pages were read.
+    """
+    with zipfile.ZipFile(file) as archive, archive.open('word/document.xml') as f:
+        result = [[]]
+        words = 0
+        for _, elem in ElementTree.iterparse(f):
+            if elem.tag != f'{_W}p':
+                continue
+            page_break = elem.find(f'.//{_W}lastRenderedPageBreak') is not None or any(
+                br.get(f'{_W}type') == 'page' for br in elem.iter(f'{_W}br')
+            )
+            text = ''.join(t.text or '' for t in elem.iter(f'{_W}t')).strip()
+            elem.clear()
+            if (page_break or words >= PAGE_WORDS) and result[-1]:
+                if len(result) == pages:
+                    break
+                result.append([])
+                words = 0
+            if text:
+                result[-1].append(text)
+                words += len(text.split())
+    return [page for page in result if page]
+
+
+PAGE_READERS = {
+    '.pdf': pdf_pages,
+    '.docx': docx_pages,
+}
+
+
+def _font():
+    try:
+        return ImageFont.load_default(size=FONT_SIZE)
+    except (TypeError, OSError):
+        # Pillow without FreeType: fixed-size bitmap font
+        return ImageFont.load_default()
+
+
+def render_thumbnail(paragraphs):
+    """PNG bytes of a page thumbnail showing ``paragraphs``."""
+    width, height = PAGE_SIZE
+    image = Image.new('L', PAGE_SIZE, 255)
+    draw = ImageDraw.Draw(image)
+    font = _font()
+    columns = max(int((width - 2 * PAGE_MARGIN) / max(font.getlength('n'), 1)), 20)
+
+    y = PAGE_MARGIN
+    for paragraph in paragraphs:
+        for line in paragraph.splitlines():
+            for wrapped in textwrap.wrap(line, columns) or ['']:
+                if y + LINE_HEIGHT > height - PAGE_MARGIN:
+                    break
+                draw.text((PAGE_MARGIN, y), wrapped, fill=40, font=font)
+                y += LINE_HEIGHT
+        y += LINE_HEIGHT // 2
+
+    image.thumbnail(THUMBNAIL_SIZE, Image.LANCZOS)
+    output = io.BytesIO()
+    image.save(output, 'PNG', optimize=True)
+    return output.getvalue()
+
+
+def excerpt_html(pages, words=EXCERPT_WORDS):
+    """HTML paragraphs with the first ``words`` words of ``pages``."""
+    parts = []
+    remaining = words
+    for paragraph in (p for page in pages for p in page):
+        tokens = paragraph.split()
+        if not tokens:
+            continue
+        text = ' '.join(tokens[:remaining])
+        if len(tokens) > remaining:
+            text += '…'
+        parts.append(f'<p>{html.escape(text)}</p>')
+        remaining -= len(tokens)
+        if remaining <= 0:
+            break
+    return '\n'.join(parts)
+
+
+def _save(name, content):
+    # Paths are content-addressed: an existing file already has this content
+    if not default_storage.exists(name):
+        default_storage.save(name, ContentFile(content))
+
+
+def generate(file, name):
+    """
+    Ensure derivatives exist for the document in ``file`` (named ``name``);
+    returns ``{'document_hash', 'preview_pages'}`` for the project.
+    """
+    # Content-addressed documents (projects/storage.py) are named by their hash
+    digest = blob_digest(name) or hash_file(file)
+    manifest_name = asset_path(digest, 'manifest.json')
+    if default_storage.exists(manifest_name):
+        with default_storage.open(manifest_name, 'rb') as f:
+            manifest = json.load(f)
+        return {'document_hash': digest, 'preview_pages': manifest['pages']}
+
+    ext = os.path.splitext(name)[1].lower()
+    pages = PAGE_READERS[ext](file, settings.PREVIEW_PAGES) if ext in PAGE_READERS else []
+    for number, paragraphs in enumerate(pages, start=1):
+        _save(asset_path(digest, f'page-{number}.png'), render_thumbnail(paragraphs))
+    _save(asset_path(digest, 'excerpt.html'), excerpt_html(pages).encode())
+    _save(manifest_name, json.dumps({'pages': len(pages)}).encode())
+    return {'document_hash': digest, 'preview_pages': len(pages)}
+
+
+def asset_urls(project):
+    """``{'pages': [thumbnail URLs], 'excerpt': URL}`` for a project, or None without previews."""
+    if not project.document_hash or not project.preview_pages:
+        return None
+    digest = project.document_hash
+    return {
+        'pages': [
+            reverse('preview-asset', args=[digest, f'page-{number}.png'])
+            for number in range(1, project.preview_pages + 1)
+        ],
+        'excerpt': reverse('preview-asset', args=[digest, 'excerpt.html']),
+    }
+
+
+def asset_response(request, digest, name):
+    """Response serving a stored derivative with long-lived, immutable caching."""
+    if not ASSET_NAME_RE.match(name):
+        raise Http404('Unknown preview asset')
+    # Content never changes for a path, so the path is a strong validator
+    etag = quote_etag(f'{digest}-{name}')
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        try:
+            file = default_storage.open(asset_path(digest, name), 'rb')
+        except FileNotFoundError:
+            raise Http404('Preview not found')
+        content_type = 'image/png' if name.endswith('.png') else 'text/html; charset=utf-8'
+        response = FileResponse(file, content_type=content_type)
+    response['ETag'] = etag
+    response['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    return response
@@ -0,0 +1,100 @@
+# projects/reconciliation.py
+"""
+Reconciliation of purchases stuck in PENDING.
+
+A purchase stays PENDING when neither the webhook nor the client's verify
+call reported an outcome (the webhook was lost, the browser closed before
+redirecting back, ...). ``reconcile_pending`` pages through such
+purchases by primary key and asks Paystack about each one:
+
+* each page is verified concurrently by a bounded pool of threads sharing
+  the pooled Paystack client (projects/paystack.py),
+* calls across all threads are throttled to ``rate`` per second,
+* the outcomes of a page are applied with the bulk, idempotent settlement
+  path (projects/settlement.py), so a run racing the webhook is harmless.
+
+Only purchases older than ``min_age`` (still in checkout) and younger than
+``max_age`` (long given up) are checked, so frequent runs stay cheap even
+with a large backlog. ``manage.py reconcile_payments`` runs it.
+"""
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .models import Purchase
+from .paystack import PaystackError, get_client
+from .settlement import apply_outcomes, transaction_outcome
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 200
+WORKERS = 8
+RATE = 10
+
+
+class RateLimiter:
+    """Spaces calls at least ``1 / rate`` seconds apart across threads."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next, now)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def pending_pages(min_age, max_age, chunk_size=CHUNK_SIZE):
+    """Yield lists of ``(pk, reference)`` for pending purchases in the age window, by pk."""
+    now = timezone.now()
+    pending = Purchase.objects.filter(
+        status=Purchase.Status.PENDING,
+        created_at__lte=now - min_age,
+        created_at__gte=now - max_age,
+    ).order_by('pk')
+    last_pk = 0
+    while True:
+        page = list(pending.filter(pk__gt=last_pk).values_list('pk', 'paystack_reference')[:chunk_size])
+        if not page:
+            return
+        yield page
+        last_pk = page[-1][0]
+
+
+def reconcile_pending(min_age=timedelta(minutes=10), max_age=timedelta(days=7),
+                      chunk_size=CHUNK_SIZE, workers=WORKERS, rate=RATE):
+    """
+    Verify pending purchases against Paystack and settle them; returns a
+    Counter with ``checked``, ``errors`` and the ``apply_outcomes`` keys.
+    """
+    client = get_client()
+    limiter = RateLimiter(rate)
+    summary = Counter()
+
+    def verify(reference):
+        limiter.wait()
+        try:
+            return transaction_outcome(client.verify_transaction(reference))
+        except PaystackError as e:
+            logger.info(f"Could not verify {reference}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='reconcile') as pool:
+        for page in pending_pages(min_age, max_age, chunk_size):
+            outcomes = list(pool.map(verify, [reference for _, reference in page]))
+            summary['checked'] += len(page)
+            summary['errors'] += outcomes.count(None)
+            summary.update(apply_outcomes([outcome for outcome in outcomes if outcome]))
+    return summary
@@ -0,0 +1,82 @@
+# projects/scheduler.py
+"""
+Periodic background jobs.
+
+Work recorded on the request path is written to the database later by
+these jobs, run in order:
+
+* ``counters.flush``: buffered download/view counters
+* ``pageviews.aggregate_views``: page views and their daily series
+* ``download_tokens.flush_download_audit``: download audit records
+* ``settlement.settle_payments``: queued Paystack webhook outcomes
+* ``stats.maybe_rollup``: admin statistics (at most once per
+  STATS_ROLLUP_INTERVAL across workers)
+* ``uploads.purge_expired``: expired chunked uploads (hourly)
+
+``start()`` runs them every BACKGROUND_JOBS_INTERVAL seconds on a daemon
+thread. The WSGI and ASGI entry points (backend/wsgi.py, backend/asgi.py)
+call it, so every serving process runs the jobs from startup whether or
+not it has recorded anything yet; management commands, the shell and
+tests never start it. With BACKGROUND_JOBS_INTERVAL = 0 no thread is
+started and ``manage.py run_background_jobs`` is meant to run from cron
+instead (each job also has its own command).
+
+In-process buffers (no REDIS_URL) are only visible to the process that
+recorded them, so without Redis the thread is the only thing that writes
+them out; ``start()`` also runs the jobs once at interpreter exit.
+"""
+import atexit
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+_thread = None
+_lock = threading.Lock()
+
+
+def jobs():
+    from .counters import flush
+    from .download_tokens import flush_download_audit
+    from .pageviews import aggregate_views
+    from .settlement import settle_payments
+    from .stats import maybe_rollup
+    from .uploads import purge_expired
+
+    return (flush, aggregate_views, flush_download_audit, settle_payments, maybe_rollup, purge_expired)
+
+
+def run_jobs():
+    """Run every job once; a failing job is logged and doesn't stop the others."""
+    for job in jobs():
+        try:
+            job()
+        except Exception:
+            logger.exception(f'{job.__name__} failed')
+    # The scheduler thread has its own connection; don't leave it open between runs
+    connection.close()
+
+
+def _run_forever(interval):
+    while True:
+        time.sleep(interval)
+        run_jobs()
+
+
+def start():
+    """Start this process's background job thread (once); no-op if BACKGROUND_JOBS_INTERVAL is 0."""
+    global _thread
+    interval = settings.BACKGROUND_JOBS_INTERVAL
+    if _thread is not None or interval <= 0:
+        return
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(
+                target=_run_forever, args=(interval,), name='background-jobs', daemon=True,
+            )
+            _thread.start()
+            atexit.register(run_jobs)
@@ -0,0 +1,122 @@
+# projects/search.py
+"""
+Full-text search for ProjectMaterial.
+
+The search index is maintained by the database itself (see migration
+0004_projectmaterial_search_vector):
+
+* PostgreSQL: ``ProjectMaterial.search_vector`` is a weighted ``tsvector``
+  kept up to date by a trigger and backed by a GIN index.
+* SQLite (local dev): an FTS5 virtual table ``projects_projectmaterial_fts``
+  kept in sync by triggers, ranked with ``bm25()``.
+
+Any other backend falls back to ``icontains`` matching.
+
+The SQLite sync triggers are defined once, in
+projects/migrations/_fts_triggers.py. Migrations that make SQLite rebuild
+``projects_projectmaterial`` (adding or altering its columns) must drop
+them first and recreate them afterwards with its RunPython callables.
+"""
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = 'projects_projectmaterial_fts'
+SEARCH_CONFIG = 'english'
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+_fts_tables = {}
+
+
+def _has_fts_table(alias):
+    """Check (once per process) whether the SQLite FTS5 table exists."""
+    if alias not in _fts_tables:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [FTS_TABLE],
+            )
+            _fts_tables[alias] = cursor.fetchone() is not None
+    return _fts_tables[alias]
+
+
+def _fts5_match_expression(query):
+    """Turn free text into a safe FTS5 expression: every word, prefix matched."""
+    tokens = _TOKEN_RE.findall(query.lower())
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def search_projects(queryset, query):
+    """
+    Filter a ProjectMaterial queryset by a free-text query.
+
+    Title, keywords, department name, abstract and description are searched.
+    Matching rows are annotated with ``search_rank`` (higher is more
+    relevant) so callers can ``order_by('-search_rank')``.
+    """
+    query = (query or '').strip()
+    if not query:
+        return queryset
+
+    alias = queryset.db
+    vendor = connections[alias].vendor
+
+    if vendor == 'postgresql':
+        search_query = SearchQuery(query, search_type='websearch', config=SEARCH_CONFIG)
+        return queryset.filter(search_vector=search_query).annotate(
+            search_rank=SearchRank(F('search_vector'), search_query)
+        )
+
+    if vendor == 'sqlite' and _has_fts_table(alias):
+        expression = _fts5_match_expression(query)
+        if not expression:
+            # Nothing to match, but callers still order by search_rank
+            return queryset.none().annotate(search_rank=Value(0.0, output_field=FloatField()))
+        table = queryset.model._meta.db_table
+        matches = RawSQL(
+            f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s',
+            [expression],
+        )
+        # bm25() returns lower-is-better scores; negate so higher is better.
+        rank = RawSQL(
+            f'SELECT -bm25({FTS_TABLE}, 10.0, 5.0, 2.0, 1.0, 5.0) FROM {FTS_TABLE} '
+            f'WHERE {FTS_TABLE} MATCH %s AND rowid = {table}.id',
+            [expression],
+            output_field=FloatField(),
+        )
+        return queryset.filter(id__in=matches).annotate(search_rank=rank)
+
+    condition = (
+        Q(title__icontains=query) |
+        Q(abstract__icontains=query) |
+        Q(description__icontains=query) |
+        Q(keywords__icontains=query) |
+        Q(department__name__icontains=query)
+    )
+    return queryset.filter(condition).annotate(
+        search_rank=Value(0.0, output_field=FloatField())
+    )
+
+
+def rebuild_search_index(using='default'):
+    """Recompute the search index for every project (e.g. after a bulk import)."""
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            # The trigger recomputes search_vector on any update of the indexed columns.
+            cursor.execute('UPDATE projects_projectmaterial SET title = title')
+            return cursor.rowcount
+        if connection.vendor == 'sqlite' and _has_fts_table(using):
+            cursor.execute(f'DELETE FROM {FTS_TABLE}')
+            cursor.execute(
+                f'INSERT INTO {FTS_TABLE} '
+                '(rowid, title, keywords, abstract, description, department) '
+                'SELECT p.id, p.title, p.keywords, p.abstract, p.description, d.name '
+                'FROM projects_projectmaterial p '
+                'LEFT JOIN projects_department d ON d.id = p.department_id'
+            )
+            return cursor.rowcount
+    return 0
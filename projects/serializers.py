@@ -1,6 +1,11 @@
 # projects/serializers.py
 from rest_framework import serializers
-from .models import ProjectMaterial, Purchase, Download, Department, Category
+from . import entitlements, previews, uploads
+from .models import ProjectMaterial, Purchase, Download, Department, Category, UploadSession
+from .topics import DEFAULT_TOPIC_COUNT, MAX_TOPIC_COUNT
+
+# Most departments accepted in one topic generator call
+MAX_BATCH_DEPARTMENTS = 10
 
 
 class DepartmentSerializer(serializers.ModelSerializer):
@@ -21,6 +26,7 @@ class ProjectMaterialSerializer(serializers.ModelSerializer):
     created_by_name = serializers.CharField(source='created_by.get_full_name', read_only=True)
     average_rating = serializers.FloatField(read_only=True)
     rating_count = serializers.IntegerField(read_only=True)
+    preview = serializers.SerializerMethodField()
     
     class Meta:
         model = ProjectMaterial
@@ -31,12 +37,18 @@ class ProjectMaterialSerializer(serializers.ModelSerializer):
             'programming_language', 'framework', 'database', 'keywords',
             'price', 'status', 'is_featured', 'download_count', 'view_count',
             'created_by', 'created_by_name', 'approved_by', 'approved_at',
-            'created_at', 'updated_at', 'average_rating', 'rating_count'
+            'created_at', 'updated_at', 'average_rating', 'rating_count',
+            'file_format', 'page_count', 'word_count', 'chapter_headings', 'processing_status',
+            'preview'
         ]
         read_only_fields = [
             'slug', 'download_count', 'view_count', 'created_by',
-            'approved_by', 'approved_at', 'created_at', 'updated_at'
+            'approved_by', 'approved_at', 'created_at', 'updated_at',
+            'file_format', 'page_count', 'word_count', 'chapter_headings', 'processing_status'
         ]
+    
+    def get_preview(self, obj):
+        return previews.asset_urls(obj)
 
 
 
@@ -102,24 +114,16 @@ class DownloadRequestSerializer(serializers.Serializer):
         except ProjectMaterial.DoesNotExist:
             raise serializers.ValidationError('Project not found.')
 
-        # Ensure user has a successful purchase
-        purchase = (
-            Purchase.objects.filter(
-                user=user,
-                project=project,
-                status=Purchase.Status.PAID,
-            )
-            .order_by('-created_at')
-            .first()
-        )
-        if not purchase:
+        # Ensure user has a successful purchase (cached per user)
+        purchase_id = entitlements.purchase_id_for(user, project.pk)
+        if purchase_id is None:
             raise serializers.ValidationError('No valid purchase found for this project.')
 
         # Check if it's a free project
         if project.price == 0:
-            attrs['purchase'] = None
+            attrs['purchase_id'] = None
         else:
-            attrs['purchase'] = purchase
+            attrs['purchase_id'] = purchase_id
         
         attrs['project'] = project
         attrs['user'] = user
@@ -136,4 +140,52 @@ class DownloadSerializer(serializers.ModelSerializer):
             'token', 'download_type', 'ip_address', 'user_agent',
             'downloaded_at', 'expires_at'
         ]
-        read_only_fields = fields
\ No newline at end of file
+        read_only_fields = fields
+
+
+class UploadInitSerializer(serializers.Serializer):
+    filename = serializers.CharField(max_length=255)
+    size = serializers.IntegerField(min_value=1)
+    field = serializers.ChoiceField(choices=UploadSession.Field.choices, default=UploadSession.Field.DOCUMENT)
+    project_id = serializers.IntegerField(required=False, allow_null=True, default=None)
+    sha256 = serializers.RegexField(r'^[0-9a-fA-F]{64}$', required=False, allow_blank=True, default='')
+
+    def validate_project_id(self, value):
+        if value is None:
+            return None
+        project = ProjectMaterial.objects.filter(pk=value).first()
+        if project is None:
+            raise serializers.ValidationError('Project not found.')
+        return project
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    total_parts = serializers.IntegerField(read_only=True)
+    received_parts = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = UploadSession
+        fields = [
+            'id', 'project', 'field', 'filename', 'size', 'chunk_size', 'total_parts',
+            'received_parts', 'sha256', 'status', 'error', 'stored_name', 'created_at', 'expires_at'
+        ]
+        read_only_fields = fields
+    
+    def get_received_parts(self, obj):
+        if obj.status == UploadSession.Status.COMPLETE:
+            return list(range(obj.total_parts))
+        return uploads.received_parts(obj)
+
+
+class TopicGeneratorSerializer(serializers.Serializer):
+    department = serializers.CharField(required=False, allow_blank=True, default='')
+    departments = serializers.ListField(
+        child=serializers.CharField(allow_blank=False),
+        required=False,
+        max_length=MAX_BATCH_DEPARTMENTS,
+    )
+    keywords = serializers.CharField(required=False, allow_blank=True, default='')
+    count = serializers.IntegerField(
+        required=False, default=DEFAULT_TOPIC_COUNT, min_value=1, max_value=MAX_TOPIC_COUNT
+    )
+    seed = serializers.CharField(required=False, allow_blank=True, default='')
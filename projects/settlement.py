@@ -0,0 +1,149 @@
+# projects/settlement.py
+"""
+Payment settlement.
+
+Paystack reports transaction outcomes to ``PaystackWebhookView``, which
+checks the signature and records the outcome with ``record_outcome``
+before answering. Paystack does not resend an acknowledged event, so the
+outcome must be stored durably first:
+
+* With REDIS_URL set, it is appended to the ``payment_settlement`` event
+  log (projects/buffers.py), a Redis list shared by every process.
+  ``settle_payments`` drains the log and applies the outcomes to
+  Purchase; it runs as a background job (projects/scheduler.py) and from
+  ``manage.py settle_payments``.
+* Without Redis the log would only live in the receiving process's memory
+  and be lost on a restart, so the outcome is applied to Purchase right
+  away instead.
+
+If recording fails the webhook answers with an error and Paystack
+retries. PaymentVerifyView applies the outcome of its own verify call
+through the same code.
+
+Applying an outcome is idempotent by ``paystack_reference``: every status
+change is a conditional UPDATE on the current status, so repeated webhook
+deliveries, a webhook racing a client-side verify, or several workers
+draining at once all leave the purchase in the same state.
+
+* ``success`` marks the purchase PAID from any other status (the money was
+  taken even if we had given up on it), provided Paystack charged at least
+  the purchase amount in the purchase currency.
+* ``failed`` / ``abandoned`` mark it FAILED only while it is still PENDING.
+* Anything else (``ongoing``, ``queued``, ...) leaves it unchanged.
+"""
+import logging
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from . import entitlements
+from .buffers import get_event_log
+from .models import Purchase
+
+logger = logging.getLogger(__name__)
+
+SUCCESS = 'success'
+FAILURE_STATUSES = ('failed', 'abandoned')
+
+
+def transaction_outcome(data):
+    """The settlement event for a Paystack transaction object (webhook or verify ``data``)."""
+    return {
+        'reference': data.get('reference'),
+        'status': data.get('status'),
+        'amount': data.get('amount'),
+        'currency': data.get('currency'),
+    }
+
+
+def record_outcome(data):
+    """
+    Durably record a Paystack transaction outcome: queued for
+    ``settle_payments`` in Redis, or applied at once without Redis.
+    """
+    outcome = transaction_outcome(data)
+    if settings.REDIS_URL:
+        get_event_log('payment_settlement').append(outcome)
+    else:
+        apply_outcomes([outcome])
+
+
+def _covers_purchase(outcome, purchase):
+    try:
+        charged = Decimal(outcome['amount']) / 100
+    except (TypeError, ValueError, ArithmeticError):
+        return False
+    currency = outcome.get('currency')
+    return charged >= purchase.amount and (not currency or currency == purchase.currency)
+
+
+def apply_outcomes(outcomes):
+    """
+    Apply transaction outcomes to their purchases; returns
+    ``{'paid': n, 'failed': n, 'unchanged': n, 'unknown': n}``.
+    """
+    by_reference = {}
+    for outcome in outcomes:
+        reference = outcome.get('reference')
+        if not reference:
+            continue
+        # A success for a reference wins over any failure reported for it
+        if by_reference.get(reference, {}).get('status') != SUCCESS:
+            by_reference[reference] = outcome
+
+    summary = {'paid': 0, 'failed': 0, 'unchanged': 0, 'unknown': 0}
+    if not by_reference:
+        return summary
+
+    purchases = Purchase.objects.filter(paystack_reference__in=by_reference).only(
+        'pk', 'user_id', 'paystack_reference', 'amount', 'currency', 'status',
+    )
+    paid, failed = [], []
+    buyers = set()
+    found = 0
+    for purchase in purchases:
+        found += 1
+        outcome = by_reference[purchase.paystack_reference]
+        if outcome['status'] == SUCCESS and purchase.status != Purchase.Status.PAID:
+            if _covers_purchase(outcome, purchase):
+                paid.append(purchase.pk)
+                buyers.add(purchase.user_id)
+            else:
+                logger.error(
+                    f"Paystack charge for {purchase.paystack_reference} "
+                    f"({outcome.get('amount')} {outcome.get('currency')}) does not cover "
+                    f"{purchase.amount} {purchase.currency}; purchase {purchase.pk} left {purchase.status}"
+                )
+        elif outcome['status'] in FAILURE_STATUSES and purchase.status == Purchase.Status.PENDING:
+            failed.append(purchase.pk)
+    summary['unknown'] = len(by_reference) - found
+    if summary['unknown']:
+        logger.warning(f"{summary['unknown']} Paystack references match no purchase")
+
+    now = timezone.now()
+    with transaction.atomic():
+        if paid:
+            summary['paid'] = Purchase.objects.filter(pk__in=paid).exclude(
+                status=Purchase.Status.PAID,
+            ).update(status=Purchase.Status.PAID, paid_at=now, updated_at=now)
+            # Bulk updates send no signals; drop the buyers' cached entitlements
+            transaction.on_commit(lambda: entitlements.invalidate(*buyers))
+        if failed:
+            summary['failed'] = Purchase.objects.filter(pk__in=failed, status=Purchase.Status.PENDING).update(
+                status=Purchase.Status.FAILED, updated_at=now,
+            )
+    summary['unchanged'] = found - summary['paid'] - summary['failed']
+    return summary
+
+
+def settle_payments():
+    """Apply queued webhook outcomes; returns the ``apply_outcomes`` summary."""
+    log = get_event_log('payment_settlement')
+    outcomes = log.drain()
+    try:
+        return apply_outcomes(outcomes)
+    except Exception:
+        log.restore(outcomes)
+        raise
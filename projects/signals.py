@@ -0,0 +1,102 @@
+# projects/signals.py
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+
+from . import documents, entitlements, stats, storage
+from .cache import bump_generation
+from .models import ProjectMaterial, Department, Category, Download, Purchase, Topic
+from .topic_store import mark_topics_changed
+
+# Saves that only touch these fields don't invalidate cached catalog reads;
+# slightly stale counters are fine until the cache entry expires.
+COUNTER_FIELDS = frozenset({'download_count', 'view_count'})
+
+
+@receiver(post_save, sender=ProjectMaterial)
+@receiver(post_save, sender=Department)
+@receiver(post_save, sender=Category)
+def invalidate_catalog_on_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= COUNTER_FIELDS:
+        return
+    # After the commit, so a concurrent read can't cache the old rows under the new generation
+    transaction.on_commit(bump_generation)
+
+
+@receiver(post_delete, sender=ProjectMaterial)
+@receiver(post_delete, sender=Department)
+@receiver(post_delete, sender=Category)
+def invalidate_catalog_on_delete(sender, instance, **kwargs):
+    transaction.on_commit(bump_generation)
+
+
+@receiver(post_save, sender=Topic)
+@receiver(post_delete, sender=Topic)
+def invalidate_topics_on_change(sender, instance, **kwargs):
+    # Workers rebuild the topic snapshot on their next check after the commit
+    transaction.on_commit(mark_topics_changed)
+
+
+@receiver(post_save, sender=Purchase)
+@receiver(post_delete, sender=Purchase)
+def invalidate_entitlements_on_change(sender, instance, **kwargs):
+    # After the commit, so a concurrent lookup can't cache the old state again
+    transaction.on_commit(lambda: entitlements.invalidate(instance.user_id))
+
+
+@receiver(post_save, sender=Purchase)
+@receiver(post_delete, sender=Purchase)
+def mark_purchase_stats_dirty(sender, instance, **kwargs):
+    # Edits (refunds, admin changes) can touch a past day's revenue
+    stats.mark_dirty(instance.paid_at)
+
+
+@receiver(post_delete, sender=Download)
+def mark_download_stats_dirty(sender, instance, **kwargs):
+    stats.mark_dirty(instance.downloaded_at)
+
+
+@receiver(pre_save, sender=ProjectMaterial)
+def reset_document_metadata(sender, instance, **kwargs):
+    if not instance.document_changed:
+        return
+    instance._document_changed = True
+    instance.processing_status = (
+        ProjectMaterial.ProcessingStatus.PENDING if instance.document_file else ''
+    )
+    instance.page_count = instance.word_count = instance.file_format = None
+    instance.chapter_headings = []
+    instance.document_hash = instance.preview_pages = None
+
+
+@receiver(post_save, sender=ProjectMaterial)
+def process_uploaded_document(sender, instance, **kwargs):
+    if not getattr(instance, '_document_changed', False):
+        return
+    instance._document_changed = False
+    if instance.document_file:
+        # Metadata is extracted in the background (projects/documents.py)
+        transaction.on_commit(lambda: documents.enqueue(instance.pk))
+
+
+@receiver(post_save, sender=ProjectMaterial)
+def count_file_references(sender, instance, created, update_fields=None, **kwargs):
+    # Reference counts of content-addressed files (projects/storage.py)
+    if created:
+        loaded = dict.fromkeys(ProjectMaterial.FILE_FIELDS, '')
+    else:
+        loaded = getattr(instance, '_loaded_files', {})
+    current = instance.file_names()
+    changed = [
+        field for field, name in loaded.items()
+        if (update_fields is None or field in update_fields) and current[field] != name
+    ]
+    storage.retain(current[field] for field in changed)
+    storage.release(loaded[field] for field in changed)
+    instance._loaded_files = {**loaded, **{field: current[field] for field in changed}}
+
+
+@receiver(post_delete, sender=ProjectMaterial)
+def release_files_on_delete(sender, instance, **kwargs):
+    names = {**instance.file_names(), **getattr(instance, '_loaded_files', {})}
+    storage.release(names.values())
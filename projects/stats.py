@@ -0,0 +1,217 @@
+# projects/stats.py
+"""
+Admin statistics rollups.
+
+Dashboards read precomputed figures instead of counting whole tables on
+every page load:
+
+* ``DailyStats`` holds purchases, revenue and downloads per day and
+  department, so time series are sums over a few rows per day however
+  much history there is.
+* ``StatsSummary`` is a single row with the dashboard totals; reading it
+  is one cached primary-key lookup.
+
+``rollup_recent`` keeps both up to date incrementally. It re-aggregates
+only the days that can have changed: today, yesterday (late audit
+records), and days marked dirty by Purchase/Download changes
+(projects/signals.py). It then adjusts the totals by the difference. It
+runs at most once per STATS_ROLLUP_INTERVAL across all workers as a
+background job (projects/scheduler.py), from ``get_summary`` when the
+summary is older than that (so a dashboard is never staler than the
+interval, whether or not the job runs in that process), and from
+``manage.py rollup_stats``. ``pending_projects`` is not taken from the
+rollup at all: ``get_summary`` counts it live (one indexed COUNT) so it
+matches the list of pending projects shown next to it.
+``manage.py rollup_stats --rebuild`` recomputes everything from scratch,
+e.g. after bulk edits that bypass signals or after moving projects
+between departments.
+"""
+import datetime
+from collections import defaultdict
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate, TruncMonth
+from django.utils import timezone
+
+from .buffers import get_event_log
+from .models import DailyStats, Download, ProjectMaterial, Purchase, StatsSummary
+
+SUMMARY_KEY = 'stats:summary'
+ROLLUP_LOCK_KEY = 'stats:rollup-lock'
+DIRTY_LOG = 'stats_dirty_dates'
+
+# Users who logged in within this many days count as active
+ACTIVE_USER_DAYS = 30
+
+
+def mark_dirty(*moments):
+    """Have the next rollup re-aggregate the days of these datetimes."""
+    dates = {timezone.localdate(moment).isoformat() for moment in moments if moment}
+    log = get_event_log(DIRTY_LOG)
+    for date in dates:
+        log.append(date)
+
+
+def _day_range(dates, field):
+    """Q matching ``field`` within any of ``dates`` (local days), usable with an index."""
+    query = Q()
+    for date in dates:
+        start = timezone.make_aware(datetime.datetime.combine(date, datetime.time.min))
+        query |= Q(**{f'{field}__gte': start, f'{field}__lt': start + datetime.timedelta(days=1)})
+    return query
+
+
+def _aggregate(dates=None):
+    """``{(date, department id): [purchases, revenue, downloads]}`` for ``dates`` (None: all days)."""
+    purchases = Purchase.objects.filter(status=Purchase.Status.PAID, paid_at__isnull=False)
+    downloads = Download.objects.all()
+    if dates is not None:
+        purchases = purchases.filter(_day_range(dates, 'paid_at'))
+        downloads = downloads.filter(_day_range(dates, 'downloaded_at'))
+
+    rows = defaultdict(lambda: [0, Decimal('0'), 0])
+    for row in (
+        purchases.annotate(day=TruncDate('paid_at'))
+        .values('day', 'project__department_id')
+        .annotate(count=Count('id'), revenue=Sum('amount'))
+        .order_by()
+    ):
+        rows[row['day'], row['project__department_id']][0:2] = [row['count'], row['revenue'] or Decimal('0')]
+    for row in (
+        downloads.annotate(day=TruncDate('downloaded_at'))
+        .values('day', 'project__department_id')
+        .annotate(count=Count('id'))
+        .order_by()
+    ):
+        rows[row['day'], row['project__department_id']][2] = row['count']
+    return rows
+
+
+def _totals(queryset):
+    totals = queryset.aggregate(purchases=Sum('purchases'), revenue=Sum('revenue'), downloads=Sum('downloads'))
+    return (
+        totals['purchases'] or 0,
+        totals['revenue'] or Decimal('0'),
+        totals['downloads'] or 0,
+    )
+
+
+@transaction.atomic
+def rollup(dates=None):
+    """
+    Re-aggregate ``dates`` (None: every day) into DailyStats and update the
+    summary; returns the StatsSummary.
+    """
+    summary = StatsSummary.objects.select_for_update().filter(pk=1).first()
+    if summary is None:
+        # No baseline to adjust incrementally
+        summary = StatsSummary(pk=1)
+        dates = None
+    today = timezone.localdate()
+
+    existing = DailyStats.objects.all() if dates is None else DailyStats.objects.filter(date__in=dates)
+    old = _totals(existing)
+    rows = _aggregate(dates)
+    existing.delete()
+    DailyStats.objects.bulk_create(
+        [
+            DailyStats(date=date, department_id=department, purchases=p, revenue=r, downloads=d)
+            for (date, department), (p, r, d) in rows.items()
+        ],
+        batch_size=500,
+    )
+    new = (
+        sum(v[0] for v in rows.values()),
+        sum((v[1] for v in rows.values()), Decimal('0')),
+        sum(v[2] for v in rows.values()),
+    )
+    if dates is None:
+        old = (0, Decimal('0'), 0)
+        summary.total_purchases = summary.total_revenue = summary.total_downloads = 0
+
+    summary.total_purchases += new[0] - old[0]
+    summary.total_revenue += new[1] - old[1]
+    summary.total_downloads += new[2] - old[2]
+    if dates is None or today in dates:
+        summary.downloads_today = sum(v[2] for (date, _), v in rows.items() if date == today)
+        summary.date = today
+
+    # Current-state counts: one indexed COUNT each per rollup, not per page load
+    User = get_user_model()
+    summary.total_projects = ProjectMaterial.objects.count()
+    summary.pending_projects = ProjectMaterial.objects.filter(status=ProjectMaterial.Status.PENDING).count()
+    summary.total_users = User.objects.count()
+    summary.active_users = User.objects.filter(
+        last_login__gte=timezone.now() - datetime.timedelta(days=ACTIVE_USER_DAYS)
+    ).count()
+    summary.save()
+    transaction.on_commit(lambda: cache.set(SUMMARY_KEY, summary, settings.STATS_ROLLUP_INTERVAL))
+    return summary
+
+
+def rollup_recent():
+    """Incremental rollup of today, yesterday and dirty days."""
+    log = get_event_log(DIRTY_LOG)
+    dirty = log.drain()
+    today = timezone.localdate()
+    dates = {today, today - datetime.timedelta(days=1)}
+    dates.update(datetime.date.fromisoformat(date) for date in dirty)
+    try:
+        return rollup(dates)
+    except Exception:
+        log.restore(dirty)
+        raise
+
+
+def maybe_rollup():
+    """``rollup_recent`` unless some process ran it within STATS_ROLLUP_INTERVAL."""
+    if settings.STATS_ROLLUP_INTERVAL <= 0:
+        return None
+    if not cache.add(ROLLUP_LOCK_KEY, 1, timeout=settings.STATS_ROLLUP_INTERVAL):
+        return None
+    return rollup_recent()
+
+
+def get_summary():
+    """The dashboard figures (StatsSummary), rolled up first if stale."""
+    summary = cache.get(SUMMARY_KEY)
+    if summary is None:
+        summary = StatsSummary.objects.filter(pk=1).first() or rollup()
+        cache.set(SUMMARY_KEY, summary, settings.STATS_ROLLUP_INTERVAL)
+    interval = settings.STATS_ROLLUP_INTERVAL
+    if interval > 0 and timezone.now() - summary.updated_at > datetime.timedelta(seconds=interval):
+        # None while another process holds the rollup lock; its result shows next time
+        summary = maybe_rollup() or summary
+    if summary.date != timezone.localdate():
+        # Not rolled up since midnight
+        summary.downloads_today = 0
+    summary.pending_projects = ProjectMaterial.objects.filter(status=ProjectMaterial.Status.PENDING).count()
+    return summary
+
+
+def revenue_series(start, end, interval='day'):
+    """``[{'period', 'purchases', 'revenue'}]`` from ``start`` to ``end`` (dates, inclusive)."""
+    stats = DailyStats.objects.filter(date__gte=start, date__lte=end)
+    period = TruncMonth('date') if interval == 'month' else F('date')
+    return list(
+        stats.annotate(period=period)
+        .values('period')
+        .annotate(purchases=Sum('purchases'), revenue=Sum('revenue'))
+        .order_by('period')
+    )
+
+
+def downloads_by_department(start, end):
+    """``[{'department_id', 'department__name', 'downloads'}]`` from ``start`` to ``end``, most first."""
+    return list(
+        DailyStats.objects.filter(date__gte=start, date__lte=end)
+        .values('department_id', 'department__name')
+        .annotate(downloads=Sum('downloads'))
+        .filter(downloads__gt=0)
+        .order_by('-downloads', 'department__name')
+    )
@@ -0,0 +1,185 @@
+# projects/storage.py
+"""
+Content-addressed, deduplicating storage for project files.
+
+``ContentAddressedStorage`` stores each upload under the SHA-256 of its
+content instead of the name ``upload_to`` proposes (only the extension is
+kept)::
+
+    blobs/<first 2 hex digits>/<sha256>.<ext>
+
+Uploading content that is already stored (the same document re-uploaded
+during an admin edit, the same thesis submitted twice) writes nothing and
+returns the existing name. Since a name never changes content, the hash
+in it doubles as the file's ETag (projects/delivery.py) and as the
+document hash for previews (projects/previews.py).
+
+Stored files are reference-counted in ``ContentBlob``. ProjectMaterial
+saves and deletes retain the names their file fields start using and
+release the ones they stop using (projects/signals.py); a blob is deleted
+once nothing references it, after the releasing transaction commits.
+Files stored before this backend, under their ``upload_to`` names, are
+left alone until ``manage.py dedupe_files`` moves them into the store
+(``adopt``); it also deletes blobs that were stored but never referenced
+(``prune``), e.g. by a save that rolled back.
+"""
+import hashlib
+import logging
+import os
+import re
+import shutil
+import uuid
+from collections import Counter
+from datetime import timedelta
+
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.deconstruct import deconstructible
+
+logger = logging.getLogger(__name__)
+
+BLOB_ROOT = 'blobs'
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_BLOB_NAME_RE = re.compile(rf'^{BLOB_ROOT}/[0-9a-f]{{2}}/(?P<digest>[0-9a-f]{{64}})(\.\w+)?$')
+_EXTENSION_RE = re.compile(r'^\.\w{1,16}$')
+
+
+def blob_name(digest, ext=''):
+    """Storage name of the content hashing to ``digest``, with extension ``ext``."""
+    ext = ext.lower()
+    return f'{BLOB_ROOT}/{digest[:2]}/{digest}{ext if _EXTENSION_RE.match(ext) else ""}'
+
+
+def blob_digest(name):
+    """The SHA-256 in a content-addressed ``name``, or None for other names."""
+    match = _BLOB_NAME_RE.match(name or '')
+    return match.group('digest') if match else None
+
+
+def hash_chunks(chunks):
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_file(file):
+    """Hex SHA-256 of an open binary file, read in chunks from the start."""
+    file.seek(0)
+    digest = hash_chunks(iter(lambda: file.read(HASH_CHUNK_SIZE), b''))
+    file.seek(0)
+    return digest
+
+
+@deconstructible(path='projects.storage.ContentAddressedStorage')
+class ContentAddressedStorage(FileSystemStorage):
+    """FileSystemStorage naming files by their content (see module docstring)."""
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is chosen from the content in _save; identical
+        # content is meant to share a name rather than get a fresh one
+        return name
+
+    def _save(self, name, content):
+        from .models import ContentBlob
+
+        if hasattr(content, 'temporary_file_path'):
+            with open(content.temporary_file_path(), 'rb') as f:
+                digest = hash_file(f)
+        else:
+            digest = hash_chunks(content.chunks(HASH_CHUNK_SIZE))
+        name = blob_name(digest, os.path.splitext(name)[1])
+
+        if not self.exists(name):
+            # Written under a unique name first, then renamed into place, so
+            # a concurrent upload of the same content never sees a partial file
+            temporary = super()._save(f'{BLOB_ROOT}/tmp/{uuid.uuid4().hex}', content)
+            os.makedirs(os.path.dirname(self.path(name)), exist_ok=True)
+            os.replace(self.path(temporary), self.path(name))
+        ContentBlob.objects.get_or_create(name=name, defaults={'size': self.size(name)})
+        return name
+
+
+content_storage = ContentAddressedStorage()
+
+
+def retain(names, storage=content_storage):
+    """Count a reference to each content-addressed name in ``names``."""
+    from .models import ContentBlob
+
+    for name, count in Counter(name for name in names if blob_digest(name)).items():
+        if not ContentBlob.objects.filter(name=name).update(ref_count=F('ref_count') + count):
+            size = storage.size(name) if storage.exists(name) else 0
+            ContentBlob.objects.create(name=name, size=size, ref_count=count)
+
+
+def release(names, storage=content_storage):
+    """Drop a reference to each content-addressed name; deletes blobs nobody references."""
+    from .models import ContentBlob
+
+    for name, count in Counter(name for name in names if blob_digest(name)).items():
+        with transaction.atomic():
+            blob = ContentBlob.objects.select_for_update().filter(name=name).first()
+            if blob is None:
+                continue
+            blob.ref_count -= count
+            if blob.ref_count > 0:
+                blob.save(update_fields=['ref_count'])
+                continue
+            blob.delete()
+        transaction.on_commit(lambda name=name: _delete_unreferenced(name, storage))
+
+
+def _delete_unreferenced(name, storage):
+    from .models import ContentBlob
+
+    # Stored again since the release (an identical upload): keep it
+    if ContentBlob.objects.filter(name=name).exists():
+        return
+    try:
+        storage.delete(name)
+    except OSError:
+        logger.exception(f'Could not delete unreferenced file {name}')
+
+
+def adopt(name, storage=content_storage):
+    """
+    Store the file saved under a legacy ``name`` content-addressed; returns
+    ``(blob name, whether that content was stored already)``. The original
+    is left in place for the caller to delete once nothing refers to it.
+    """
+    from .models import ContentBlob
+
+    with storage.open(name, 'rb') as f:
+        digest = hash_file(f)
+    new_name = blob_name(digest, os.path.splitext(name)[1])
+    duplicate = storage.exists(new_name)
+    if not duplicate:
+        target = storage.path(new_name)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        temporary = f'{target}.{uuid.uuid4().hex}.tmp'
+        try:
+            # Same filesystem: no copy until the original is deleted
+            os.link(storage.path(name), temporary)
+        except OSError:
+            shutil.copyfile(storage.path(name), temporary)
+        os.replace(temporary, target)
+    ContentBlob.objects.get_or_create(name=new_name, defaults={'size': storage.size(new_name)})
+    return new_name, duplicate
+
+
+def prune(age=timedelta(days=1), storage=content_storage):
+    """Delete blobs stored more than ``age`` ago that nothing references; returns how many."""
+    from .models import ContentBlob
+
+    stale = ContentBlob.objects.filter(ref_count=0, created_at__lt=timezone.now() - age)
+    pruned = 0
+    for name in stale.values_list('name', flat=True):
+        # Skip blobs referenced again meanwhile
+        if ContentBlob.objects.filter(name=name, ref_count=0).delete()[0]:
+            storage.delete(name)
+            pruned += 1
+    return pruned
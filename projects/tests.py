@@ -1,3 +1,1546 @@
-from django.test import TestCase
+# projects/tests.py
+import hashlib
+import hmac
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+import zlib
+from datetime import datetime, timedelta
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import unquote
+from xml.sax.saxutils import escape
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from pypdf import PdfWriter
+from rest_framework.test import APIClient
+
+from . import (
+    counters, delivery, documents, download_tokens, entitlements, pageviews, paystack, previews, reconciliation,
+    scheduler, stats, storage, topics, uploads, zipstream,
+)
+from .buffers import get_event_log
+from .cache import get_generation
+from .models import (
+    Category, ContentBlob, DailyStats, Department, Download, ProjectMaterial, ProjectViewDaily, Purchase,
+    StatsSummary, UploadSession,
+)
+from .pagination import CatalogPagination, InvalidCursor, KeysetPaginator
+from .search import search_projects
+from .settlement import apply_outcomes
+
+User = get_user_model()
+
+
+def make_project(department, index, **kwargs):
+    fields = {
+        'title': f'Project {index}',
+        'abstract': 'Abstract',
+        'department': department,
+        'year': 2024,
+        'status': ProjectMaterial.Status.APPROVED,
+        'document_file': f'projects/documents/project-{index}.pdf',
+        **kwargs,
+    }
+    return ProjectMaterial.objects.create(**fields)
+
+
+DOCX_STYLES = (
+    '<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    # A localized style id, as Word writes for non-English installs
+    '<w:style w:styleId="Kop1"><w:name w:val="heading 1"/></w:style>'
+    '</w:styles>'
+)
+
+
+def docx_paragraph(text, style='', page_break=''):
+    """``w:p`` XML; ``page_break`` is '', 'page' (explicit) or 'rendered' (recorded by Word)."""
+    properties = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ''
+    marker = {'': '', 'page': '<w:br w:type="page"/>', 'rendered': '<w:lastRenderedPageBreak/>'}[page_break]
+    return f'<w:p>{properties}<w:r>{marker}<w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>'
+
+
+def make_docx(paragraphs, pages=None):
+    """DOCX bytes with ``paragraphs`` (``docx_paragraph`` XML) and Word's recorded page count."""
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, 'w') as archive:
+        archive.writestr('word/document.xml', (
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f'<w:body>{"".join(paragraphs)}</w:body></w:document>'
+        ))
+        archive.writestr('word/styles.xml', DOCX_STYLES)
+        if pages is not None:
+            archive.writestr('docProps/app.xml', (
+                '<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties">'
+                f'<Pages>{pages}</Pages></Properties>'
+            ))
+    return output.getvalue()
+
+
+def make_pdf(pages, outline=()):
+    """PDF bytes with one page per list of text lines and top-level ``outline`` titles (one per page)."""
+    def literal(text):
+        return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+    objects = ['<< /Type /Catalog /Pages 2 0 R >>', None, '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    kids = []
+    for lines in pages:
+        stream = 'BT /F1 12 Tf 14 TL 72 770 Td ' + ' '.join(f'({literal(line)}) Tj T*' for line in lines) + ' ET'
+        objects.append(f'<< /Length {len(stream)} >>\nstream\n{stream}\nendstream')
+        objects.append(
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents {len(objects)} 0 R '
+            '/Resources << /Font << /F1 3 0 R >> >> >>'
+        )
+        kids.append(f'{len(objects)} 0 R')
+    objects[1] = f'<< /Type /Pages /Kids [{" ".join(kids)}] /Count {len(kids)} >>'
+
+    output = io.BytesIO()
+    output.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1'))
+    xref = output.tell()
+    output.write(f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode())
+    for offset in offsets:
+        output.write(f'{offset:010d} 00000 n \n'.encode())
+    output.write(f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode())
+
+    if not outline:
+        return output.getvalue()
+    writer = PdfWriter(clone_from=io.BytesIO(output.getvalue()))
+    for page, title in enumerate(outline):
+        writer.add_outline_item(title, page)
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+@override_settings(DOCUMENT_WORKERS=0)
+class CatalogQueryCountTests(TestCase):
+    """Catalog and /api/me/ endpoints cost the same few queries at any page size."""
+
+    PROJECTS = 12
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='student', email='student@example.com', password='pw')
+        department = Department.objects.create(name='Computer Science')
+        category = Category.objects.create(name='Web')
+        cls.projects = [
+            make_project(department, i, category=category, created_by=cls.user, price=1000)
+            for i in range(cls.PROJECTS)
+        ]
+        for i, project in enumerate(cls.projects):
+            purchase = Purchase.objects.create(
+                user=cls.user, project=project, amount=1000, paystack_reference=f'REF-{i}',
+                status=Purchase.Status.PAID, paid_at=timezone.now(),
+            )
+            Download.objects.create(user=cls.user, project=project, purchase=purchase)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_project_list(self):
+        # Joined page SELECT + pagination COUNT
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('project-list'))
+        self.assertEqual(len(response.data['results']), self.PROJECTS)
+        self.assertEqual(response.data['results'][0]['department_name'], 'Computer Science')
+
+    def test_project_list_is_cached(self):
+        self.client.get(reverse('project-list'))
+        with self.assertNumQueries(0):
+            self.client.get(reverse('project-list'))
+
+    def test_project_retrieve(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/api/projects/{self.projects[0].pk}/')
+        self.assertEqual(response.data['category_name'], 'Web')
+
+    def test_my_purchases(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('me-purchases'))
+        self.assertEqual(response.data['count'], self.PROJECTS)
+        self.assertEqual(response.data['results'][0]['user_email'], 'student@example.com')
+
+    def test_my_downloads(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('me-downloads'))
+        self.assertEqual(response.data['count'], self.PROJECTS)
+
+
+@override_settings(DOCUMENT_WORKERS=0)
+class CatalogInvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.department = Department.objects.create(name='Computer Science')
+
+    def test_generation_bumps_after_commit(self):
+        before = get_generation()
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            project = make_project(self.department, 1)
+            self.assertEqual(get_generation(), before)
+        for callback in callbacks:
+            callback()
+        self.assertGreater(get_generation(), before)
+
+        before = get_generation()
+        with self.captureOnCommitCallbacks(execute=True):
+            project.delete()
+        self.assertGreater(get_generation(), before)
+
+    def test_counter_updates_keep_generation(self):
+        project = make_project(self.department, 1)
+        before = get_generation()
+        with self.captureOnCommitCallbacks(execute=True):
+            project.view_count = 5
+            project.save(update_fields=['view_count'])
+        self.assertEqual(get_generation(), before)
+
+
+class SchedulerTests(SimpleTestCase):
+    def test_failing_job_does_not_stop_the_others(self):
+        calls = []
+
+        def broken():
+            calls.append('broken')
+            raise RuntimeError('boom')
+
+        def flush():
+            calls.append('flush')
+
+        with mock.patch.object(scheduler, 'jobs', return_value=(broken, flush)), \
+                mock.patch.object(scheduler.connection, 'close'), \
+                self.assertLogs('projects.scheduler', 'ERROR'):
+            scheduler.run_jobs()
+        self.assertEqual(calls, ['broken', 'flush'])
+
+    @override_settings(BACKGROUND_JOBS_INTERVAL=0)
+    def test_disabled_without_interval(self):
+        scheduler.start()
+        self.assertIsNone(scheduler._thread)
+
+
+@override_settings(DOCUMENT_WORKERS=0)
+class CounterFlushTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = make_project(Department.objects.create(name='Computer Science'), 1)
+        cls.user = User.objects.create_user(username='reader', email='reader@example.com', password='x')
+
+    def setUp(self):
+        counters.get_buffer().drain('download_count')
+        get_event_log('download_audit').drain()
+
+    def download(self):
+        """Issue a download link the way DownloadRequestView does."""
+        grant = download_tokens.DownloadGrant.issue(self.user, self.project, None, 'document')
+        download_tokens.record_download(grant, RequestFactory().get('/'))
+        self.project.increment_download_count()
+        return grant
+
+    def test_increments_are_written_without_a_thread(self):
+        project = self.project
+        counters.increment(project.pk, 'download_count', 3)
+        project.refresh_from_db()
+        self.assertEqual(project.download_count, 0)
+
+        self.assertEqual(counters.flush(), {'download_count': 1})
+        project.refresh_from_db()
+        self.assertEqual(project.download_count, 3)
+
+    def test_recount_includes_queued_audit_records(self):
+        Download.objects.create(user=self.user, project=self.project)
+        self.download()
+        self.download()
+        self.assertEqual(counters.recount_downloads(), 1)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.download_count, 3)
+        # The pending increments were part of the recount
+        self.assertEqual(counters.flush(), {})
+
+
+@override_settings(DOCUMENT_WORKERS=0, DOWNLOAD_LINK_TTL=60, DOWNLOAD_LINKS_REQUIRE_LOGIN=False)
+class DownloadGrantTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = make_project(Department.objects.create(name='Computer Science'), 1)
+        cls.user = User.objects.create_user(username='reader', email='reader@example.com', password='x')
+        cls.purchase = Purchase.objects.create(
+            user=cls.user, project=cls.project, amount=1000, paystack_reference='REF-1',
+            status=Purchase.Status.PAID, paid_at=timezone.now(),
+        )
+
+    def setUp(self):
+        get_event_log('download_audit').drain()
+
+    def grant(self, user=None, purchase_id=None):
+        return download_tokens.DownloadGrant.issue(user or self.user, self.project, purchase_id, 'document')
+
+    def test_round_trip(self):
+        grant = self.grant(purchase_id=self.purchase.pk)
+        loaded = download_tokens.DownloadGrant.from_token(grant.sign())
+        self.assertEqual(vars(loaded), vars(grant))
+        self.assertEqual(loaded.file_names, ['projects/documents/project-1.pdf', None, None])
+
+    def test_tampered_token(self):
+        token = self.grant().sign()
+        payload, signature = token.rsplit(':', 1)
+        forged = signing.dumps(['x', self.user.pk, self.project.pk, None, 'both', 2 ** 40, 'x', []])
+        for bad in (
+            f'{payload}:{signature[:-1]}{"A" if signature[-1] != "A" else "B"}',
+            f'{payload[:-1]}{"A" if payload[-1] != "A" else "B"}:{signature}',
+            forged,  # signed with another salt
+            'not-a-token',
+        ):
+            with self.subTest(bad):
+                with self.assertRaises(download_tokens.InvalidDownloadToken):
+                    download_tokens.DownloadGrant.from_token(bad)
+        response = self.client.get(reverse('downloads-file', args=['not-a-token']))
+        self.assertEqual(response.status_code, 404)
+
+    def test_expired_token(self):
+        token = self.grant().sign()
+        with mock.patch.object(download_tokens.time, 'time', return_value=time.time() + 61):
+            with self.assertRaises(download_tokens.ExpiredDownloadToken):
+                download_tokens.DownloadGrant.from_token(token)
+            response = self.client.get(reverse('downloads-file', args=[token]))
+        self.assertEqual(response.status_code, 410)
+
+    def test_audit_rows_are_written_in_one_batch(self):
+        other = User.objects.create_user(username='gone', email='gone@example.com', password='x')
+        request = RequestFactory().get('/', REMOTE_ADDR='10.0.0.1', HTTP_USER_AGENT='Browser')
+        grants = [self.grant(purchase_id=self.purchase.pk), self.grant(), self.grant(user=other)]
+        for grant in grants:
+            download_tokens.record_download(grant, request)
+        self.assertFalse(Download.objects.exists())
+        other.delete()
+
+        # Users, projects and purchases looked up once, then one INSERT
+        with self.assertNumQueries(4):
+            self.assertEqual(download_tokens.flush_download_audit(), 2)
+        rows = {row.token: row for row in Download.objects.all()}
+        self.assertEqual(set(rows), {grants[0].token_id, grants[1].token_id})
+        self.assertEqual(rows[grants[0].token_id].purchase_id, self.purchase.pk)
+        self.assertEqual(rows[grants[0].token_id].ip_address, '10.0.0.1')
+        self.assertEqual(rows[grants[1].token_id].expires_at, grants[1].expires_at)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(download_tokens.flush_download_audit(), 0)
+
+    def test_failed_flush_keeps_the_records(self):
+        download_tokens.record_download(self.grant(), RequestFactory().get('/'))
+        with mock.patch.object(Download.objects, 'bulk_create', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                download_tokens.flush_download_audit()
+        self.assertEqual(download_tokens.flush_download_audit(), 1)
+
+
+@override_settings(DOCUMENT_WORKERS=0)
+class PageViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        department = Department.objects.create(name='Computer Science')
+        cls.project = make_project(department, 1)
+        cls.other = make_project(department, 2)
+        cls.user = User.objects.create_user(username='reader', email='reader@example.com', password='x')
+
+    def setUp(self):
+        cache.clear()
+        get_event_log('pageviews').drain()
+
+    def view(self, project, client=None, **headers):
+        response = (client or self.client).get(reverse('project-detail', args=[project.slug]), **headers)
+        self.assertEqual(response.status_code, 200)
+
+    def test_a_visitor_counts_once(self):
+        self.client.force_login(self.user)
+        for _ in range(3):
+            self.view(self.project)
+        self.view(self.project, client=self.client_class())
+        self.view(self.project, client=self.client_class(), HTTP_USER_AGENT='Googlebot/2.1')
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.view_count, 0)
+
+        self.assertEqual(pageviews.aggregate_views(), 2)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.view_count, 2)
+        self.assertEqual(
+            list(ProjectViewDaily.objects.values_list('project', 'date', 'views')),
+            [(self.project.pk, timezone.localdate(), 2)],
+        )
+
+    def test_flushes_add_to_the_daily_row(self):
+        self.view(self.project)
+        pageviews.aggregate_views()
+        self.view(self.project, client=self.client_class(), REMOTE_ADDR='10.0.0.2')
+        self.view(self.other, client=self.client_class(), REMOTE_ADDR='10.0.0.2')
+        self.assertEqual(pageviews.aggregate_views(), 2)
+        self.assertEqual(pageviews.aggregate_views(), 0)
+
+        self.assertEqual(ProjectViewDaily.objects.get(project=self.project).views, 2)
+        self.assertEqual(
+            [(p.pk, p.recent_views) for p in pageviews.trending_projects()],
+            [(self.project.pk, 2), (self.other.pk, 1)],
+        )
+
+
+class StubPaystack(ThreadingHTTPServer):
+    """
+    Local HTTP server answering with the scripted ``(status, headers, body,
+    delay)`` responses in order (the last one repeats); records request
+    paths and the most requests it was serving at once.
+    """
+
+    def __init__(self, responses=()):
+        self.responses = list(responses)
+        self.requests = []
+        self.active = self.max_active = 0
+        self.lock = threading.Lock()
+        super().__init__(('127.0.0.1', 0), StubPaystackHandler)
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+    def respond(self, method, path):
+        index = min(len(self.requests), len(self.responses)) - 1
+        return self.responses[index]
+
+    def handle_error(self, request, client_address):
+        # Clients that timed out close the connection before the reply
+        pass
+
+
+class StubPaystackHandler(BaseHTTPRequestHandler):
+    def _respond(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.command, self.path))
+            status, headers, body, delay = server.respond(self.command, self.path)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        time.sleep(delay)
+        with server.lock:
+            server.active -= 1
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+OK = (200, {}, {'status': True, 'data': {'status': 'success', 'reference': 'REF'}}, 0)
+UNAVAILABLE = (503, {}, {'status': False, 'message': 'Service unavailable'}, 0)
+
+
+class PaystackClientTests(SimpleTestCase):
+    def stub(self, *responses):
+        server = StubPaystack(responses)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def client_for(self, server, **kwargs):
+        client = paystack.PaystackClient('sk_test', server.url, **kwargs)
+        self.addCleanup(client.close)
+        return client
+
+    def test_verify_is_retried_on_server_errors(self):
+        server = self.stub(UNAVAILABLE, OK)
+        data = self.client_for(server).verify_transaction('REF/1')
+        self.assertEqual(data['status'], 'success')
+        self.assertEqual(server.requests, [('GET', '/transaction/verify/REF%2F1')] * 2)
+
+    def test_retry_after_is_capped(self):
+        server = self.stub((429, {'Retry-After': '3600'}, {'status': False}, 0), OK)
+        start = time.monotonic()
+        with mock.patch.object(paystack, 'MAX_RETRY_AFTER', 0.1):
+            self.client_for(server).verify_transaction('REF')
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(len(server.requests), 2)
+
+    def test_initialize_is_not_retried_after_reaching_paystack(self):
+        server = self.stub(UNAVAILABLE, OK)
+        with self.assertRaises(paystack.PaystackError) as raised:
+            self.client_for(server).initialize_transaction('a@example.com', 1000, 'REF')
+        self.assertEqual(raised.exception.response['message'], 'Service unavailable')
+        self.assertEqual(server.requests, [('POST', '/transaction/initialize')])
+
+    def test_read_timeout(self):
+        server = self.stub((*OK[:3], 1))
+        client = self.client_for(server, read_timeout=0.2, max_retries=1)
+        start = time.monotonic()
+        with self.assertRaises(paystack.PaystackError), self.assertLogs('projects.paystack', 'WARNING'):
+            client.verify_transaction('REF')
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(len(server.requests), 2)
+
+    def test_webhook_signature(self):
+        body = b'{"event": "charge.success"}'
+        signature = hmac.new(b'sk_test', body, hashlib.sha512).hexdigest()
+        self.assertTrue(paystack.valid_signature(body, signature, 'sk_test'))
+        self.assertFalse(paystack.valid_signature(body + b' ', signature, 'sk_test'))
+        self.assertFalse(paystack.valid_signature(body, None, 'sk_test'))
+
+
+def charge(reference, status='success', amount=100000, currency='NGN'):
+    """A Paystack transaction object, as in webhook and verify ``data``."""
+    return {'reference': reference, 'status': status, 'amount': amount, 'currency': currency}
+
+
+class StubPaystackVerify(StubPaystack):
+    """Answers ``/transaction/verify/<reference>`` from ``transactions`` (404 if missing)."""
+
+    def __init__(self, transactions, delay=0):
+        self.transactions = transactions
+        self.delay = delay
+        super().__init__()
+
+    def respond(self, method, path):
+        reference = unquote(path.rsplit('/', 1)[-1])
+        if reference not in self.transactions:
+            return 404, {}, {'status': False, 'message': 'Transaction reference not found'}, self.delay
+        return 200, {}, {'status': True, 'data': self.transactions[reference]}, self.delay
+
+
+@override_settings(DOCUMENT_WORKERS=0, REDIS_URL='', PAYSTACK_SECRET_KEY='sk_test', PAYSTACK_MAX_RETRIES=0)
+class ReconciliationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='buyer', email='buyer@example.com', password='pw')
+        cls.project = make_project(Department.objects.create(name='Computer Science'), 1, price=1000)
+
+    def setUp(self):
+        cache.clear()
+
+    def buy(self, reference, status=Purchase.Status.PENDING, age=timedelta(hours=1)):
+        purchase = Purchase.objects.create(
+            user=self.user, project=self.project, amount=1000, paystack_reference=reference, status=status,
+        )
+        Purchase.objects.filter(pk=purchase.pk).update(created_at=timezone.now() - age)
+        return purchase
+
+    def stub(self, transactions, delay=0):
+        server = StubPaystackVerify(transactions, delay)
+        thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        settings = self.settings(PAYSTACK_BASE_URL=server.url)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        return server
+
+    def statuses(self):
+        return dict(Purchase.objects.values_list('paystack_reference', 'status'))
+
+    def test_mixed_outcomes_are_settled_per_page(self):
+        transactions = {
+            'REF-0': charge('REF-0'),
+            'REF-1': charge('REF-1'),
+            'REF-2': charge('REF-2'),
+            'REF-3': charge('REF-3', 'failed'),
+            'REF-4': charge('REF-4', 'abandoned'),
+            'REF-5': charge('REF-5', 'ongoing'),
+            # REF-6 is unknown to Paystack
+            'OLD': charge('OLD'),
+            'NEW': charge('NEW'),
+            'PAID': charge('PAID', 'failed'),
+        }
+        server = self.stub(transactions)
+        for i in range(7):
+            self.buy(f'REF-{i}')
+        self.buy('OLD', age=timedelta(days=8))
+        self.buy('NEW', age=timedelta(minutes=1))
+        self.buy('PAID', status=Purchase.Status.PAID)
+
+        with CaptureQueriesContext(connection) as queries, self.assertLogs('projects.reconciliation', 'INFO'):
+            summary = reconciliation.reconcile_pending(chunk_size=3, workers=3, rate=0)
+
+        self.assertEqual(dict(summary), {'checked': 7, 'errors': 1, 'paid': 3, 'failed': 2, 'unchanged': 1, 'unknown': 0})
+        self.assertEqual(sorted(path for _, path in server.requests), [f'/transaction/verify/REF-{i}' for i in range(7)])
+        paid, failed, pending = Purchase.Status.PAID, Purchase.Status.FAILED, Purchase.Status.PENDING
+        self.assertEqual(self.statuses(), {
+            'REF-0': paid, 'REF-1': paid, 'REF-2': paid, 'REF-3': failed, 'REF-4': failed,
+            'REF-5': pending, 'REF-6': pending, 'OLD': pending, 'NEW': pending, 'PAID': paid,
+        })
+        # One UPDATE per page and outcome, not per purchase
+        updates = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 2)
+
+        # Settled purchases are not checked again
+        server.requests.clear()
+        self.assertEqual(reconciliation.reconcile_pending(rate=0)['checked'], 2)
+
+    def test_concurrency_is_bounded(self):
+        server = self.stub({f'REF-{i}': charge(f'REF-{i}') for i in range(8)}, delay=0.05)
+        for i in range(8):
+            self.buy(f'REF-{i}')
+        reconciliation.reconcile_pending(chunk_size=8, workers=2, rate=0)
+        self.assertEqual(len(server.requests), 8)
+        self.assertEqual(server.max_active, 2)
+
+    def test_calls_are_rate_limited(self):
+        self.stub({f'REF-{i}': charge(f'REF-{i}') for i in range(5)})
+        for i in range(5):
+            self.buy(f'REF-{i}')
+        start = time.monotonic()
+        summary = reconciliation.reconcile_pending(workers=5, rate=20)
+        # Five calls at most 20 per second: at least 4 intervals of 50 ms
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+        self.assertEqual(summary['paid'], 5)
+
+    def test_command_prints_the_summary(self):
+        self.stub({'REF-0': charge('REF-0'), 'REF-1': charge('REF-1', 'failed')})
+        for i in range(3):
+            self.buy(f'REF-{i}')
+        out = io.StringIO()
+        with self.assertLogs('projects.reconciliation', 'INFO'):
+            call_command('reconcile_payments', '--min-age=0', '--rate=0', stdout=out)
+        self.assertIn(
+            'Checked 3 pending purchases in', out.getvalue(),
+        )
+        self.assertIn('1 paid, 1 failed, 0 still pending, 0 unknown, 1 errors', out.getvalue())
+
+
+@override_settings(DOCUMENT_WORKERS=0, REDIS_URL='', PAYSTACK_SECRET_KEY='sk_test')
+class SettlementTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='buyer', email='buyer@example.com', password='pw')
+        cls.project = make_project(Department.objects.create(name='Computer Science'), 1, price=1000)
+
+    def setUp(self):
+        cache.clear()
+        self.purchase = Purchase.objects.create(
+            user=self.user, project=self.project, amount=1000, paystack_reference='REF-1',
+        )
+
+    def post_webhook(self, event, data):
+        body = json.dumps({'event': event, 'data': data}).encode()
+        signature = hmac.new(b'sk_test', body, hashlib.sha512).hexdigest()
+        return self.client.post(
+            reverse('payments-webhook'), body, content_type='application/json',
+            HTTP_X_PAYSTACK_SIGNATURE=signature,
+        )
+
+    def test_success_is_applied_once(self):
+        self.assertEqual(apply_outcomes([charge('REF-1')])['paid'], 1)
+        paid_at = Purchase.objects.get(pk=self.purchase.pk).paid_at
+        self.assertEqual(apply_outcomes([charge('REF-1')]), {'paid': 0, 'failed': 0, 'unchanged': 1, 'unknown': 0})
+        purchase = Purchase.objects.get(pk=self.purchase.pk)
+        self.assertEqual(purchase.status, Purchase.Status.PAID)
+        self.assertEqual(purchase.paid_at, paid_at)
+
+    def test_success_wins_over_failure(self):
+        summary = apply_outcomes([charge('REF-1', 'failed'), charge('REF-1'), charge('REF-1', 'abandoned')])
+        self.assertEqual(summary['paid'], 1)
+        # A late failure never downgrades a paid purchase
+        apply_outcomes([charge('REF-1', 'failed')])
+        self.assertEqual(Purchase.objects.get(pk=self.purchase.pk).status, Purchase.Status.PAID)
+
+    def test_failure_only_from_pending(self):
+        self.assertEqual(apply_outcomes([charge('REF-1', 'failed')])['failed'], 1)
+        self.assertEqual(Purchase.objects.get(pk=self.purchase.pk).status, Purchase.Status.FAILED)
+        # Paystack took the money after all
+        apply_outcomes([charge('REF-1')])
+        self.assertEqual(Purchase.objects.get(pk=self.purchase.pk).status, Purchase.Status.PAID)
+
+    def test_underpayment_is_not_settled(self):
+        with self.assertLogs('projects.settlement', 'ERROR'):
+            summary = apply_outcomes([charge('REF-1', amount=50000), charge('REF-2')])
+        self.assertEqual(summary, {'paid': 0, 'failed': 0, 'unchanged': 1, 'unknown': 1})
+        self.assertEqual(Purchase.objects.get(pk=self.purchase.pk).status, Purchase.Status.PENDING)
+
+    def test_webhook_settles_before_acknowledging_without_redis(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.post_webhook('charge.success', charge('REF-1'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Purchase.objects.get(pk=self.purchase.pk).status, Purchase.Status.PAID)
+        self.assertEqual(entitlements.purchase_id_for(self.user, self.project.pk), self.purchase.pk)
+
+        # Redelivery is harmless
+        self.assertEqual(self.post_webhook('charge.success', charge('REF-1')).status_code, 200)
+        self.assertEqual(Purchase.objects.filter(status=Purchase.Status.PAID).count(), 1)
+
+    def test_webhook_rejects_bad_signature(self):
+        response = self.client.post(
+            reverse('payments-webhook'), json.dumps({'event': 'charge.success', 'data': charge('REF-1')}),
+            content_type='application/json', HTTP_X_PAYSTACK_SIGNATURE='forged',
+        )
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(Purchase.objects.get(pk=self.purchase.pk).status, Purchase.Status.PENDING)
+
+
+@override_settings(DOCUMENT_WORKERS=0)
+class EntitlementTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='buyer', email='buyer@example.com', password='pw')
+        department = Department.objects.create(name='Computer Science')
+        cls.project = make_project(department, 1, price=1000)
+        cls.other = make_project(department, 2, price=1000)
+
+    def setUp(self):
+        cache.clear()
+
+    def buy(self, project, status=Purchase.Status.PAID):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Purchase.objects.create(
+                user=self.user, project=project, amount=1000, paystack_reference=f'REF-{project.pk}',
+                status=status, paid_at=timezone.now() if status == Purchase.Status.PAID else None,
+            )
+
+    def test_mapping_is_cached(self):
+        purchase = self.buy(self.project)
+        self.assertEqual(entitlements.owned_project_ids(self.user), {self.project.pk})
+        with self.assertNumQueries(0):
+            self.assertEqual(entitlements.purchase_id_for(self.user, self.project.pk), purchase.pk)
+            self.assertTrue(entitlements.owns(self.user, self.project.pk))
+
+    def test_purchase_save_invalidates(self):
+        purchase = self.buy(self.project, Purchase.Status.PENDING)
+        self.assertFalse(entitlements.owns(self.user, self.project.pk))
+        with self.captureOnCommitCallbacks(execute=True):
+            purchase.status = Purchase.Status.PAID
+            purchase.save()
+        self.assertTrue(entitlements.owns(self.user, self.project.pk))
+
+    def test_missed_invalidation_falls_back_to_the_database(self):
+        self.assertFalse(entitlements.owns(self.user, self.project.pk))
+        # Paid through another process whose invalidation never reached this cache
+        with self.captureOnCommitCallbacks(execute=False):
+            purchase = Purchase.objects.create(
+                user=self.user, project=self.project, amount=1000, paystack_reference='REF-LATE',
+                status=Purchase.Status.PAID, paid_at=timezone.now(),
+            )
+        self.assertFalse(entitlements.owns(self.user, self.project.pk))
+
+        self.assertEqual(entitlements.purchase_id_for(self.user, self.project.pk), purchase.pk)
+        # The stale mapping was dropped
+        self.assertTrue(entitlements.owns(self.user, self.project.pk))
+        self.assertIsNone(entitlements.purchase_id_for(self.user, self.other.pk))
+
+
+@override_settings(DOCUMENT_WORKERS=0, STATS_ROLLUP_INTERVAL=60)
+class StatsRollupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='buyer', email='buyer@example.com', password='pw')
+        cls.department = Department.objects.create(name='Computer Science')
+        cls.project = make_project(cls.department, 1, price=1000)
+
+    def setUp(self):
+        cache.clear()
+        stats.get_event_log(stats.DIRTY_LOG).drain()
+
+    def pay(self, reference, amount, paid_at=None):
+        return Purchase.objects.create(
+            user=self.user, project=self.project, amount=amount, paystack_reference=reference,
+            status=Purchase.Status.PAID, paid_at=paid_at or timezone.now(),
+        )
+
+    def test_rebuild_totals(self):
+        self.pay('REF-1', 1000)
+        self.pay('REF-2', 500, timezone.now() - timedelta(days=40))
+        Download.objects.create(user=self.user, project=self.project)
+
+        summary = stats.rollup()
+        self.assertEqual(summary.total_purchases, 2)
+        self.assertEqual(summary.total_revenue, Decimal('1500'))
+        self.assertEqual(summary.total_downloads, 1)
+        self.assertEqual(summary.downloads_today, 1)
+        self.assertEqual(DailyStats.objects.filter(department=self.department).count(), 2)
+
+    def test_incremental_rollup_adjusts_totals(self):
+        old = self.pay('REF-1', 500, timezone.now() - timedelta(days=40))
+        stats.rollup()
+
+        self.pay('REF-2', 1000)
+        # A refund of an old purchase marks its day dirty
+        old.status = Purchase.Status.REFUNDED
+        old.save()
+        summary = stats.rollup_recent()
+        self.assertEqual(summary.total_purchases, 1)
+        self.assertEqual(summary.total_revenue, Decimal('1000'))
+        self.assertEqual(stats.rollup().total_revenue, Decimal('1000'))
+
+    def test_summary_counts_pending_projects_live(self):
+        stats.rollup()
+        make_project(self.department, 2, status=ProjectMaterial.Status.PENDING)
+        summary = stats.get_summary()
+        self.assertEqual(summary.pending_projects, 1)
+        self.assertEqual(summary.total_projects, 1)
+
+    def test_stale_summary_is_rolled_up_on_read(self):
+        stats.rollup()
+        self.pay('REF-1', 1000)
+        StatsSummary.objects.update(updated_at=timezone.now() - timedelta(minutes=5))
+        cache.delete(stats.SUMMARY_KEY)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            summary = stats.get_summary()
+        self.assertEqual(summary.total_revenue, Decimal('1000'))
+        # Fresh again: cached, only pending_projects is counted
+        with self.assertNumQueries(1):
+            self.assertEqual(stats.get_summary().total_revenue, Decimal('1000'))
+
+
+class MediaRootMixin:
+    """Runs each test against an empty, temporary MEDIA_ROOT."""
+
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media = self.settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+
+@override_settings(DOCUMENT_WORKERS=0)
+class ContentAddressedStorageTests(MediaRootMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(name='Computer Science')
+
+    def upload(self, index, content, name='thesis.PDF'):
+        with self.captureOnCommitCallbacks(execute=True):
+            return make_project(self.department, index, document_file=ContentFile(content, name=name))
+
+    def refs(self, name):
+        return ContentBlob.objects.filter(name=name).values_list('ref_count', flat=True).first()
+
+    def test_identical_uploads_share_one_blob(self):
+        first = self.upload(1, b'same thesis')
+        second = self.upload(2, b'same thesis', name='copy.pdf')
+        name = first.document_file.name
+        self.assertEqual(name, storage.blob_name(hashlib.sha256(b'same thesis').hexdigest(), '.pdf'))
+        self.assertEqual(second.document_file.name, name)
+        self.assertEqual(self.refs(name), 2)
+        self.assertEqual(len(os.listdir(os.path.dirname(storage.content_storage.path(name)))), 1)
+
+    def test_blob_is_deleted_with_its_last_reference(self):
+        first = self.upload(1, b'same thesis')
+        second = self.upload(2, b'same thesis')
+        name = first.document_file.name
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertEqual(self.refs(name), 1)
+        self.assertTrue(storage.content_storage.exists(name))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertIsNone(self.refs(name))
+        self.assertFalse(storage.content_storage.exists(name))
+
+    def test_replacing_a_file_releases_the_old_one(self):
+        project = self.upload(1, b'first draft')
+        old = project.document_file.name
+        with self.captureOnCommitCallbacks(execute=True):
+            project.document_file = ContentFile(b'final version', name='final.pdf')
+            project.save()
+        self.assertIsNone(self.refs(old))
+        self.assertFalse(storage.content_storage.exists(old))
+        self.assertEqual(self.refs(project.document_file.name), 1)
+
+    def test_unrelated_saves_keep_counts(self):
+        project = self.upload(1, b'thesis')
+        project = ProjectMaterial.objects.get(pk=project.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            project.title = 'Renamed'
+            project.save()
+        self.assertEqual(self.refs(project.document_file.name), 1)
+
+
+@override_settings(DOCUMENT_WORKERS=0, UPLOAD_CHUNK_SIZE=4)
+class ChunkedUploadTests(MediaRootMixin, TestCase):
+    CONTENT = b'0123456789'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(name='Computer Science')
+        cls.admin = User.objects.create_user(
+            username='admin', email='admin@example.com', password='x', role=User.Roles.ADMIN,
+        )
+        cls.other_admin = User.objects.create_user(
+            username='other', email='other@example.com', password='x', role=User.Roles.ADMIN,
+        )
+
+    def setUp(self):
+        super().setUp()
+        upload_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, upload_root, ignore_errors=True)
+        chunked = self.settings(CHUNKED_UPLOAD_ROOT=upload_root)
+        chunked.enable()
+        self.addCleanup(chunked.disable)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def start(self, content=CONTENT, **data):
+        data = {'filename': 'thesis.pdf', 'size': len(content), **data}
+        response = self.client.post('/api/uploads/', data, format='json')
+        self.assertEqual(response.status_code, 201, response.data)
+        return response.data['id']
+
+    def put_part(self, upload_id, index, body, checksum=None):
+        if checksum is None:
+            checksum = hashlib.sha256(body).hexdigest()
+        return self.client.put(
+            f'/api/uploads/{upload_id}/parts/{index}/', body,
+            content_type='application/octet-stream', HTTP_X_CHUNK_SHA256=checksum,
+        )
+
+    def put_all(self, upload_id, content=CONTENT):
+        for index in range(0, -(-len(content) // 4)):
+            response = self.put_part(upload_id, index, content[index * 4:index * 4 + 4])
+            self.assertEqual(response.status_code, 200, response.data)
+
+    def complete(self, upload_id):
+        # Assembly starts once complete()'s transaction commits
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f'/api/uploads/{upload_id}/complete/')
+        return response
+
+    def test_part_is_verified(self):
+        upload_id = self.start()
+        self.assertEqual(self.put_part(upload_id, 0, b'0123', checksum='0' * 64).status_code, 400)
+        self.assertEqual(self.put_part(upload_id, 0, b'01234').status_code, 400)
+        self.assertEqual(self.put_part(upload_id, 0, b'012').status_code, 400)
+        self.assertEqual(self.put_part(upload_id, 3, b'01').status_code, 400)
+        self.assertEqual(self.client.get(f'/api/uploads/{upload_id}/').data['received_parts'], [])
+
+        self.assertEqual(self.put_part(upload_id, 2, b'89').status_code, 200)
+        self.assertEqual(self.client.get(f'/api/uploads/{upload_id}/').data['received_parts'], [2])
+
+    def test_complete_requires_every_part(self):
+        upload_id = self.start()
+        self.put_part(upload_id, 0, b'0123')
+        response = self.complete(upload_id)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['detail'], 'Missing parts: 1, 2.')
+        self.assertEqual(UploadSession.objects.get(pk=upload_id).status, UploadSession.Status.UPLOADING)
+
+    def test_complete_attaches_the_file(self):
+        project = make_project(self.department, 1)
+        upload_id = self.start(project_id=project.pk, sha256=hashlib.sha256(self.CONTENT).hexdigest())
+        self.put_all(upload_id)
+        self.assertEqual(self.complete(upload_id).status_code, 202)
+        # Completing again reports the finished upload
+        response = self.complete(upload_id)
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data['status'], UploadSession.Status.COMPLETE)
+
+        project.refresh_from_db()
+        self.assertEqual(project.document_file.name, response.data['stored_name'])
+        with project.document_file.open('rb') as f:
+            self.assertEqual(f.read(), self.CONTENT)
+        # The parts are removed once stored
+        self.assertFalse(os.path.exists(uploads.session_dir(UploadSession.objects.get(pk=upload_id))))
+
+    def test_assembling_answers_accepted(self):
+        upload_id = self.start()
+        self.put_all(upload_id)
+        # A worker picks the assembly up later
+        with mock.patch.object(uploads.documents, 'submit', return_value=True):
+            response = self.complete(upload_id)
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data['status'], UploadSession.Status.ASSEMBLING)
+        self.assertEqual(self.put_part(upload_id, 0, b'0123').status_code, 400)
+
+        uploads.assemble(upload_id)
+        self.assertEqual(self.client.get(f'/api/uploads/{upload_id}/').data['status'], UploadSession.Status.COMPLETE)
+
+    def test_checksum_mismatch_fails_the_upload(self):
+        upload_id = self.start(sha256='0' * 64)
+        self.put_all(upload_id)
+        self.complete(upload_id)
+        data = self.client.get(f'/api/uploads/{upload_id}/').data
+        self.assertEqual(data['status'], UploadSession.Status.FAILED)
+        self.assertEqual(data['error'], 'Checksum mismatch for the assembled file.')
+        self.assertEqual(data['stored_name'], '')
+
+        response = self.complete(upload_id)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['detail'], 'Checksum mismatch for the assembled file.')
+
+    def test_uploads_belong_to_their_user(self):
+        upload_id = self.start()
+        self.put_all(upload_id)
+        self.complete(upload_id)
+        self.assertIsNotNone(uploads.completed_upload(upload_id, 'document_file', self.admin))
+        self.assertIsNone(uploads.completed_upload(upload_id, 'document_file', self.other_admin))
+
+        self.client.force_authenticate(self.other_admin)
+        self.assertEqual(self.client.get(f'/api/uploads/{upload_id}/').status_code, 404)
+        self.assertEqual(self.complete(upload_id).status_code, 404)
+
+    def test_students_cannot_upload(self):
+        student = User.objects.create_user(username='student', email='student@example.com', password='x')
+        self.client.force_authenticate(student)
+        response = self.client.post('/api/uploads/', {'filename': 'thesis.pdf', 'size': 10}, format='json')
+        self.assertEqual(response.status_code, 403)
+
+
+THESIS_DOCX = [
+    docx_paragraph('A STUDY OF RAINFALL'),
+    docx_paragraph('CHAPTER ONE ........ 1', style='TOC1'),
+    docx_paragraph('CHAPTER ONE', page_break='page'),
+    docx_paragraph('INTRODUCTION', style='Kop1'),
+    docx_paragraph('Rain falls mostly in the wet season.'),
+    docx_paragraph('CHAPTER TWO: LITERATURE REVIEW', page_break='rendered'),
+    docx_paragraph('Earlier work measured it by hand.'),
+]
+
+THESIS_PDF = [
+    ['A STUDY OF RAINFALL', 'Department of Geography (2024)'],
+    ['CHAPTER ONE', 'INTRODUCTION', 'Rain falls mostly in the wet season.'],
+    ['CHAPTER TWO', 'LITERATURE REVIEW', 'Earlier work measured it by hand.'],
+]
+
+
+@override_settings(DOCUMENT_WORKERS=0)
+class DocumentMetadataTests(MediaRootMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(name='Geography')
+
+    def upload(self, content, name):
+        with self.captureOnCommitCallbacks(execute=True):
+            project = make_project(self.department, 1, document_file=ContentFile(content, name=name))
+        return project.pk
+
+    def process(self, content, name):
+        project_id = self.upload(content, name)
+        status = documents.process_document(project_id)
+        project = ProjectMaterial.objects.get(pk=project_id)
+        self.assertEqual(project.processing_status, status)
+        return project
+
+    def test_docx(self):
+        project = self.process(make_docx(THESIS_DOCX, pages=14), 'thesis.docx')
+        self.assertEqual(project.processing_status, ProjectMaterial.ProcessingStatus.DONE)
+        self.assertEqual(project.file_format, 'DOCX')
+        # Word's recorded page count, not the page breaks in the body
+        self.assertEqual(project.page_count, 14)
+        self.assertEqual(project.word_count, 28)
+        # Title-cased style id "Kop1" is a localized heading 1; TOC entries are skipped
+        self.assertEqual(project.chapter_headings, ['CHAPTER ONE: INTRODUCTION', 'CHAPTER TWO: LITERATURE REVIEW'])
+        self.assertEqual(project.preview_pages, 2)
+
+    def test_docx_without_chapters_uses_heading_styles(self):
+        paragraphs = [
+            docx_paragraph('Background', style='Kop1'),
+            docx_paragraph('Some text.'),
+            docx_paragraph('Findings', style='Kop1'),
+        ]
+        metadata = documents.extract_docx(io.BytesIO(make_docx(paragraphs)))
+        self.assertEqual(metadata, {'page_count': None, 'word_count': 4, 'chapter_headings': ['Background', 'Findings']})
+
+    def test_pdf(self):
+        project = self.process(make_pdf(THESIS_PDF), 'thesis.pdf')
+        self.assertEqual(project.processing_status, ProjectMaterial.ProcessingStatus.DONE)
+        self.assertEqual(project.file_format, 'PDF')
+        self.assertEqual(project.page_count, 3)
+        self.assertEqual(project.word_count, 28)
+        self.assertEqual(project.chapter_headings, ['CHAPTER ONE: INTRODUCTION', 'CHAPTER TWO: LITERATURE REVIEW'])
+        self.assertEqual(project.preview_pages, 2)
+
+    def test_pdf_outline_wins_over_page_text(self):
+        content = make_pdf(THESIS_PDF, outline=['Preliminary Pages', 'Chapter 1: Background', 'Chapter 2: Methods'])
+        metadata = documents.extract_pdf(io.BytesIO(content))
+        self.assertEqual(metadata['chapter_headings'], ['Chapter 1: Background', 'Chapter 2: Methods'])
+
+    def test_corrupt_docx_fails(self):
+        with self.assertLogs('projects.documents', 'INFO'):
+            project = self.process(b'not a zip archive', 'thesis.docx')
+        self.assertEqual(project.processing_status, ProjectMaterial.ProcessingStatus.FAILED)
+        self.assertEqual(project.file_format, 'DOCX')
+        self.assertIsNone(project.page_count)
+        self.assertEqual(project.chapter_headings, [])
+
+    def test_corrupt_pdf_fails(self):
+        with self.assertLogs('projects.documents', 'INFO'):
+            project = self.process(b'%PDF-1.4\ngarbage', 'thesis.pdf')
+        self.assertEqual(project.processing_status, ProjectMaterial.ProcessingStatus.FAILED)
+        self.assertEqual(project.file_format, 'PDF')
+        self.assertIsNone(project.word_count)
+
+
+@override_settings(DOCUMENT_WORKERS=0)
+class ProcessDocumentsCommandTests(MediaRootMixin, TransactionTestCase):
+    def test_processes_pending_documents(self):
+        department = Department.objects.create(name='Geography')
+        good = make_project(department, 1, document_file=ContentFile(make_pdf(THESIS_PDF), name='good.pdf'))
+        bad = make_project(department, 2, document_file=ContentFile(b'not a zip archive', name='bad.docx'))
+        make_project(department, 3, document_file='')
+
+        output = io.StringIO()
+        with self.assertLogs('projects.documents', 'INFO'):
+            call_command('process_documents', '--workers', '2', stdout=output)
+        self.assertIn('Processed 2 documents: 1 done, 1 failed', output.getvalue())
+        statuses = dict(ProjectMaterial.objects.values_list('pk', 'processing_status'))
+        self.assertEqual(statuses[good.pk], ProjectMaterial.ProcessingStatus.DONE)
+        self.assertEqual(statuses[bad.pk], ProjectMaterial.ProcessingStatus.FAILED)
+
+        # Processed documents are skipped unless --all
+        output = io.StringIO()
+        call_command('process_documents', stdout=output)
+        self.assertIn('Processed 0 documents', output.getvalue())
+
+
+@override_settings(DOCUMENT_WORKERS=0, PREVIEW_PAGES=2)
+class PreviewTests(MediaRootMixin, TestCase):
+    def test_docx_pages_end_at_breaks(self):
+        content = make_docx([
+            docx_paragraph('Title page'),
+            docx_paragraph('Declaration', page_break='page'),
+            docx_paragraph('Abstract', page_break='rendered'),
+            docx_paragraph('Chapter one', page_break='page'),
+        ])
+        self.assertEqual(previews.docx_pages(io.BytesIO(content), 10), [
+            ['Title page'], ['Declaration'], ['Abstract'], ['Chapter one'],
+        ])
+        self.assertEqual(previews.docx_pages(io.BytesIO(content), 2), [['Title page'], ['Declaration']])
+
+    def test_docx_pages_split_long_text(self):
+        content = make_docx([docx_paragraph(f'paragraph {i} text') for i in range(4)])
+        with mock.patch.object(previews, 'PAGE_WORDS', 5):
+            pages = previews.docx_pages(io.BytesIO(content), 10)
+        self.assertEqual(pages, [
+            ['paragraph 0 text', 'paragraph 1 text'], ['paragraph 2 text', 'paragraph 3 text'],
+        ])
+
+    def test_excerpt_truncates_and_escapes(self):
+        pages = [['Salt <NaCl> & water'], ['dissolves', 'quickly in heat']]
+        self.assertEqual(
+            previews.excerpt_html(pages, words=6),
+            '<p>Salt &lt;NaCl&gt; &amp; water</p>\n<p>dissolves</p>\n<p>quickly…</p>',
+        )
+        self.assertEqual(previews.excerpt_html(pages), (
+            '<p>Salt &lt;NaCl&gt; &amp; water</p>\n<p>dissolves</p>\n<p>quickly in heat</p>'
+        ))
+
+    def generate(self, content=None):
+        content = content or make_docx(THESIS_DOCX)
+        return previews.generate(io.BytesIO(content), 'thesis.docx')
+
+    def test_generate(self):
+        content = make_docx(THESIS_DOCX)
+        digest = hashlib.sha256(content).hexdigest()
+        self.assertEqual(self.generate(content), {'document_hash': digest, 'preview_pages': 2})
+        for name in ('page-1.png', 'page-2.png', 'excerpt.html', 'manifest.json'):
+            self.assertTrue(default_storage.exists(previews.asset_path(digest, name)), name)
+        self.assertFalse(default_storage.exists(previews.asset_path(digest, 'page-3.png')))
+
+    def test_generate_reuses_manifest(self):
+        first = self.generate()
+        read_pages = mock.Mock()
+        with mock.patch.object(previews, 'render_thumbnail') as render, \
+                mock.patch.dict(previews.PAGE_READERS, {'.docx': read_pages}):
+            self.assertEqual(self.generate(), first)
+        render.assert_not_called()
+        read_pages.assert_not_called()
+
+    def asset(self, digest, name, **headers):
+        return self.client.get(reverse('preview-asset', args=[digest, name]), **headers)
+
+    def test_asset_response(self):
+        digest = self.generate()['document_hash']
+        response = self.asset(digest, 'page-1.png')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertEqual(response['Cache-Control'], 'public, max-age=31536000, immutable')
+        self.assertTrue(b''.join(response.streaming_content).startswith(b'\x89PNG'))
+
+        response = self.asset(digest, 'excerpt.html')
+        self.assertEqual(response['Content-Type'], 'text/html; charset=utf-8')
+        self.assertIn(b'<p>A STUDY OF RAINFALL</p>', b''.join(response.streaming_content))
+
+    def test_asset_not_modified(self):
+        digest = self.generate()['document_hash']
+        etag = self.asset(digest, 'page-2.png')['ETag']
+        response = self.asset(digest, 'page-2.png', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response['Cache-Control'], 'public, max-age=31536000, immutable')
+        # Another asset of the same document has its own validator
+        self.assertEqual(self.asset(digest, 'page-1.png', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_unknown_assets_are_not_found(self):
+        digest = self.generate()['document_hash']
+        self.assertEqual(self.asset(digest, 'manifest.json').status_code, 404)
+        self.assertEqual(self.asset(digest, 'page-3.png').status_code, 404)
+        self.assertEqual(self.asset('0' * 64, 'page-1.png').status_code, 404)
+
+
+def search(query):
+    return list(
+        search_projects(ProjectMaterial.objects.all(), query)
+        .order_by('-search_rank', 'pk')
+        .values_list('title', flat=True)
+    )
+
+
+@override_settings(DOCUMENT_WORKERS=0)
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(name='Computer Science')
+        make_project(cls.department, 1, title='Crop yield survey', description='Uses robotics for harvesting')
+        make_project(cls.department, 2, title='Robotics in agriculture')
+        make_project(cls.department, 3, title='Hospital records', keywords='robotics, scheduling')
+
+    def setUp(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('Tests the SQLite FTS5 index')
+
+    def test_ranked_by_field_weight(self):
+        # title > keywords > description
+        self.assertEqual(
+            search('robotics'), ['Robotics in agriculture', 'Hospital records', 'Crop yield survey'],
+        )
+
+    def test_words_are_prefix_matched(self):
+        self.assertEqual(search('agri robot'), ['Robotics in agriculture'])
+        self.assertEqual(len(search('computer scien')), 3)
+
+    def test_triggers_keep_the_index_current(self):
+        project = make_project(self.department, 4, title='Solar inverter design')
+        self.assertEqual(search('inverter'), ['Solar inverter design'])
+
+        project.title = 'Wind turbine design'
+        project.save()
+        self.assertEqual(search('inverter'), [])
+        self.assertEqual(search('turbine'), ['Wind turbine design'])
+
+        self.department.name = 'Electrical Engineering'
+        self.department.save()
+        self.assertEqual(len(search('electrical')), 4)
+
+        project.delete()
+        self.assertEqual(search('turbine'), [])
+
+    def test_empty_and_punctuation_queries(self):
+        # An empty query doesn't filter; one without any word matches nothing
+        queryset = ProjectMaterial.objects.all()
+        self.assertIs(search_projects(queryset, '   '), queryset)
+        self.assertEqual(search('?! -- "'), [])
+        response = APIClient().get('/api/projects/', {'search': '?!'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'], [])
+        # FTS5 operators in the query are matched as plain words
+        self.assertEqual(search('robotics OR NEAR("x")'), [])
+
+
+@override_settings(DOCUMENT_WORKERS=0)
+class SearchMigrationTests(TransactionTestCase):
+    def test_index_survives_table_rebuilds(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('Tests the SQLite FTS5 triggers')
+        # 0010 and 0012 rebuild projects_projectmaterial around the triggers
+        call_command('migrate', 'projects', '0009', verbosity=0)
+        call_command('migrate', 'projects', verbosity=0)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' ORDER BY name")
+            self.assertEqual([row[0] for row in cursor.fetchall()], [
+                'projects_department_fts_rename', 'projects_projectmaterial_fts_delete',
+                'projects_projectmaterial_fts_insert', 'projects_projectmaterial_fts_update',
+            ])
+        make_project(Department.objects.create(name='Physics'), 1, title='Quantum dots')
+        self.assertEqual(search('quantum'), ['Quantum dots'])
+
+
+@override_settings(DOCUMENT_WORKERS=0)
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        department = Department.objects.create(name='Computer Science')
+        cls.projects = [make_project(department, i) for i in range(7)]
+        # Equal sort keys: pages must split them by id without repeats or gaps
+        ProjectMaterial.objects.filter(pk__in=[p.pk for p in cls.projects[2:5]]).update(
+            created_at=cls.projects[2].created_at,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def paginator(self, ordering='-created_at', per_page=3):
+        return KeysetPaginator(ProjectMaterial.objects.all(), ordering, per_page)
+
+    def test_cursor_round_trip(self):
+        paginator = self.paginator()
+        project = ProjectMaterial.objects.get(pk=self.projects[3].pk)
+        values, reverse = paginator.decode_cursor(paginator.encode_cursor(project, reverse=True))
+        self.assertEqual(values, [project.created_at, project.pk])
+        self.assertTrue(reverse)
+
+    def test_invalid_cursors(self):
+        paginator = self.paginator()
+        for cursor in ('not-a-cursor', 'e30', paginator.encode_cursor(self.projects[0], False)[:-4]):
+            with self.assertRaises(InvalidCursor):
+                paginator.decode_cursor(cursor)
+        # A cursor from another ordering has a different number of keys
+        cursor = self.paginator('id').encode_cursor(self.projects[0], False)
+        with self.assertRaisesMessage(InvalidCursor, 'does not match'):
+            paginator.decode_cursor(cursor)
+
+    def test_walk_forward_and_back(self):
+        paginator = self.paginator()
+        expected = list(ProjectMaterial.objects.order_by('-created_at', '-id').values_list('pk', flat=True))
+        pages = [paginator.get_page()]
+        while pages[-1].has_next():
+            pages.append(paginator.get_page(pages[-1].next_cursor))
+        self.assertEqual([[p.pk for p in page] for page in pages], [expected[:3], expected[3:6], expected[6:]])
+        self.assertFalse(pages[0].has_previous())
+
+        previous = paginator.get_page(pages[-1].previous_cursor)
+        self.assertEqual([p.pk for p in previous], expected[3:6])
+        first = paginator.get_page(previous.previous_cursor)
+        self.assertEqual([p.pk for p in first], expected[:3])
+        self.assertFalse(first.has_previous())
+
+    @mock.patch.object(CatalogPagination, 'page_size', 3)
+    def test_api_cursor_mode(self):
+        # One page SELECT, no COUNT(*)
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/projects/', {'cursor': ''})
+        self.assertNotIn('count', response.data)
+        self.assertIsNone(response.data['previous'])
+        self.assertEqual(len(response.data['results']), 3)
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertIsNotNone(response.data['previous'])
+
+    def test_api_approximate_count(self):
+        response = self.client.get('/api/projects/', {'cursor': '', 'count': 'approximate'})
+        self.assertEqual(response.data['count'], 7)
+        self.assertTrue(response.data['count_is_approximate'])
+
+    def test_api_invalid_cursor(self):
+        response = self.client.get('/api/projects/', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+
+class DepartmentMatcherTests(SimpleTestCase):
+    matcher = topics.DepartmentMatcher([
+        'Computer Science', 'Computer Engineering', 'Electrical Engineering',
+        'Electrical and Electronics Engineering', 'Economics', 'Education and Economics',
+        'Mass Communication (MAC)',
+    ])
+
+    def assertMatch(self, query, department, score):
+        self.assertEqual(self.matcher.match(query), (department, score))
+
+    def test_exact(self):
+        self.assertMatch('computer science', 'Computer Science', topics.SCORE_EXACT)
+        self.assertMatch('  Computer-Science ', 'Computer Science', topics.SCORE_EXACT)
+        self.assertMatch('Education & Economics', 'Education and Economics', topics.SCORE_EXACT)
+        self.assertMatch('education economics', 'Education and Economics', topics.SCORE_EXACT)
+        self.assertMatch('mass communication', 'Mass Communication (MAC)', topics.SCORE_EXACT)
+
+    def test_prefix(self):
+        # The shortest alias wins
+        self.assertMatch('computer', 'Computer Science', topics.SCORE_PREFIX)
+        self.assertMatch('electrical and', 'Electrical and Electronics Engineering', topics.SCORE_PREFIX)
+
+    def test_query_in_name(self):
+        self.assertMatch('eng comp', 'Computer Engineering', topics.SCORE_QUERY_IN_NAME)
+        self.assertMatch('educ econ', 'Education and Economics', topics.SCORE_QUERY_IN_NAME)
+
+    def test_query_in_name_prefers_the_most_specific(self):
+        # Fewest name words first, then alphabetical
+        self.assertMatch('engineering', 'Computer Engineering', topics.SCORE_QUERY_IN_NAME)
+        self.assertMatch('electronics eng', 'Electrical and Electronics Engineering', topics.SCORE_QUERY_IN_NAME)
+
+    def test_name_in_query(self):
+        self.assertMatch('bsc economics dept', 'Economics', topics.SCORE_NAME_IN_QUERY)
+        # The longest contained name wins
+        self.assertMatch('education and economics department', 'Education and Economics', topics.SCORE_NAME_IN_QUERY)
+
+    def test_fuzzy(self):
+        self.assertMatch('computr science', 'Computer Science', topics.SCORE_FUZZY)
+        self.assertMatch('econmics', 'Economics', topics.SCORE_FUZZY)
+
+    def test_no_match(self):
+        for query in ('', '  ', '?!', 'zoology', 'bsc dept'):
+            self.assertMatch(query, None, 0)
+
+
+@override_settings(DOCUMENT_WORKERS=0, DOWNLOAD_OFFLOAD='')
+class FileDeliveryTests(MediaRootMixin, TestCase):
+    CONTENT = bytes(range(100))
+
+    def setUp(self):
+        super().setUp()
+        self.project = make_project(
+            Department.objects.create(name='Computer Science'), 1,
+            document_file=ContentFile(self.CONTENT, name='thesis.pdf'),
+        )
+        self.file = self.project.document_file
+
+    def serve(self, **headers):
+        response = delivery.serve_file(RequestFactory().get('/', **headers), self.file, 'thesis.pdf')
+        self.addCleanup(response.close)
+        return response
+
+    def body(self, response):
+        return b''.join(response.streaming_content) if response.streaming else response.content
+
+    def test_whole_file(self):
+        response = self.serve()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.body(response), self.CONTENT)
+        self.assertEqual(response['Content-Length'], '100')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="thesis.pdf"')
+
+    def test_ranges(self):
+        for header, start, end in (('bytes=10-19', 10, 19), ('bytes=95-', 95, 99), ('bytes=-5', 95, 99),
+                                   ('bytes=90-500', 90, 99)):
+            with self.subTest(header):
+                response = self.serve(HTTP_RANGE=header)
+                self.assertEqual(response.status_code, 206)
+                self.assertEqual(response['Content-Range'], f'bytes {start}-{end}/100')
+                self.assertEqual(response['Content-Length'], str(end - start + 1))
+                self.assertEqual(self.body(response), self.CONTENT[start:end + 1])
+
+    def test_unsatisfiable_range(self):
+        for header in ('bytes=100-', 'bytes=50-10', 'bytes=-0'):
+            with self.subTest(header):
+                response = self.serve(HTTP_RANGE=header)
+                self.assertEqual(response.status_code, 416)
+                self.assertEqual(response['Content-Range'], 'bytes */100')
+
+    def test_malformed_or_multiple_ranges_send_everything(self):
+        for header in ('bytes=0-1,5-6', 'lines=1-2', 'bytes=-'):
+            with self.subTest(header):
+                self.assertEqual(self.serve(HTTP_RANGE=header).status_code, 200)
+
+    def test_if_range(self):
+        etag = self.serve()['ETag']
+        last_modified = self.serve()['Last-Modified']
+        self.assertEqual(self.serve(HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE=etag).status_code, 206)
+        self.assertEqual(self.serve(HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE=last_modified).status_code, 206)
+
+        # The file changed since the client's partial download: send it all
+        for stale in ('"stale"', f'W/{etag}', 'Mon, 01 Jan 2001 00:00:00 GMT'):
+            with self.subTest(stale):
+                response = self.serve(HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE=stale)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(self.body(response), self.CONTENT)
+
+    def test_conditional_get(self):
+        etag = self.serve()['ETag']
+        response = self.serve(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertNotIn('Content-Disposition', response)
+
+    def test_bundle(self):
+        self.project.software_file = ContentFile(b'PK source', name='source.zip')
+        self.project.save()
+        files = [self.project.document_file, self.project.software_file]
+        request = RequestFactory().get('/')
+        response = delivery.serve_bundle(request, files, 'project-1.zip', names=['project-1.pdf', 'project-1.zip'])
+        data = b''.join(response.streaming_content)
+        self.assertEqual(response['Content-Length'], str(len(data)))
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            self.assertEqual(archive.namelist(), ['project-1.pdf', 'project-1.zip'])
+            self.assertEqual(archive.read('project-1.pdf'), self.CONTENT)
+
+        with mock.patch.object(zipstream, 'ZIP32_LIMIT', len(data) - 1):
+            with self.assertRaises(zipstream.ZipTooLarge):
+                delivery.serve_bundle(request, files, 'project-1.zip')
+
+    @override_settings(DOWNLOAD_OFFLOAD='x-accel', DOWNLOAD_ACCEL_PREFIX='/protected/')
+    def test_x_accel_redirect(self):
+        response = self.serve(HTTP_RANGE='bytes=0-9')
+        # nginx serves the file (and the range) itself
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['X-Accel-Redirect'], '/protected/' + self.file.name)
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="thesis.pdf"')
+
+    @override_settings(DOWNLOAD_OFFLOAD='x-sendfile')
+    def test_x_sendfile(self):
+        response = self.serve()
+        self.assertEqual(response['X-Sendfile'], self.file.path)
+        self.assertNotIn('X-Accel-Redirect', response)
+
+
+class ZipStreamTests(SimpleTestCase):
+    def member(self, name, content, modified=None):
+        return zipstream.ZipMember(name, len(content), lambda: io.BytesIO(content), modified)
+
+    def test_stream_is_a_valid_archive(self):
+        contents = {
+            'thesis.pdf': b'%PDF-1.4 ' * 10000,
+            'source/main.py': b'print("hello")\n',
+            'résumé.txt': b'',
+        }
+        members = [
+            self.member(name, content, datetime(2024, 5, 17, 14, 30, 12))
+            for name, content in contents.items()
+        ]
+        data = b''.join(zipstream.stream(members))
+        self.assertEqual(len(data), zipstream.archive_size(members))
+
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            self.assertIsNone(archive.testzip())
+            self.assertEqual(archive.namelist(), list(contents))
+            for info in archive.infolist():
+                self.assertEqual(info.CRC, zlib.crc32(contents[info.filename]))
+                self.assertEqual(info.compress_type, zipfile.ZIP_STORED)
+                self.assertEqual(info.date_time, (2024, 5, 17, 14, 30, 12))
+                self.assertEqual(archive.read(info), contents[info.filename])
+
+    def test_member_changing_size_aborts(self):
+        member = zipstream.ZipMember('thesis.pdf', 10, lambda: io.BytesIO(b'short'))
+        with self.assertRaisesMessage(IOError, 'changed size'):
+            b''.join(zipstream.stream([member]))
+
+    def test_zip64_sizes_are_refused(self):
+        huge = zipstream.ZipMember('big.iso', zipstream.ZIP32_LIMIT + 1, lambda: io.BytesIO())
+        with self.assertRaises(zipstream.ZipTooLarge):
+            next(zipstream.stream([huge]))
+
+        members = [self.member('a.pdf', b'a' * 60), self.member('b.pdf', b'b' * 60)]
+        with mock.patch.object(zipstream, 'ZIP32_LIMIT', zipstream.archive_size(members) - 1):
+            with self.assertRaises(zipstream.ZipTooLarge):
+                next(zipstream.stream(members))
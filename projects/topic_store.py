@@ -0,0 +1,314 @@
+# projects/topic_store.py
+"""
+Storage for the topic generator corpus.
+
+Topics live in the ``Topic`` table so admins can edit them without a
+redeploy; ``projects/data/topics.json`` is only the seed loaded by
+``manage.py load_topics`` (and the initial migration).
+
+Requests never read the table directly. The active topics are packed into
+a snapshot file::
+
+    MAGIC | header length (8 bytes, little endian) | JSON header | topic text
+
+The header holds the department list with each department's byte range,
+the BM25 corpus statistics and the summary served by the topic statistics
+endpoint. Every worker memory-maps the same file
+read-only, so the operating system keeps one shared copy in its page
+cache, and only the departments a worker is actually asked about get
+decoded.
+
+Editing topics removes the snapshot and bumps a version in the shared
+cache. Workers re-check both every ``TOPIC_SNAPSHOT_CHECK_INTERVAL``
+seconds and rebuild the file from the database when it is missing or
+behind; rebuilds replace the file atomically (``os.replace``), so readers
+never see a partial snapshot.
+"""
+import datetime
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+from django.utils import timezone
+
+from .constants import FACULTY_DEPARTMENTS
+from .topics import SCORE_QUERY_IN_NAME, DepartmentMatcher, TopicEngine, corpus_statistics, tokenize
+
+logger = logging.getLogger(__name__)
+
+TOPIC_DATA_FILE = Path(__file__).resolve().parent / 'data' / 'topics.json'
+
+SNAPSHOT_MAGIC = b'PHTOPIC1'
+_HEADER_LENGTH = struct.Struct('<Q')
+
+VERSION_KEY = 'topics:version'
+
+# Statistics histogram bucket widths
+TOPICS_PER_DEPARTMENT_BUCKET = 5
+TOPIC_LENGTH_BUCKET = 5
+UNKNOWN_FACULTY = 'Other'
+
+
+def read_topic_file(path=TOPIC_DATA_FILE):
+    """``({department: [topic, ...]}, [generic topic, ...])`` from a topics JSON file."""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get('departments', {}), data.get('default', [])
+
+
+def snapshot_path():
+    return Path(settings.TOPIC_SNAPSHOT_PATH)
+
+
+def _histogram(values, width):
+    """Contiguous ``width``-wide buckets from the smallest to the largest value."""
+    if not values:
+        return []
+    counts = {}
+    for value in values:
+        counts[value // width] = counts.get(value // width, 0) + 1
+    return [
+        {'min': bucket * width, 'max': bucket * width + width - 1, 'count': counts.get(bucket, 0)}
+        for bucket in range(min(counts), max(counts) + 1)
+    ]
+
+
+def topic_statistics(department_topics, default_topics, last_updated):
+    """
+    Corpus summary served by the topic statistics endpoint. Computed when a
+    snapshot is written, so requests only read it.
+    """
+    faculty_of = {dept: faculty for faculty, depts in FACULTY_DEPARTMENTS.items() for dept in depts}
+    matcher = DepartmentMatcher(faculty_of)
+
+    departments = []
+    faculties = {}
+    for name, topics in department_topics.items():
+        match, score = matcher.match(name)
+        faculty = faculty_of[match] if match and score >= SCORE_QUERY_IN_NAME else UNKNOWN_FACULTY
+        departments.append({'department': name, 'faculty': faculty, 'topic_count': len(topics)})
+        totals = faculties.setdefault(faculty, {'faculty': faculty, 'department_count': 0, 'topic_count': 0})
+        totals['department_count'] += 1
+        totals['topic_count'] += len(topics)
+    departments.sort(key=lambda d: (-d['topic_count'], d['department']))
+
+    total_departments = len(departments)
+    total_topics = sum(d['topic_count'] for d in departments)
+    all_topics = [topic for topics in department_topics.values() for topic in topics] + list(default_topics)
+    statistics = {
+        'total_departments': total_departments,
+        'total_topics': total_topics,
+        'generic_topics': len(default_topics),
+        'average_topics_per_department': total_topics // total_departments if total_departments > 0 else 0,
+        'departments': departments,
+        'faculties': sorted(faculties.values(), key=lambda f: (f['faculty'] == UNKNOWN_FACULTY, f['faculty'])),
+        'histograms': {
+            'topics_per_department': _histogram(
+                [d['topic_count'] for d in departments], TOPICS_PER_DEPARTMENT_BUCKET
+            ),
+            'topic_length_words': _histogram(
+                [len(tokenize(topic)) for topic in all_topics], TOPIC_LENGTH_BUCKET
+            ),
+        },
+        'last_updated': last_updated.isoformat() if last_updated else None,
+    }
+    statistics['digest'] = hashlib.sha1(
+        json.dumps(statistics, sort_keys=True).encode('utf-8')
+    ).hexdigest()
+    return statistics
+
+
+def write_snapshot(path, department_topics, default_topics, version=None, last_updated=None):
+    """Pack the corpus into a snapshot file at ``path``, replacing it atomically."""
+    path = Path(path)
+    body = bytearray()
+
+    def pack(topics):
+        # Topics are stored one per line
+        data = '\n'.join(' '.join(topic.split()) for topic in topics).encode('utf-8')
+        offset = len(body)
+        body.extend(data)
+        return [offset, len(data), len(topics)]
+
+    departments = {name: pack(topics) for name, topics in sorted(department_topics.items()) if topics}
+    default = pack(default_topics)
+    total, length, document_frequency = corpus_statistics(department_topics, default_topics)
+    header = json.dumps({
+        'version': version,
+        'generated_at': timezone.now().isoformat(),
+        'total_topics': total,
+        'total_length': length,
+        'document_frequency': document_frequency,
+        'departments': departments,
+        'default': default,
+        'statistics': topic_statistics(department_topics, default_topics, last_updated),
+    }, separators=(',', ':')).encode('utf-8')
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(_HEADER_LENGTH.pack(len(header)))
+            f.write(header)
+            f.write(body)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+class TopicSnapshot:
+    """Read-only, memory-mapped view of a snapshot file."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            raise ValueError(f'{path} is not a topic snapshot.')
+        start = len(SNAPSHOT_MAGIC) + _HEADER_LENGTH.size
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._map, len(SNAPSHOT_MAGIC))
+        header = json.loads(self._map[start:start + header_length])
+        self._body_start = start + header_length
+
+        self.version = header['version']
+        self.generated_at = header['generated_at']
+        self.total_topics = header['total_topics']
+        self.average_length = header['total_length'] / self.total_topics if self.total_topics else 0.0
+        self.document_frequency = header['document_frequency']
+        self._sections = header['departments']
+        self._default = header['default']
+        self.statistics = header['statistics']
+
+    @property
+    def departments(self):
+        return list(self._sections)
+
+    @property
+    def department_counts(self):
+        return {name: count for name, (_, _, count) in self._sections.items()}
+
+    def topics(self, department):
+        """Decode the topics of ``department`` (None for the generic topics)."""
+        offset, length, count = self._default if department is None else self._sections[department]
+        if not count:
+            return []
+        start = self._body_start + offset
+        return self._map[start:start + length].decode('utf-8').split('\n')
+
+
+def load_corpus():
+    """
+    Active topics from the database, grouped like ``read_topic_file``, plus
+    the time of the most recent topic edit.
+    """
+    from .models import Topic
+
+    last_updated = Topic.objects.aggregate(last_updated=Max('updated_at'))['last_updated']
+    department_topics = {}
+    default_topics = []
+    rows = Topic.objects.filter(is_active=True).order_by('department', 'id').values_list('department', 'text')
+    for department, text in rows.iterator():
+        if department:
+            department_topics.setdefault(department, []).append(text)
+        else:
+            default_topics.append(text)
+    return department_topics, default_topics, last_updated
+
+
+def build_snapshot(path=None):
+    """Write a fresh snapshot of the ``Topic`` table."""
+    # Read the version first so an edit made while loading triggers another rebuild
+    version = cache.get(VERSION_KEY)
+    department_topics, default_topics, last_updated = load_corpus()
+    if version is not None:
+        # The version is the time of the last edit, including deletions
+        changed_at = datetime.datetime.fromtimestamp(version / 1e9, tz=datetime.timezone.utc)
+        last_updated = max(last_updated, changed_at) if last_updated else changed_at
+    return write_snapshot(
+        path or snapshot_path(), department_topics, default_topics, version, last_updated,
+    )
+
+
+def mark_topics_changed():
+    """
+    Invalidate the snapshot after topic edits. Workers on this host see the
+    file disappear, other hosts see the new version; either way the next
+    check rebuilds it from the database.
+    """
+    global _checked_at
+    cache.set(VERSION_KEY, time.time_ns(), timeout=None)
+    try:
+        os.unlink(snapshot_path())
+    except FileNotFoundError:
+        pass
+    _checked_at = None
+
+
+def publish_topics():
+    """Invalidate and immediately rebuild the snapshot (after bulk loads)."""
+    mark_topics_changed()
+    return build_snapshot()
+
+
+_engine = None
+_engine_signature = None
+_checked_at = None
+_lock = threading.Lock()
+
+
+def _is_fresh(now):
+    checked_at = _checked_at
+    return (
+        _engine is not None and checked_at is not None
+        and now - checked_at < settings.TOPIC_SNAPSHOT_CHECK_INTERVAL
+    )
+
+
+def _open_engine(path):
+    stat = os.stat(path)
+    return TopicEngine(TopicSnapshot(path)), (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def get_topic_engine():
+    """The current process's TopicEngine, reloaded when the snapshot changes."""
+    global _engine, _engine_signature, _checked_at
+
+    now = time.monotonic()
+    if _is_fresh(now):
+        return _engine
+
+    with _lock:
+        if _is_fresh(now):
+            return _engine
+
+        path = snapshot_path()
+        if not path.exists():
+            logger.info(f"Building topic snapshot at {path}")
+            build_snapshot(path)
+
+        stat = os.stat(path)
+        if (stat.st_ino, stat.st_mtime_ns, stat.st_size) != _engine_signature:
+            _engine, _engine_signature = _open_engine(path)
+
+        version = cache.get(VERSION_KEY)
+        if version is not None and version != _engine.snapshot.version:
+            # Topics were edited on another host; this host's file is behind
+            logger.info(f"Rebuilding stale topic snapshot at {path}")
+            build_snapshot(path)
+            _engine, _engine_signature = _open_engine(path)
+
+        _checked_at = now
+    return _engine
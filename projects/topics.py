@@ -0,0 +1,320 @@
+# projects/topics.py
+"""
+Indexed topic lookup engine for the topic generator.
+
+When an engine is built from a topic snapshot it precomputes:
+
+* normalized department aliases in a hash map (exact matches) plus a sorted
+  alias list searched with ``bisect`` (prefix matches),
+* a token -> departments index for "query is part of the name" and
+  "name is part of the query" matches,
+* IDF values and a sorted vocabulary for keyword ranking and prefix
+  expansion,
+* a ``difflib`` fuzzy matcher over the aliases for typos.
+
+Per-topic BM25 weights are built lazily, one department at a time.
+
+Matching rules live in ``DepartmentMatcher.match`` and return a score
+so they can be checked in isolation.
+"""
+import bisect
+import difflib
+import math
+import random
+import re
+import unicodedata
+
+# Department match scores (a match needs at least MIN_MATCH_SCORE)
+SCORE_EXACT = 100
+SCORE_PREFIX = 90
+SCORE_QUERY_IN_NAME = 80
+SCORE_NAME_IN_QUERY = 70
+SCORE_FUZZY = 60
+MIN_MATCH_SCORE = 50
+
+FUZZY_CUTOFF = 0.8
+
+# Suggestions per department: default and upper bound for ?count=
+DEFAULT_TOPIC_COUNT = 2
+MAX_TOPIC_COUNT = 10
+
+# BM25 parameters for keyword relevance
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'as', 'at', 'by', 'for', 'from', 'in', 'into', 'of', 'on', 'or', 'the', 'to', 'with',
+})
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+_PARENS_RE = re.compile(r'\(.*?\)')
+
+
+def normalize(text):
+    """Lowercase, strip accents and punctuation, spell out '&' and collapse whitespace."""
+    text = unicodedata.normalize('NFKD', text or '').encode('ascii', 'ignore').decode()
+    text = text.lower().replace('&', ' and ')
+    return ' '.join(_WORD_RE.findall(text))
+
+
+def tokenize(text):
+    return normalize(text).split()
+
+
+def department_aliases(name):
+    """Normalized spellings a department can be looked up by."""
+    base = normalize(name)
+    aliases = {
+        base,
+        normalize(_PARENS_RE.sub(' ', name)),
+        ' '.join(token for token in base.split() if token != 'and'),
+    }
+    return {alias for alias in aliases if alias}
+
+
+def _prefix_range(sorted_words, prefix):
+    """Slice of ``sorted_words`` starting with ``prefix``."""
+    start = bisect.bisect_left(sorted_words, prefix)
+    end = bisect.bisect_left(sorted_words, prefix + '\uffff')
+    return sorted_words[start:end]
+
+
+def fallback_topics(department, default_topics):
+    """Generic topics for departments that have no dedicated topic list."""
+    generated = [
+        f"Design and Implementation of a {department} Management System",
+        f"Impact of Technology on {department} in Nigeria",
+        f"Challenges and Solutions in {department}: A Case Study of Nasarawa State University",
+        f"Modern Approaches to {department} in the 21st Century",
+        f"Comparative Analysis of Traditional and Modern {department} Methods",
+        f"Development of a Mobile Application for {department} Students",
+        f"Assessment of {department} Curriculum in Nigerian Universities",
+        f"Role of {department} in Sustainable Development",
+        f"Digital Transformation in {department}: Opportunities and Challenges",
+        f"Effect of Globalization on {department} Practices"
+    ]
+    # Remove duplicates while preserving order
+    return list(dict.fromkeys(generated + list(default_topics)))
+
+
+def corpus_statistics(department_topics, default_topics):
+    """
+    BM25 corpus statistics over every topic: ``(total topics, total token
+    length, {token: number of topics containing it})``.
+    """
+    total = length = 0
+    document_frequency = {}
+    for topics in [*department_topics.values(), default_topics]:
+        for topic in topics:
+            tokens = tokenize(topic)
+            total += 1
+            length += len(tokens)
+            for token in set(tokens):
+                document_frequency[token] = document_frequency.get(token, 0) + 1
+    return total, length, document_frequency
+
+
+class DepartmentMatcher:
+    """Fuzzy lookup of a department name among ``departments``."""
+
+    def __init__(self, departments):
+        self.alias_to_department = {}
+        self.department_tokens = {}
+        self.department_token_index = {}
+        for department in departments:
+            for alias in department_aliases(department):
+                self.alias_to_department.setdefault(alias, department)
+            tokens = frozenset(tokenize(department)) - {'and'}
+            self.department_tokens[department] = tokens
+            for token in tokens:
+                self.department_token_index.setdefault(token, set()).add(department)
+        self.sorted_aliases = sorted(self.alias_to_department)
+        self.department_vocabulary = sorted(self.department_token_index)
+
+    def _departments_with_prefix(self, prefix):
+        departments = set()
+        for token in _prefix_range(self.department_vocabulary, prefix):
+            departments |= self.department_token_index[token]
+        return departments
+
+    def match(self, query):
+        """Best department for ``query`` as ``(department, score)``; ``(None, 0)`` if none."""
+        normalized = normalize(query)
+        if not normalized:
+            return None, 0
+
+        # Exact alias
+        department = self.alias_to_department.get(normalized)
+        if department:
+            return department, SCORE_EXACT
+
+        # Alias starts with the query ("computer" -> "computer science")
+        prefixed = _prefix_range(self.sorted_aliases, normalized)
+        if prefixed:
+            return self.alias_to_department[min(prefixed, key=len)], SCORE_PREFIX
+
+        def most_specific(departments):
+            return min(departments, key=lambda d: (len(self.department_tokens[d]), d))
+
+        # Every query word (prefix-matched) is in the name ("sci" -> "computer science")
+        query_tokens = [token for token in normalized.split() if token != 'and']
+        candidates = None
+        for token in query_tokens:
+            matches = self._departments_with_prefix(token)
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                break
+        if candidates:
+            return most_specific(candidates), SCORE_QUERY_IN_NAME
+
+        # The whole name is in the query ("bsc economics dept" -> "economics")
+        query_set = set(query_tokens)
+        contained = {
+            department
+            for token in query_set
+            for department in self.department_token_index.get(token, ())
+            if self.department_tokens[department] <= query_set
+        }
+        if contained:
+            # Prefer the longest name ("education and economics" over "economics")
+            return max(contained, key=lambda d: (len(self.department_tokens[d]), d)), SCORE_NAME_IN_QUERY
+
+        # Typos
+        close = difflib.get_close_matches(normalized, self.sorted_aliases, n=1, cutoff=FUZZY_CUTOFF)
+        if close:
+            return self.alias_to_department[close[0]], SCORE_FUZZY
+
+        return None, 0
+
+
+class TopicEngine:
+    """
+    Topic lookups over a corpus ``snapshot`` (see projects/topic_store.py).
+
+    Department matching only needs the department names, so topics are
+    decoded and weighted per department the first time it is asked for.
+    BM25 weights use the corpus-wide statistics stored in the snapshot, so
+    lazily built departments score exactly as if everything were indexed.
+    """
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.departments = sorted(snapshot.departments)
+        self.average_length = snapshot.average_length
+        total = snapshot.total_topics
+        self.idf = {
+            token: math.log(1 + (total - df + 0.5) / (df + 0.5))
+            for token, df in snapshot.document_frequency.items()
+        }
+        self.vocabulary = sorted(self.idf)
+        # department (None for the generic topics) -> (texts, [{token: weight}, ...])
+        self._indexes = {}
+
+        self.matcher = DepartmentMatcher(self.departments)
+
+    def topics(self, department):
+        """Topic texts for ``department`` (None for the generic topics)."""
+        return self._index(department)[0]
+
+    @property
+    def default_topics(self):
+        return self.topics(None)
+
+    def _index(self, department):
+        index = self._indexes.get(department)
+        if index is None:
+            texts = self.snapshot.topics(department)
+            index = (texts, [self._topic_weights(text) for text in texts])
+            self._indexes[department] = index
+        return index
+
+    def match_department(self, query):
+        """Best department for ``query`` as ``(department, score)``; ``(None, 0)`` if none."""
+        return self.matcher.match(query)
+
+    # ---- keyword ranking (BM25) ----
+
+    def _topic_weights(self, text):
+        """BM25 weight of every token in one topic."""
+        words = tokenize(text)
+        counts = {}
+        for token in words:
+            counts[token] = counts.get(token, 0) + 1
+        return {
+            token: self._bm25(self.idf.get(token, 0.0), tf, len(words))
+            for token, tf in counts.items()
+        }
+
+    def _bm25(self, idf, tf, length):
+        norm = 1 - BM25_B + BM25_B * (length / self.average_length if self.average_length else 1)
+        return idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+
+    def expand_terms(self, keywords):
+        """Keyword string -> list of vocabulary expansions, one list per query word."""
+        terms = []
+        for token in tokenize(keywords):
+            if token in STOPWORDS:
+                continue
+            expansions = _prefix_range(self.vocabulary, token)
+            if expansions:
+                terms.append(expansions)
+        return terms
+
+    def score_weights(self, weights, terms):
+        """BM25 score of an indexed topic; a prefix-expanded word counts its best expansion."""
+        score = 0.0
+        for expansions in terms:
+            score += max(weights.get(token, 0.0) for token in expansions)
+        return score
+
+    def score_text(self, text, terms):
+        """BM25 score of text outside the index, using the corpus statistics."""
+        words = tokenize(text)
+        length = len(words)
+        score = 0.0
+        for expansions in terms:
+            best = 0.0
+            for token in expansions:
+                tf = words.count(token)
+                if tf:
+                    best = max(best, self._bm25(self.idf[token], tf, length))
+            score += best
+        return score
+
+    # ---- lookup ----
+
+    def suggest(self, department, keywords='', count=DEFAULT_TOPIC_COUNT, rng=None):
+        """
+        Pick ``count`` topic suggestions for ``department``.
+
+        Returns ``(matched_department, topics)``; ``matched_department`` is
+        None when the department is unknown and generic topics are used.
+        With keywords, topics are ranked by BM25 relevance and only matching
+        ones are returned (ties are broken by ``rng``); if nothing matches,
+        or without keywords, a random sample is returned.
+        """
+        rng = rng or random
+        terms = self.expand_terms(keywords)
+        matched, score = self.match_department(department)
+
+        if matched and score >= MIN_MATCH_SCORE:
+            texts, weights = self._index(matched)
+            scores = [self.score_weights(topic_weights, terms) for topic_weights in weights] if terms else []
+        else:
+            matched = None
+            generated = fallback_topics(department, ())
+            default_texts, default_weights = self._index(None)
+            texts = generated + default_texts
+            scores = []
+            if terms:
+                scores = [self.score_text(topic, terms) for topic in generated]
+                scores += [self.score_weights(topic_weights, terms) for topic_weights in default_weights]
+
+        ranked = [(score, text) for score, text in zip(scores, texts) if score > 0]
+        if ranked:
+            rng.shuffle(ranked)
+            ranked.sort(key=lambda item: item[0], reverse=True)
+            return matched, [text for _, text in ranked[:count]]
+
+        return matched, rng.sample(texts, min(count, len(texts)))
+
@@ -0,0 +1,274 @@
+# projects/uploads.py
+"""
+Chunked, resumable uploads of project files.
+
+Large documents and source archives are uploaded in parts instead of one
+multipart POST that a slow connection rarely finishes:
+
+1. ``POST /api/uploads/`` opens an ``UploadSession`` (file name, size,
+   target field, optionally the project and a SHA-256 of the whole file)
+   and returns the part size and count.
+2. ``PUT /api/uploads/<id>/parts/<n>/`` sends part ``n`` as the raw
+   request body, with its SHA-256 in the ``X-Chunk-SHA256`` header. The
+   body is streamed to disk and checked against the expected size and
+   checksum; a part is only kept once complete, and re-sending a part
+   replaces it.
+3. ``GET /api/uploads/<id>/`` lists the received parts, so a client
+   resumes after a disconnect by sending only the missing ones.
+4. ``POST /api/uploads/<id>/complete/`` checks that every part arrived,
+   marks the session ``assembling`` and answers 202 right away. A document
+   worker (projects/documents.py) then concatenates the parts into one
+   file in block-sized reads (never holding the file in memory), checks
+   the whole-file checksum and hands the file to the field's storage,
+   which moves it into place (projects/storage.py). None of that runs in
+   a request or inside a database transaction; only the final status
+   change is a short locked update. The client polls ``GET
+   /api/uploads/<id>/`` until the status is ``complete`` (or ``failed``,
+   with ``error``). If the session names a project, the file is attached
+   to it; otherwise the project form references the upload by id, which
+   only resolves for the user who uploaded it.
+
+Without document workers (DOCUMENT_WORKERS = 0) the assembly runs in the
+completing request instead. An assembly still unfinished ASSEMBLY_TIMEOUT
+seconds after it started (e.g. its process restarted) is started again
+by the next completion request.
+
+Parts live in CHUNKED_UPLOAD_ROOT/<session id>/, so uploading them needs
+no database writes. Sessions expire after UPLOAD_SESSION_TTL;
+``purge_expired`` removes them and their parts as a background job
+(projects/scheduler.py).
+"""
+import hashlib
+import logging
+import os
+import shutil
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+
+from . import documents
+from .models import ProjectMaterial, UploadSession
+
+logger = logging.getLogger(__name__)
+
+BLOCK_SIZE = 64 * 1024
+PURGE_LOCK_KEY = 'uploads:purge-lock'
+PURGE_INTERVAL = 60 * 60
+ASSEMBLY_TIMEOUT = 30 * 60
+
+ALLOWED_EXTENSIONS = {
+    UploadSession.Field.DOCUMENT: ('.pdf', '.doc', '.docx'),
+    UploadSession.Field.SOFTWARE: ('.zip', '.rar', '.7z'),
+}
+
+
+class UploadError(Exception):
+    pass
+
+
+class AssembledFile(File):
+    """An assembled upload on local disk; storages move it rather than copy it."""
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+def session_dir(session):
+    return os.path.join(settings.CHUNKED_UPLOAD_ROOT, str(session.pk))
+
+
+def _part_path(session, index):
+    return os.path.join(session_dir(session), f'{index:06d}.part')
+
+
+def open_session(user, field, filename, size, project=None, sha256=''):
+    """Validate and create an UploadSession."""
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in ALLOWED_EXTENSIONS[field]:
+        raise UploadError(f"{ext or 'Files without an extension'} not allowed; use {', '.join(ALLOWED_EXTENSIONS[field])}.")
+    if size <= 0:
+        raise UploadError('File is empty.')
+    if size > settings.UPLOAD_MAX_SIZE:
+        raise UploadError(f'File is larger than {settings.UPLOAD_MAX_SIZE} bytes.')
+    return UploadSession.objects.create(
+        user=user,
+        project=project,
+        field=field,
+        filename=os.path.basename(filename)[:255],
+        size=size,
+        chunk_size=settings.UPLOAD_CHUNK_SIZE,
+        sha256=sha256.lower(),
+        expires_at=timezone.now() + timedelta(seconds=settings.UPLOAD_SESSION_TTL),
+    )
+
+
+def received_parts(session):
+    """Sorted indexes of the parts stored for ``session``."""
+    try:
+        names = os.listdir(session_dir(session))
+    except FileNotFoundError:
+        return []
+    return sorted(int(name[:-5]) for name in names if name.endswith('.part') and name[:-5].isdigit())
+
+
+def write_part(session, index, stream, checksum=''):
+    """Store part ``index`` read from ``stream``, verifying its size and SHA-256."""
+    if session.status != UploadSession.Status.UPLOADING:
+        raise UploadError(f'Upload is {session.status}; it no longer accepts parts.')
+    if not 0 <= index < session.total_parts:
+        raise UploadError(f'Part must be between 0 and {session.total_parts - 1}.')
+
+    expected = session.part_size(index)
+    os.makedirs(session_dir(session), exist_ok=True)
+    temporary = f'{_part_path(session, index)}.{uuid.uuid4().hex}.tmp'
+    digest = hashlib.sha256()
+    written = 0
+    try:
+        with open(temporary, 'wb') as f:
+            while True:
+                # Read one byte past the expected size to detect oversized parts
+                block = stream.read(min(BLOCK_SIZE, expected - written + 1))
+                if not block:
+                    break
+                written += len(block)
+                if written > expected:
+                    raise UploadError(f'Part {index} is larger than {expected} bytes.')
+                digest.update(block)
+                f.write(block)
+        if written != expected:
+            raise UploadError(f'Part {index} has {written} bytes, expected {expected}.')
+        if checksum and digest.hexdigest() != checksum.lower():
+            raise UploadError(f'Checksum mismatch for part {index}.')
+        # Only complete, verified parts ever appear under their final name
+        os.replace(temporary, _part_path(session, index))
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def _assemble(session):
+    """Concatenate the parts into one file; returns its path and SHA-256."""
+    # Unique per run: a restarted assembly may overlap a lost one that is still going
+    path = os.path.join(session_dir(session), f'assembled.{uuid.uuid4().hex}')
+    digest = hashlib.sha256()
+    with open(path, 'wb') as output:
+        for index in range(session.total_parts):
+            with open(_part_path(session, index), 'rb') as part:
+                for block in iter(lambda: part.read(1024 * 1024), b''):
+                    digest.update(block)
+                    output.write(block)
+    return path, digest.hexdigest()
+
+
+def complete(session_id, user):
+    """
+    Request assembly of the upload ``session_id`` of ``user``; returns the
+    session, normally ``assembling`` (already ``complete`` without workers).
+    """
+    with transaction.atomic():
+        session = UploadSession.objects.select_for_update().get(pk=session_id, user=user)
+        if session.status in (UploadSession.Status.COMPLETE, UploadSession.Status.FAILED):
+            return session
+        if session.status == UploadSession.Status.ASSEMBLING and (
+            timezone.now() - session.assembly_started_at < timedelta(seconds=ASSEMBLY_TIMEOUT)
+        ):
+            return session
+        missing = sorted(set(range(session.total_parts)) - set(received_parts(session)))
+        if missing:
+            raise UploadError(f'Missing parts: {", ".join(map(str, missing[:20]))}.')
+        session.status = UploadSession.Status.ASSEMBLING
+        session.assembly_started_at = timezone.now()
+        session.save(update_fields=['status', 'assembly_started_at'])
+        transaction.on_commit(lambda: _start_assembly(session.pk))
+    session.refresh_from_db()
+    return session
+
+
+def _start_assembly(session_id):
+    # Without document workers, assemble in this request
+    if not documents.submit(assemble, session_id):
+        assemble(session_id)
+
+
+def _store(session):
+    """Assemble, verify and store the parts of ``session``; returns the stored name."""
+    path, sha256 = _assemble(session)
+    if session.sha256 and sha256 != session.sha256:
+        raise UploadError('Checksum mismatch for the assembled file.')
+    field = ProjectMaterial._meta.get_field(session.field)
+    with open(path, 'rb') as f:
+        return field.storage.save(
+            session.filename, AssembledFile(f, name=session.filename), max_length=field.max_length,
+        )
+
+
+def _finish(session_id, **changes):
+    """Apply ``changes`` to a session that is still assembling; returns it, or None."""
+    with transaction.atomic():
+        session = UploadSession.objects.select_for_update().filter(pk=session_id).first()
+        # Aborted, or finished by an overlapping run
+        if session is None or session.status != UploadSession.Status.ASSEMBLING:
+            return None
+        for name, value in changes.items():
+            setattr(session, name, value)
+        session.save(update_fields=list(changes))
+        transaction.on_commit(lambda: shutil.rmtree(session_dir(session), ignore_errors=True))
+        return session
+
+
+def assemble(session_id):
+    """
+    Store an upload marked assembling by ``complete`` and attach it to the
+    session's project, if any. Runs outside any transaction until the end.
+    """
+    session = UploadSession.objects.filter(pk=session_id, status=UploadSession.Status.ASSEMBLING).first()
+    if session is None:
+        return
+    try:
+        stored_name = _store(session)
+    except (UploadError, OSError) as e:
+        if not isinstance(e, UploadError):
+            logger.exception(f'Could not assemble upload {session_id}')
+        _finish(session_id, status=UploadSession.Status.FAILED, error=str(e)[:255])
+        return
+
+    with transaction.atomic():
+        session = _finish(session_id, status=UploadSession.Status.COMPLETE, stored_name=stored_name)
+        if session is not None and session.project_id:
+            project = ProjectMaterial.objects.get(pk=session.project_id)
+            setattr(project, session.field, stored_name)
+            project.save()
+
+
+def completed_upload(session_id, field, user):
+    """Stored name of ``user``'s completed, unexpired upload for ``field``, or None."""
+    return (
+        UploadSession.objects.filter(
+            pk=session_id, user=user, field=field, status=UploadSession.Status.COMPLETE,
+            expires_at__gt=timezone.now(),
+        )
+        .values_list('stored_name', flat=True)
+        .first()
+    )
+
+
+def abort(session):
+    shutil.rmtree(session_dir(session), ignore_errors=True)
+    session.delete()
+
+
+def purge_expired():
+    """Delete expired sessions and their parts, at most once per PURGE_INTERVAL; returns how many."""
+    if not cache.add(PURGE_LOCK_KEY, 1, timeout=PURGE_INTERVAL):
+        return 0
+    expired = list(UploadSession.objects.filter(expires_at__lte=timezone.now()))
+    for session in expired:
+        abort(session)
+    if expired:
+        logger.info(f'Purged {len(expired)} expired uploads')
+    return len(expired)
@@ -1,5 +1,5 @@
 # projects/urls.py (UPDATED - COMPLETE VERSION)
-from django.urls import path, include
+from django.urls import path, re_path, include
 from rest_framework.routers import DefaultRouter
 from . import views
 
@@ -15,17 +15,32 @@ urlpatterns = [
     # Payment endpoints
     path('payments/init/', views.PaymentInitView.as_view(), name='payments-init'),
     path('payments/verify/', views.PaymentVerifyView.as_view(), name='payments-verify'),
+    path('payments/webhook/', views.PaystackWebhookView.as_view(), name='payments-webhook'),
     
     # Download endpoints
     path('downloads/request/', views.DownloadRequestView.as_view(), name='downloads-request'),
     path('downloads/file/<str:token>/', views.DownloadFileView.as_view(), name='downloads-file'),
     
+    # Chunked, resumable uploads (admin)
+    path('uploads/', views.UploadSessionCreateView.as_view(), name='uploads'),
+    path('uploads/<uuid:pk>/', views.UploadSessionDetailView.as_view(), name='uploads-detail'),
+    path('uploads/<uuid:pk>/parts/<int:index>/', views.UploadPartView.as_view(), name='uploads-part'),
+    path('uploads/<uuid:pk>/complete/', views.UploadCompleteView.as_view(), name='uploads-complete'),
+    
+    # Document previews (content-addressed, immutable)
+    re_path(r'^previews/(?P<digest>[0-9a-f]{64})/(?P<name>[\w.-]+)$', views.PreviewAssetView.as_view(),
+            name='preview-asset'),
+    
     # User endpoints
     path('me/purchases/', views.StudentPurchaseListView.as_view(), name='me-purchases'),
     path('me/downloads/', views.StudentDownloadListView.as_view(), name='me-downloads'),
+    path('me/entitlements/', views.StudentEntitlementsView.as_view(), name='me-entitlements'),
     
     # Admin endpoints
     path('admin/stats/overview/', views.AdminStatsOverviewView.as_view(), name='admin-stats-overview'),
+    path('admin/stats/revenue/', views.AdminRevenueSeriesView.as_view(), name='admin-stats-revenue'),
+    path('admin/stats/downloads-by-department/', views.AdminDownloadsByDepartmentView.as_view(),
+         name='admin-stats-downloads-by-department'),
     
     # Topic Generator endpoints
     path('tools/topic-generator/', views.TopicGeneratorView.as_view(), name='topic-generator-api'),
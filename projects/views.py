@@ -1,25 +1,43 @@
 # projects/views.py (COMPLETE UPDATED VERSION)
+import io
+import json
 import uuid
 import random
 from datetime import timedelta
-from pathlib import Path
 from django.utils.text import slugify
 
-import requests
 from django.conf import settings
 from django.utils import timezone
 from django.db import models
-from django.db.models import Q, Sum, Count
-from django.http import FileResponse, Http404
+from django.db.models import Q, Count
+from django.http import Http404
+from django.urls import NoReverseMatch, reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date, quote_etag
 from rest_framework import permissions, status, generics, viewsets
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotAuthenticated, ValidationError
 import logging
 
 from accounts.permissions import IsAdminUserRole
 from django.contrib.auth import get_user_model
-from .models import ProjectMaterial, Purchase, Download, Department, Category
+from .models import ProjectMaterial, Purchase, Download, Department, Category, UploadSession
+from .search import search_projects
+from .pagination import CatalogPagination
+from .cache import cached_catalog
+from .pageviews import trending_projects
+from .delivery import serve_bundle, serve_file
+from .previews import asset_response
+from .zipstream import ZipTooLarge
+from .download_tokens import DownloadGrant, InvalidDownloadToken, ExpiredDownloadToken, record_download
+from .topic_store import get_topic_engine
+from .paystack import PaystackError, get_client, valid_signature
+from . import entitlements, uploads
+from .stats import downloads_by_department, get_summary, revenue_series
+from .settlement import apply_outcomes, record_outcome, transaction_outcome
 from .serializers import (
     DepartmentSerializer,
     CategorySerializer,
@@ -29,6 +47,9 @@ from .serializers import (
     PurchaseSerializer,
     DownloadRequestSerializer,
     DownloadSerializer,
+    TopicGeneratorSerializer,
+    UploadInitSerializer,
+    UploadSessionSerializer,
 )
 
 User = get_user_model()
@@ -47,10 +68,40 @@ class CategoryViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
 
+TRENDING_DAYS_DEFAULT = 7
+TRENDING_DAYS_MAX = 90
+TRENDING_LIMIT_DEFAULT = 12
+TRENDING_LIMIT_MAX = 50
+
+# Admin time series windows (days); DailyStats keeps them cheap at any length
+STATS_DAYS_DEFAULT = 30
+STATS_DAYS_MAX = 3660
+
+
 class ProjectMaterialViewSet(viewsets.ModelViewSet):
-    queryset = ProjectMaterial.objects.filter(status=ProjectMaterial.Status.APPROVED)
+    # ProjectMaterialSerializer reads department, category and created_by on every row
+    queryset = ProjectMaterial.objects.filter(
+        status=ProjectMaterial.Status.APPROVED
+    ).select_related('department', 'category', 'created_by')
     serializer_class = ProjectMaterialSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = CatalogPagination
+    ordering_fields = [
+        '-created_at', 'created_at', 'title', '-title', 'year', '-year',
+        'price', '-price', 'download_count', '-download_count',
+    ]
+    
+    def get_ordering(self):
+        """
+        Explicit ?ordering= if allowed, otherwise newest first. Searches
+        without an explicit ordering are ranked by relevance (returns None).
+        """
+        ordering = self.request.query_params.get('ordering')
+        if ordering in self.ordering_fields:
+            return ordering
+        if self.request.query_params.get('search'):
+            return None
+        return '-created_at'
     
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -75,23 +126,55 @@ class ProjectMaterialViewSet(viewsets.ModelViewSet):
         if project_type:
             queryset = queryset.filter(project_type=project_type)
         
-        # Search
+        # Search (full-text, ranked by relevance unless an explicit ordering is given)
         search = self.request.query_params.get('search')
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(abstract__icontains=search) |
-                Q(description__icontains=search) |
-                Q(keywords__icontains=search)
-            )
+            queryset = search_projects(queryset, search).order_by('-search_rank', '-created_at')
         
-        # Ordering
-        ordering = self.request.query_params.get('ordering', '-created_at')
-        if ordering in ['title', '-title', 'year', '-year', 'price', '-price', 'download_count', '-download_count']:
-            queryset = queryset.order_by(ordering)
+        # Ordering (id breaks ties so page boundaries are stable)
+        ordering = self.get_ordering()
+        if ordering:
+            queryset = queryset.order_by(ordering, '-id' if ordering.startswith('-') else 'id')
         
         return queryset
     
+    def list(self, request, *args, **kwargs):
+        # Links in paginated responses are absolute, so the host is part of the key
+        params = {'host': request.get_host(), 'query': sorted(request.query_params.lists())}
+        data = cached_catalog(
+            'api:project_list', params,
+            lambda: super(ProjectMaterialViewSet, self).list(request, *args, **kwargs).data,
+        )
+        return Response(data)
+    
+    def retrieve(self, request, *args, **kwargs):
+        data = cached_catalog(
+            'api:project_detail', {'pk': kwargs.get(self.lookup_field)},
+            lambda: super(ProjectMaterialViewSet, self).retrieve(request, *args, **kwargs).data,
+        )
+        return Response(data)
+    
+    @action(detail=False, methods=['get'])
+    def trending(self, request):
+        """Most viewed projects over the last ?days= (default 7)."""
+        try:
+            days = int(request.query_params.get('days', TRENDING_DAYS_DEFAULT))
+            limit = int(request.query_params.get('limit', TRENDING_LIMIT_DEFAULT))
+        except ValueError:
+            days = limit = 0
+        if not (1 <= days <= TRENDING_DAYS_MAX and 1 <= limit <= TRENDING_LIMIT_MAX):
+            return Response(
+                {'detail': f'days must be 1-{TRENDING_DAYS_MAX} and limit 1-{TRENDING_LIMIT_MAX}.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        def build():
+            projects = trending_projects(days).select_related('department', 'category', 'created_by')[:limit]
+            return self.get_serializer(projects, many=True).data
+        
+        data = cached_catalog('api:project_trending', {'host': request.get_host(), 'days': days, 'limit': limit}, build)
+        return Response(data)
+    
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
 
@@ -112,14 +195,8 @@ class PaymentInitView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        # Check if user already purchased this project
-        existing_purchase = Purchase.objects.filter(
-            user=user,
-            project=project,
-            status=Purchase.Status.PAID
-        ).first()
-        
-        if existing_purchase:
+        # Check if user already purchased this project (confirmed in the database if not cached)
+        if entitlements.purchase_id_for(user, project.pk) is not None:
             return Response(
                 {'detail': 'You have already purchased this project.'},
                 status=status.HTTP_400_BAD_REQUEST
@@ -155,55 +232,35 @@ class PaymentInitView(APIView):
             status=Purchase.Status.PENDING,
         )
 
-        headers = {
-            'Authorization': f'Bearer {settings.PAYSTACK_SECRET_KEY}',
-            'Content-Type': 'application/json',
-        }
         try:
             callback_url = request.build_absolute_uri(reverse('payment-confirm'))
-        except:
+        except NoReverseMatch:
             callback_url = request.build_absolute_uri("/payment/confirm/")
-            
-        data = {
-            'email': user.email,
-            'amount': amount_kobo,
-            'reference': reference,
-            'callback_url': callback_url,
-            'metadata': {
-                'purchase_id': purchase.id,
-                'project_id': project.id,
-                'user_id': user.id,
-            },
-        }
 
         try:
-            resp = requests.post(
-                f"{settings.PAYSTACK_BASE_URL}/transaction/initialize",
-                json=data,
-                headers=headers,
-                timeout=30,
-            )
-            resp_data = resp.json()
-        except Exception as e:
-            purchase.status = Purchase.Status.FAILED
-            purchase.save(update_fields=['status'])
-            return Response(
-                {'detail': f'Failed to initialize payment: {str(e)}'},
-                status=status.HTTP_502_BAD_GATEWAY,
+            paystack_data = get_client().initialize_transaction(
+                email=user.email,
+                amount=amount_kobo,
+                reference=reference,
+                callback_url=callback_url,
+                metadata={
+                    'purchase_id': purchase.id,
+                    'project_id': project.id,
+                    'user_id': user.id,
+                },
             )
-
-        if resp.status_code != 200 or not resp_data.get('status'):
+        except PaystackError as e:
             purchase.status = Purchase.Status.FAILED
             purchase.save(update_fields=['status'])
             return Response(
                 {
-                    'detail': 'Failed to initialize payment with Paystack.',
-                    'paystack_response': resp_data,
+                    'detail': f'Failed to initialize payment: {e}',
+                    'paystack_response': e.response,
                 },
                 status=status.HTTP_502_BAD_GATEWAY,
             )
 
-        auth_url = resp_data['data']['authorization_url']
+        auth_url = paystack_data['authorization_url']
         return Response(
             {
                 'authorization_url': auth_url,
@@ -230,49 +287,75 @@ class PaymentVerifyView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        headers = {
-            'Authorization': f'Bearer {settings.PAYSTACK_SECRET_KEY}',
-        }
         try:
-            resp = requests.get(
-                f"{settings.PAYSTACK_BASE_URL}/transaction/verify/{reference}",
-                headers=headers,
-                timeout=30,
-            )
-            resp_data = resp.json()
-        except Exception as e:
-            return Response(
-                {'detail': f'Failed to verify payment: {str(e)}'},
-                status=status.HTTP_502_BAD_GATEWAY,
-            )
-
-        if resp.status_code != 200 or not resp_data.get('status'):
+            data = get_client().verify_transaction(reference)
+        except PaystackError as e:
             return Response(
                 {
-                    'detail': 'Failed to verify payment with Paystack.',
-                    'paystack_response': resp_data,
+                    'detail': f'Failed to verify payment: {e}',
+                    'paystack_response': e.response,
                 },
                 status=status.HTTP_502_BAD_GATEWAY,
             )
 
-        data = resp_data['data']
-        if data.get('status') == 'success':
-            purchase.status = Purchase.Status.PAID
-            purchase.paid_at = timezone.now()
-            purchase.save(update_fields=['status', 'paid_at'])
-        else:
-            purchase.status = Purchase.Status.FAILED
-            purchase.save(update_fields=['status'])
+        apply_outcomes([transaction_outcome(data)])
+        purchase.refresh_from_db()
 
         return Response(PurchaseSerializer(purchase).data, status=status.HTTP_200_OK)
 
 
+class PaystackWebhookView(APIView):
+    """
+    Paystack event receiver. Acknowledges once the outcome is recorded:
+    queued in Redis, or applied to the purchase without Redis
+    (projects/settlement.py). Errors answer 500 so Paystack retries.
+    """
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+
+    def post(self, request, *args, **kwargs):
+        body = request.body
+        if not valid_signature(body, request.META.get('HTTP_X_PAYSTACK_SIGNATURE')):
+            return Response({'detail': 'Invalid signature.'}, status=status.HTTP_401_UNAUTHORIZED)
+        try:
+            event = json.loads(body)
+            data = event.get('data') or {}
+        except (ValueError, AttributeError):
+            return Response({'detail': 'Invalid payload.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if event.get('event') == 'charge.success' and data.get('reference'):
+            record_outcome(data)
+        return Response(status=status.HTTP_200_OK)
+
+
 class StudentPurchaseListView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = PurchaseSerializer
 
     def get_queryset(self):
-        return Purchase.objects.filter(user=self.request.user).select_related('project')
+        return Purchase.objects.filter(user=self.request.user).select_related('project', 'user')
+
+
+class StudentEntitlementsView(APIView):
+    """
+    Which projects the user owns: all of them, or those among
+    ``?project_ids=1,2,3`` (e.g. one listing page) in a single call.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        raw_ids = request.query_params.get('project_ids')
+        project_ids = None
+        if raw_ids:
+            try:
+                project_ids = [int(pk) for pk in raw_ids.split(',') if pk.strip()]
+            except ValueError:
+                return Response(
+                    {'detail': 'project_ids must be a comma-separated list of integers.'},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        owned = entitlements.owned_project_ids(request.user, project_ids)
+        return Response({'owned_project_ids': sorted(owned)}, status=status.HTTP_200_OK)
 
 
 class StudentDownloadListView(generics.ListAPIView):
@@ -287,28 +370,89 @@ class AdminStatsOverviewView(APIView):
     permission_classes = [permissions.IsAuthenticated, IsAdminUserRole]
 
     def get(self, request, *args, **kwargs):
-        total_projects = ProjectMaterial.objects.count()
-        pending_approvals = ProjectMaterial.objects.filter(status=ProjectMaterial.Status.PENDING).count()
-        total_revenue = (
-            Purchase.objects.filter(status=Purchase.Status.PAID)
-            .aggregate(total=Sum('amount'))['total'] or 0
-        )
-        today = timezone.now().date()
-        downloads_today = Download.objects.filter(downloaded_at__date=today).count()
-        total_users = User.objects.count()
+        # Precomputed by the stats rollup (projects/stats.py)
+        summary = get_summary()
 
         return Response(
             {
-                'total_projects': total_projects,
-                'pending_approvals': pending_approvals,
-                'total_revenue': float(total_revenue),
-                'downloads_today': downloads_today,
-                'total_users': total_users,
+                'total_projects': summary.total_projects,
+                'pending_approvals': summary.pending_projects,
+                'total_revenue': float(summary.total_revenue),
+                'downloads_today': summary.downloads_today,
+                'total_users': summary.total_users,
+                'updated_at': summary.updated_at,
             },
             status=status.HTTP_200_OK,
         )
 
 
+def _stats_window(request, default_days=STATS_DAYS_DEFAULT):
+    """``(start, end)`` dates for ``?days=`` ending today, or None if invalid."""
+    try:
+        days = int(request.query_params.get('days', default_days))
+    except ValueError:
+        return None
+    if not 1 <= days <= STATS_DAYS_MAX:
+        return None
+    end = timezone.localdate()
+    return end - timedelta(days=days - 1), end
+
+
+class AdminRevenueSeriesView(APIView):
+    """Purchases and revenue per day (or ``?interval=month``) over the last ``?days=``."""
+    permission_classes = [permissions.IsAuthenticated, IsAdminUserRole]
+
+    def get(self, request, *args, **kwargs):
+        interval = request.query_params.get('interval', 'day')
+        window = _stats_window(request)
+        if window is None or interval not in ('day', 'month'):
+            return Response(
+                {'detail': f"days must be 1-{STATS_DAYS_MAX} and interval 'day' or 'month'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        start, end = window
+
+        series = [
+            {
+                'period': row['period'],
+                'purchases': row['purchases'],
+                'revenue': float(row['revenue']),
+            }
+            for row in revenue_series(start, end, interval)
+        ]
+        return Response(
+            {'start': start, 'end': end, 'interval': interval, 'series': series},
+            status=status.HTTP_200_OK,
+        )
+
+
+class AdminDownloadsByDepartmentView(APIView):
+    """Downloads per department over the last ``?days=``."""
+    permission_classes = [permissions.IsAuthenticated, IsAdminUserRole]
+
+    def get(self, request, *args, **kwargs):
+        window = _stats_window(request)
+        if window is None:
+            return Response(
+                {'detail': f'days must be 1-{STATS_DAYS_MAX}.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        start, end = window
+
+        departments = [
+            {
+                'department_id': row['department_id'],
+                'department': row['department__name'] or 'Deleted department',
+                'downloads': row['downloads'],
+            }
+            for row in downloads_by_department(start, end)
+        ]
+        return Response(
+            {'start': start, 'end': end, 'departments': departments},
+            status=status.HTTP_200_OK,
+        )
+
+
 class DownloadRequestView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
@@ -316,7 +460,7 @@ class DownloadRequestView(APIView):
         serializer = DownloadRequestSerializer(data=request.data, context={'request': request})
         serializer.is_valid(raise_exception=True)
         project = serializer.validated_data['project']
-        purchase = serializer.validated_data.get('purchase')
+        purchase_id = serializer.validated_data['purchase_id']
         user = serializer.validated_data['user']
         download_type = serializer.validated_data['download_type']
 
@@ -327,24 +471,14 @@ class DownloadRequestView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Create a download record with short-lived token
-        token = str(uuid.uuid4())
-        expires_at = timezone.now() + timedelta(minutes=30)
-
-        download = Download.objects.create(
-            user=user,
-            project=project,
-            purchase=purchase,
-            token=token,
-            expires_at=expires_at,
-            ip_address=request.META.get('REMOTE_ADDR'),
-            user_agent=request.META.get('HTTP_USER_AGENT', ''),
-            download_type=download_type,
-        )
+        # Signed, short-lived link; the audit record is written in the background
+        grant = DownloadGrant.issue(user, project, purchase_id, download_type)
+        token = grant.sign()
+        record_download(grant, request)
+        expires_at = grant.expires_at
 
-        # Increment project download count
-        project.download_count = (project.download_count or 0) + 1
-        project.save(update_fields=['download_count'])
+        # Increment project download count (buffered, no row lock)
+        project.increment_download_count()
 
         download_url = request.build_absolute_uri(f"/api/downloads/file/{token}/")
 
@@ -359,162 +493,188 @@ class DownloadRequestView(APIView):
 
 
 class DownloadFileView(APIView):
-    permission_classes = [permissions.IsAuthenticated]
+    """
+    Serve the files of a signed download link. The link itself authorizes
+    the download, so no database lookup is needed.
+    """
+    permission_classes = [permissions.AllowAny]
+
+    def perform_authentication(self, request):
+        # Authenticate lazily: only needed when links require login
+        pass
 
     def get(self, request, token, *args, **kwargs):
         try:
-            download = Download.objects.select_related('project').get(token=token)
-        except Download.DoesNotExist:
+            grant = DownloadGrant.from_token(token)
+        except ExpiredDownloadToken:
+            return Response({'detail': 'Download link has expired.'}, status=status.HTTP_410_GONE)
+        except InvalidDownloadToken:
             return Response({'detail': 'Invalid or expired download link.'}, status=status.HTTP_404_NOT_FOUND)
 
-        if download.user != request.user:
-            return Response({'detail': 'Not allowed.'}, status=status.HTTP_403_FORBIDDEN)
+        if settings.DOWNLOAD_LINKS_REQUIRE_LOGIN:
+            if not request.user.is_authenticated:
+                raise NotAuthenticated()
+            if request.user.pk != grant.user_id:
+                return Response({'detail': 'Not allowed.'}, status=status.HTTP_403_FORBIDDEN)
 
-        if not download.expires_at or download.expires_at < timezone.now():
-            return Response({'detail': 'Download link has expired.'}, status=status.HTTP_410_GONE)
-
-        project = download.project
+        files = grant.files()
+        
+        # 'both' bundles the document, software and preview into one ZIP
+        if grant.download_type == 'both':
+            try:
+                return serve_bundle(
+                    request, list(files.values()), f"{grant.slug}.zip",
+                    names=[grant.download_name(field, file) for field, file in files.items()],
+                )
+            except FileNotFoundError:
+                raise Http404("File not found on server")
+            except ZipTooLarge:
+                return Response(
+                    {'detail': 'Files are too large to bundle; download them separately.'},
+                    status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+                )
         
         # Get the appropriate file based on download type
-        if download.download_type == 'document':
-            file_field = project.document_file
-        elif download.download_type == 'software':
-            file_field = project.software_file
-        else:
-            # For 'both', return document first
-            file_field = project.document_file
+        field = 'software_file' if grant.download_type == 'software' else 'document_file'
+        file_field = files.get(field)
 
         if not file_field:
             raise Http404("File not found")
 
+        # Range requests, conditional GETs and proxy offload are handled here
         try:
-            file_path = file_field.path
-            if not Path(file_path).exists():
-                raise Http404("File not found on server")
-        except ValueError:
-            # If file is stored in S3 or similar, use url
-            file_path = file_field.name
+            return serve_file(request, file_field, grant.download_name(field, file_field))
+        except FileNotFoundError:
+            raise Http404("File not found on server")
 
-        response = FileResponse(open(file_field.path, 'rb'), as_attachment=True)
-        response['Content-Disposition'] = f'attachment; filename="{Path(file_field.name).name}"'
-        
-        return response
+
+class PreviewAssetView(APIView):
+    """
+    Serve a document preview derivative (projects/previews.py). Paths are
+    content-addressed, so responses are public and cached as immutable.
+    """
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, digest, name, *args, **kwargs):
+        return asset_response(request, digest, name)
+
+
+# =============== CHUNKED UPLOAD VIEWS ===============
+class UploadSessionCreateView(APIView):
+    """Start a chunked, resumable upload of a project file (projects/uploads.py)."""
+    permission_classes = [IsAdminUserRole]
+
+    def post(self, request, *args, **kwargs):
+        serializer = UploadInitSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        try:
+            session = uploads.open_session(
+                request.user, data['field'], data['filename'], data['size'],
+                project=data['project_id'], sha256=data['sha256'],
+            )
+        except uploads.UploadError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(UploadSessionSerializer(session).data, status=status.HTTP_201_CREATED)
+
+
+def _upload_session(request, pk):
+    try:
+        return UploadSession.objects.get(pk=pk, user=request.user)
+    except UploadSession.DoesNotExist:
+        raise Http404("Upload not found")
+
+
+class UploadSessionDetailView(APIView):
+    """Received parts of an upload (to resume it), or DELETE to abort it."""
+    permission_classes = [IsAdminUserRole]
+
+    def get(self, request, pk, *args, **kwargs):
+        return Response(UploadSessionSerializer(_upload_session(request, pk)).data)
+
+    def delete(self, request, pk, *args, **kwargs):
+        uploads.abort(_upload_session(request, pk))
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class UploadPartView(APIView):
+    """
+    Store one part, sent as the raw request body with its SHA-256 in the
+    ``X-Chunk-SHA256`` header. The body is streamed to disk, not parsed.
+    """
+    permission_classes = [IsAdminUserRole]
+
+    def put(self, request, pk, index, *args, **kwargs):
+        session = _upload_session(request, pk)
+        try:
+            uploads.write_part(
+                session, index, request.stream or io.BytesIO(), request.META.get('HTTP_X_CHUNK_SHA256', ''),
+            )
+        except uploads.UploadError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'index': index, 'size': session.part_size(index)}, status=status.HTTP_200_OK)
+
+
+class UploadCompleteView(APIView):
+    """
+    Have the parts assembled and stored (attached to the session's project)
+    in the background; answers 202 while assembling, poll the session.
+    """
+    permission_classes = [IsAdminUserRole]
+
+    def post(self, request, pk, *args, **kwargs):
+        try:
+            session = uploads.complete(pk, request.user)
+        except UploadSession.DoesNotExist:
+            raise Http404("Upload not found")
+        except uploads.UploadError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if session.status == UploadSession.Status.FAILED:
+            return Response({'detail': session.error}, status=status.HTTP_400_BAD_REQUEST)
+        code = status.HTTP_200_OK if session.status == UploadSession.Status.COMPLETE else status.HTTP_202_ACCEPTED
+        return Response(UploadSessionSerializer(session).data, status=code)
 
 
 # =============== TOPIC GENERATOR VIEW ===============
 class TopicGeneratorView(APIView):
     """
-    Generate 2 random project topic suggestions based on department.
-    Returns exactly 2 random topics from the department's topic list.
+    Generate project topic suggestions based on department.
+
+    Accepts ``department`` (or ``departments`` for a batch), optional
+    comma-separated ``keywords`` (topics are ranked by relevance), ``count``
+    (default 2, at most 10) and ``seed`` for reproducible suggestions.
     """
     permission_classes = [permissions.AllowAny]
     
     def post(self, request):
         try:
-            # Import topic data from topic_data.py
-            from .topic_data import DEPARTMENT_TOPICS, DEFAULT_TOPICS
+            serializer = TopicGeneratorSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            data = serializer.validated_data
             
-            department = request.data.get('department', '').strip()
-            keywords = request.data.get('keywords', '').strip()
+            department = data['department'].strip()
+            departments = [name.strip() for name in data.get('departments', []) if name.strip()]
+            keywords = data['keywords'].strip()
             
-            if not department:
+            if not department and not departments:
                 return Response(
                     {'detail': 'Department is required to generate topics.'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Log the request
-            log_message = f"Topic generation requested for department: '{department}'"
-            if keywords:
-                log_message += f" with keywords: '{keywords}'"
-            logger.info(log_message)
-            
-            # Normalize department name for matching (case-insensitive, partial match)
-            department_lower = department.lower()
-            
-            # Try to find the department in our topics
-            department_key = None
-            best_match_score = 0
-            
-            for dept_key in DEPARTMENT_TOPICS.keys():
-                dept_key_lower = dept_key.lower()
-                
-                # Calculate match score
-                score = 0
-                if department_lower == dept_key_lower:
-                    score = 100  # Exact match
-                elif department_lower in dept_key_lower:
-                    score = 80   # Department name is part of key
-                elif dept_key_lower in department_lower:
-                    score = 70   # Key is part of department name
-                
-                if score > best_match_score:
-                    best_match_score = score
-                    department_key = dept_key
+            # Batch request: one result per department
+            if departments:
+                results = [self._generate(name, keywords, data['count'], data['seed']) for name in departments]
+                return Response({
+                    'results': results,
+                    'count': len(results),
+                })
             
-            # Get topics for the department or use default
-            if department_key and best_match_score >= 50:  # Minimum confidence score
-                topics = DEPARTMENT_TOPICS[department_key]
-                logger.info(f"Found department match: '{department_key}' with {len(topics)} topics")
-            else:
-                # If department not found, use fallback topics
-                topics = self._generate_fallback_topics(department, DEFAULT_TOPICS)
-                logger.info(f"No exact department match found for '{department}'. Using fallback topics.")
+            return Response(self._generate(department, keywords, data['count'], data['seed']))
             
-            # Filter by keywords if provided
-            original_topic_count = len(topics)
-            if keywords and topics:
-                keyword_list = [k.strip().lower() for k in keywords.split(',') if k.strip()]
-                if keyword_list:
-                    filtered_topics = []
-                    for topic in topics:
-                        topic_lower = topic.lower()
-                        # Check if any keyword is in the topic
-                        if any(keyword in topic_lower for keyword in keyword_list):
-                            filtered_topics.append(topic)
-                    
-                    # If we found keyword matches, use them
-                    if filtered_topics:
-                        topics = filtered_topics
-                        logger.info(f"Filtered topics by keywords. From {original_topic_count} to {len(topics)} topics.")
-            
-            # Ensure we have at least some topics
-            if not topics:
-                topics = DEFAULT_TOPICS
-                logger.info(f"No topics found. Using default topics: {len(topics)} topics.")
-            
-            # Random sample of exactly 2 topics
-            if len(topics) >= 2:
-                # Use random.sample to get 2 unique topics
-                selected_topics = random.sample(topics, 2)
-            elif len(topics) == 1:
-                # If only one topic available, return it
-                selected_topics = topics
-            else:
-                # No topics available
-                selected_topics = [
-                    f"Design and Implementation of a {department} Management System",
-                    f"Impact of Digital Technology on {department} in Modern Society"
-                ]
-                logger.warning(f"No topics available for department '{department}'. Generated generic topics.")
-            
-            # Log successful generation
-            logger.info(f"Generated {len(selected_topics)} topics for department: '{department}'")
-            
-            return Response({
-                'topics': selected_topics,
-                'department': department,
-                'keywords': keywords,
-                'count': len(selected_topics),
-                'matched_department': department_key if department_key else None
-            })
-            
-        except ImportError as e:
-            logger.error(f"Failed to import topic_data: {str(e)}")
-            return Response(
-                {'detail': 'Topic database is not available. Please contact support.'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Error in topic generator: {str(e)}", exc_info=True)
             return Response(
@@ -522,33 +682,33 @@ class TopicGeneratorView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
-    def _generate_fallback_topics(self, department, default_topics):
-        """Generate fallback topics if department not found in topic_data"""
-        fallback_topics = [
-            f"Design and Implementation of a {department} Management System",
-            f"Impact of Technology on {department} in Nigeria",
-            f"Challenges and Solutions in {department}: A Case Study of Nasarawa State University",
-            f"Modern Approaches to {department} in the 21st Century",
-            f"Comparative Analysis of Traditional and Modern {department} Methods",
-            f"Development of a Mobile Application for {department} Students",
-            f"Assessment of {department} Curriculum in Nigerian Universities",
-            f"Role of {department} in Sustainable Development",
-            f"Digital Transformation in {department}: Opportunities and Challenges",
-            f"Effect of Globalization on {department} Practices"
-        ]
+    def _generate(self, department, keywords, count, seed):
+        # Log the request
+        log_message = f"Topic generation requested for department: '{department}'"
+        if keywords:
+            log_message += f" with keywords: '{keywords}'"
+        logger.info(log_message)
+        
+        # Same seed + department always gives the same suggestions
+        rng = random.Random(f"{seed}:{department.lower()}") if seed else None
         
-        # Combine with default topics
-        all_topics = fallback_topics + default_topics
+        # Department matching and keyword ranking use the shared topic snapshot
+        department_key, selected_topics = get_topic_engine().suggest(department, keywords, count=count, rng=rng)
+        if department_key:
+            logger.info(f"Found department match: '{department_key}'")
+        else:
+            logger.info(f"No exact department match found for '{department}'. Using fallback topics.")
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_topics = []
-        for topic in all_topics:
-            if topic not in seen:
-                seen.add(topic)
-                unique_topics.append(topic)
+        # Log successful generation
+        logger.info(f"Generated {len(selected_topics)} topics for department: '{department}'")
         
-        return unique_topics
+        return {
+            'topics': selected_topics,
+            'department': department,
+            'keywords': keywords,
+            'count': len(selected_topics),
+            'matched_department': department_key if department_key else None
+        }
 
 
 # =============== PROJECT TOOLS VIEWS ===============
@@ -568,30 +728,14 @@ class DepartmentListView(APIView):
     
     def get(self, request):
         try:
-            from .topic_data import DEPARTMENT_TOPICS
-            
-            # Get all department names from topic_data
-            departments = list(DEPARTMENT_TOPICS.keys())
-            
-            # Sort alphabetically
-            departments.sort()
+            # Department names from the topic snapshot (sorted when it was loaded)
+            departments = get_topic_engine().departments
             
             return Response({
                 'departments': departments,
                 'count': len(departments)
             })
             
-        except ImportError:
-            # Fallback to database departments
-            db_departments = Department.objects.filter(is_active=True).values_list('name', flat=True)
-            departments = list(db_departments)
-            departments.sort()
-            
-            return Response({
-                'departments': departments,
-                'count': len(departments),
-                'source': 'database'
-            })
         except Exception as e:
             logger.error(f"Error getting department list: {str(e)}")
             return Response(
@@ -669,46 +813,62 @@ class GetSavedTopicsView(APIView):
 
 
 # =============== TOPIC STATISTICS VIEW ===============
+TOP_DEPARTMENTS_DEFAULT = 5
+TOP_DEPARTMENTS_MAX = 50
+
+
 class TopicStatisticsView(APIView):
     """
-    Get statistics about topic generator usage.
+    Get statistics about the topic generator corpus.
+    
+    The summary is computed when the topic snapshot is built; responses carry
+    ETag/Last-Modified so clients can revalidate with If-None-Match or
+    If-Modified-Since and get a 304 back.
     """
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     
     def get(self, request):
         try:
-            from .topic_data import DEPARTMENT_TOPICS
-            
-            total_departments = len(DEPARTMENT_TOPICS)
-            
-            # Count total topics across all departments
-            total_topics = 0
-            topics_per_department = {}
+            top = int(request.query_params.get('top', TOP_DEPARTMENTS_DEFAULT))
+        except ValueError:
+            top = 0
+        if not 1 <= top <= TOP_DEPARTMENTS_MAX:
+            return Response(
+                {'detail': f'top must be between 1 and {TOP_DEPARTMENTS_MAX}.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            stats = get_topic_engine().snapshot.statistics
             
-            for dept, topics in DEPARTMENT_TOPICS.items():
-                topic_count = len(topics)
-                total_topics += topic_count
-                topics_per_department[dept] = topic_count
+            etag = quote_etag(f"{stats['digest']}-{top}")
+            last_updated = parse_datetime(stats['last_updated']) if stats['last_updated'] else None
+            last_modified = int(last_updated.timestamp()) if last_updated else None
             
-            # Get top departments by topic count
-            sorted_departments = sorted(
-                topics_per_department.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:5]  # Top 5 departments
+            # 304 when the client's copy is current
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = Response({
+                    'total_departments': stats['total_departments'],
+                    'total_topics': stats['total_topics'],
+                    'generic_topics': stats['generic_topics'],
+                    'average_topics_per_department': stats['average_topics_per_department'],
+                    'top_departments': [
+                        {'department': dept['department'], 'topic_count': dept['topic_count']}
+                        for dept in stats['departments'][:top]
+                    ],
+                    'faculties': stats['faculties'],
+                    'histograms': stats['histograms'],
+                    'last_updated': stats['last_updated'],
+                })
             
-            return Response({
-                'total_departments': total_departments,
-                'total_topics': total_topics,
-                'average_topics_per_department': total_topics // total_departments if total_departments > 0 else 0,
-                'top_departments': [
-                    {'department': dept, 'topic_count': count}
-                    for dept, count in sorted_departments
-                ],
-                'last_updated': '2024'  # You can make this dynamic
-            })
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+            patch_cache_control(response, public=True, no_cache=True)
+            return response
             
-        except ImportError:
+        except OSError:
             return Response(
                 {'detail': 'Topic statistics not available.'},
                 status=status.HTTP_503_SERVICE_UNAVAILABLE